@@ -0,0 +1,50 @@
+"""
+Times building linked lists of increasing size.
+append: one append call per value; bulk: a single append_values call;
+baseline: a list comprehension creating the same Node objects, the floor for any Python-level build.
+Building a list should scale linearly, so the time per node should stay roughly flat as n grows.
+
+Usage: python -m benchmarks.bench_build [size ...]
+"""
+import sys
+import time
+from classes.linked_list import LinkedList
+from classes.node import Node
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+
+def time_appends(ll_type: str, values: list) -> float:
+    start = time.perf_counter()
+    ll = LinkedList.create(ll_type)
+    for value in values:
+        ll.append(value)
+    return time.perf_counter() - start
+
+
+def time_bulk(ll_type: str, values: list) -> float:
+    start = time.perf_counter()
+    LinkedList.build_from_values(ll_type, values)
+    return time.perf_counter() - start
+
+
+def time_baseline(values: list) -> float:
+    start = time.perf_counter()
+    [Node(value) for value in values]
+    return time.perf_counter() - start
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    print(f"{'list':<8}{'n':>10}{'append ns/node':>16}{'bulk ns/node':>14}{'baseline ns/node':>18}")
+    for ll_type in ["singly", "doubly"]:
+        for size in sizes:
+            values = list(range(1, size + 1))
+            appends = time_appends(ll_type, values)
+            bulk = time_bulk(ll_type, values)
+            baseline = time_baseline(values)
+            print(f"{ll_type:<8}{size:>10}{appends / size * 1e9:>16.1f}{bulk / size * 1e9:>14.1f}{baseline / size * 1e9:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Compares reading an ops file in the text format with reading the same operations from a binary ops log.
+parse: iterate the operations without applying them; replay: build the final list with LinkedList.build_from_ops.
+
+Usage: python -m benchmarks.bench_ops_formats [operations]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from binary_ops import write_binary_ops, iter_binary_ops
+from classes.linked_list import LinkedList
+from main import iter_operations
+
+DEFAULT_OPERATIONS = 1_000_000
+
+
+def write_text_ops(path: str, count: int):
+    rng = random.Random(count)
+    with open(path, "w", encoding="utf-8") as handle:
+        for step in range(count):
+            roll = rng.random()
+            if roll < 0.7:
+                handle.write(f"append {step + 1}\n")
+            elif roll < 0.8:
+                handle.write(f"prepend {step + 1}\n")
+            elif roll < 0.9:
+                handle.write(f"remove {rng.randint(0, 20)}\n")
+            else:
+                handle.write(f"replace {rng.randint(0, 20)} {step + 1}\n")
+
+
+def timed(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_OPERATIONS
+    with tempfile.TemporaryDirectory() as directory:
+        text_path = os.path.join(directory, "ops.txt")
+        binary_path = os.path.join(directory, "ops.llops")
+        write_text_ops(text_path, count)
+        write_binary_ops(iter_operations(text_path), binary_path)
+
+        print(f"{count:,} operations")
+        print(f"{'format':<8}{'bytes':>14}{'parse s':>10}{'replay s':>10}")
+        for name, path, reader in [
+            ("text", text_path, lambda: iter_operations(text_path)),
+            ("binary", binary_path, lambda: iter_binary_ops(binary_path, labels=False)),
+        ]:
+            parse = timed(lambda: sum(1 for _ in reader()))
+            replay = timed(lambda: LinkedList.build_from_ops("singly", reader()))
+            print(f"{name:<8}{os.path.getsize(path):>14,}{parse:>10.3f}{replay:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Compares positional operations with and without the position index.
+Runs a mixed workload of get_node, insert, replace and remove at random positions.
+
+Usage: python -m benchmarks.bench_position_index [size ...]
+"""
+import random
+import sys
+import time
+from classes.linked_list import LinkedList
+
+DEFAULT_SIZES = [100_000, 300_000, 1_000_000]
+OPERATIONS = 300
+
+
+def run_workload(ll_type: str, size: int, indexed: bool) -> float:
+    ll = LinkedList.build_from_values(ll_type, list(range(1, size + 1)))
+    if indexed:
+        ll.enable_position_index()
+    rng = random.Random(size)
+
+    start = time.perf_counter()
+    for step in range(OPERATIONS):
+        index = rng.randrange(1, ll.size - 1)
+        match step % 4:
+            case 0:
+                ll.get_node(index)
+            case 1:
+                ll.insert(index, step + 1)
+            case 2:
+                ll.replace(index, step + 1)
+            case 3:
+                ll.remove(index)
+    return (time.perf_counter() - start) / OPERATIONS
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    print(f"{'list':<8}{'n':>10}{'walk µs/op':>14}{'index µs/op':>14}{'speedup':>10}")
+    for ll_type in ["singly", "doubly"]:
+        for size in sizes:
+            walk = run_workload(ll_type, size, indexed=False)
+            indexed = run_workload(ll_type, size, indexed=True)
+            print(f"{ll_type:<8}{size:>10}{walk * 1e6:>14.1f}{indexed * 1e6:>14.1f}{walk / indexed:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
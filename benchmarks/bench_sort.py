@@ -0,0 +1,55 @@
+"""
+Benchmarks the sort methods of the node-backed singly linked list.
+Methods: 1 recursive top-down merge sort, 2 insertion sort, 3 bottom-up natural merge sort.
+Inputs: random values, already sorted, reverse sorted, and sorted with 1% of values swapped at random.
+Insertion sort is quadratic, so it only runs up to INSERTION_LIMIT nodes.
+
+Usage: python -m benchmarks.bench_sort [size ...]
+"""
+import random
+import sys
+import time
+from classes.linked_list import LinkedList
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+METHODS = {1: "merge", 2: "insertion", 3: "natural"}
+INSERTION_LIMIT = 20_000
+
+
+def make_inputs(size: int) -> dict[str, list[int]]:
+    rng = random.Random(size)
+    ascending = list(range(1, size + 1))
+    nearly = list(ascending)
+    for _ in range(size // 100):
+        first, second = rng.randrange(size), rng.randrange(size)
+        nearly[first], nearly[second] = nearly[second], nearly[first]
+    return {
+        "random": [rng.randint(1, size) for _ in range(size)],
+        "sorted": ascending,
+        "reversed": ascending[::-1],
+        "nearly": nearly,
+    }
+
+
+def time_sort(values: list[int], method: int) -> float:
+    ll = LinkedList.build_from_values("singly", values)
+    start = time.perf_counter()
+    ll.sort(method)
+    return time.perf_counter() - start
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    inputs = ["random", "sorted", "reversed", "nearly"]
+    print(f"{'n':>10}{'method':>11}" + "".join(f"{name + ' s':>12}" for name in inputs))
+    for size in sizes:
+        values = make_inputs(size)
+        for method, name in METHODS.items():
+            if method == 2 and size > INSERTION_LIMIT:
+                continue
+            times = [time_sort(values[kind], method) for kind in inputs]
+            print(f"{size:>10}{name:>11}" + "".join(f"{seconds:>12.3f}" for seconds in times))
+
+
+if __name__ == "__main__":
+    main()
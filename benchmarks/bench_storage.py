@@ -0,0 +1,60 @@
+"""
+Compares the Node storage engine with the array-backed engine.
+Reports memory held by a built list (tracemalloc) and throughput for append, positional reads and sort.
+
+Usage: python -m benchmarks.bench_storage [size]
+"""
+import sys
+import time
+import tracemalloc
+from classes.linked_list import LinkedList
+
+DEFAULT_SIZE = 200_000
+
+
+def build(ll_type: str, storage: str, size: int):
+    ll = LinkedList.create(ll_type, storage)
+    for value in range(1, size + 1):
+        ll.append(value)
+    return ll
+
+
+def measure(ll_type: str, storage: str, size: int) -> dict:
+    tracemalloc.start()
+    start = time.perf_counter()
+    ll = build(ll_type, storage, size)
+    append_seconds = time.perf_counter() - start
+    memory_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for index in range(0, size, max(1, size // 50)):
+        ll.get_node(index)
+    get_node_seconds = time.perf_counter() - start
+
+    ll.reverse()
+    start = time.perf_counter()
+    ll.sort()
+    sort_seconds = time.perf_counter() - start
+
+    return {
+        "append_per_sec": size / append_seconds,
+        "bytes_per_node": memory_bytes / size,
+        "get_node_seconds": get_node_seconds,
+        "sort_seconds": sort_seconds,
+    }
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE
+    print(f"n = {size}")
+    print(f"{'list':<16}{'appends/s':>14}{'bytes/node':>12}{'get_node s':>12}{'sort s':>10}")
+    for ll_type in ["singly", "doubly"]:
+        for storage in ["node", "array"]:
+            result = measure(ll_type, storage, size)
+            print(f"{ll_type + '/' + storage:<16}{result['append_per_sec']:>14,.0f}{result['bytes_per_node']:>12.1f}"
+                  f"{result['get_node_seconds']:>12.4f}{result['sort_seconds']:>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
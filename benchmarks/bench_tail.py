@@ -0,0 +1,45 @@
+"""
+Microbenchmarks for removing at the tail of a singly linked list.
+churn: alternating append and trim, as a queue-like ops file does.
+remove-last: alternating append and remove(size - 1).
+drain: trimming every node from a full list.
+
+Usage: python -m benchmarks.bench_tail [size ...]
+"""
+import sys
+import time
+from classes.linked_list import LinkedList
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+ROUNDS = 10_000
+
+
+def churn(size: int, remove_last: bool) -> float:
+    ll = LinkedList.build_from_values("singly", list(range(1, size + 1)))
+    start = time.perf_counter()
+    for value in range(1, ROUNDS + 1):
+        ll.append(value)
+        if remove_last:
+            ll.remove(ll.size - 1)
+        else:
+            ll.trim()
+    return (time.perf_counter() - start) / ROUNDS
+
+
+def drain(size: int) -> float:
+    ll = LinkedList.build_from_values("singly", list(range(1, size + 1)))
+    start = time.perf_counter()
+    while ll.size:
+        ll.trim()
+    return (time.perf_counter() - start) / size
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    print(f"{'n':>10}{'churn µs/op':>14}{'remove-last µs/op':>20}{'drain µs/op':>14}")
+    for size in sizes:
+        print(f"{size:>10}{churn(size, False) * 1e6:>14.2f}{churn(size, True) * 1e6:>20.2f}{drain(size) * 1e6:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+"""
+Scaling benchmark for every list operation.
+Times each operation at several list sizes, fits the exponent k of t ≈ c·n^k on a log-log scale,
+writes a JSON report and compares it with a stored baseline.
+An operation whose exponent rises by more than EXPONENT_TOLERANCE, or that runs more than --threshold times slower
+than the baseline at the same sizes, is reported as a regression and the exit status is 1.
+Absolute times depend on the machine; the exponents do not, so they are the check to trust across machines.
+
+Usage: python -m benchmarks.suite [--sizes N ...] [--ops NAME ...] [--type singly|doubly] [--storage node|array]
+                                  [--output report.json] [--baseline benchmarks/baseline.json] [--save-baseline]
+"""
+import argparse
+import json
+import math
+import multiprocessing
+import platform
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Optional
+from classes.linked_list import LinkedList
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+REPEATS = 3                 # runs per operation and size; the fastest is kept
+CONSTANT_CALLS = 1_000      # calls timed together for operations expected to be O(1)
+LINEAR_CALLS = 5            # calls timed together for operations expected to be O(n)
+EXPONENT_TOLERANCE = 0.3
+DEFAULT_THRESHOLD = 2.0
+
+
+def per_call(run: Callable[[], None], calls: int) -> float:
+    start = time.perf_counter()
+    run()
+    return (time.perf_counter() - start) / calls
+
+
+def bench_append(ll, size: int) -> float:
+    return per_call(lambda: [ll.append(value) for value in range(1, CONSTANT_CALLS + 1)], CONSTANT_CALLS)
+
+
+def bench_prepend(ll, size: int) -> float:
+    return per_call(lambda: [ll.prepend(value) for value in range(1, CONSTANT_CALLS + 1)], CONSTANT_CALLS)
+
+
+def bench_insert(ll, size: int) -> float:
+    return per_call(lambda: [ll.insert(size // 2, value) for value in range(1, LINEAR_CALLS + 1)], LINEAR_CALLS)
+
+
+def bench_remove(ll, size: int) -> float:
+    return per_call(lambda: [ll.remove(size // 2) for _ in range(LINEAR_CALLS)], LINEAR_CALLS)
+
+
+def bench_replace(ll, size: int) -> float:
+    return per_call(lambda: [ll.replace(size // 2, value) for value in range(1, LINEAR_CALLS + 1)], LINEAR_CALLS)
+
+
+def bench_trim(ll, size: int) -> float:
+    return per_call(lambda: [ll.trim() for _ in range(CONSTANT_CALLS)], CONSTANT_CALLS)
+
+
+def bench_contains(ll, size: int) -> float:
+    # a value that is not in the list, so every call walks all of it
+    return per_call(lambda: [ll.contains(-1) for _ in range(LINEAR_CALLS)], LINEAR_CALLS)
+
+
+def bench_reverse(ll, size: int) -> float:
+    return per_call(ll.reverse, 1)
+
+
+def bench_sort(method: int) -> Callable:
+    def run(ll, size: int) -> float:
+        return per_call(lambda: ll.sort(method), 1)
+    return run
+
+
+def bench_cycle(method: int) -> Callable:
+    def run(ll, size: int) -> float:
+        return per_call(lambda: ll.get_cycle_start_index(method), 1)
+    return run
+
+
+class Operation:
+    """
+    One benchmarked operation.
+    extra nodes are added to the list before timing, so operations that shrink it run at the nominal size;
+    shuffle builds the list from a random permutation; cycle joins the tail to the middle node first;
+    max_size skips sizes the operation is too slow for.
+    """
+
+    def __init__(self, run: Callable, extra: int = 0, shuffle: bool = False, cycle: bool = False,
+                 max_size: Optional[int] = None):
+        self.run = run
+        self.extra = extra
+        self.shuffle = shuffle
+        self.cycle = cycle
+        self.max_size = max_size
+
+
+    def measure(self, ll_type: str, storage: str, size: int, repeats: int) -> float:
+        """Seconds per call at this size, the fastest of repeats runs on a freshly built list."""
+        best = math.inf
+        for _ in range(repeats):
+            values = list(range(1, size + self.extra + 1))
+            if self.shuffle:
+                random.Random(size).shuffle(values)
+            ll = LinkedList.build_from_values(ll_type, values, storage)
+            if self.cycle:
+                ll.create_cycle(size // 2)
+            best = min(best, self.run(ll, size))
+        return best
+
+
+OPERATIONS = {
+    "append": Operation(bench_append),
+    "prepend": Operation(bench_prepend),
+    "insert": Operation(bench_insert),
+    "remove": Operation(bench_remove, extra=LINEAR_CALLS),
+    "replace": Operation(bench_replace),
+    "trim": Operation(bench_trim, extra=CONSTANT_CALLS),
+    "contains": Operation(bench_contains),
+    "reverse": Operation(bench_reverse),
+    "sort_merge": Operation(bench_sort(1), shuffle=True),
+    "sort_insertion": Operation(bench_sort(2), shuffle=True, max_size=10_000),
+    "sort_natural": Operation(bench_sort(3), shuffle=True),
+    # every size spills at least one run; 1_000_000 merges ten runs of EXTERNAL_RUN_SIZE back from disk
+    "sort_external": Operation(bench_sort(4), shuffle=True),
+    "cycle_floyd": Operation(bench_cycle(1), cycle=True),
+    "cycle_brent": Operation(bench_cycle(2), cycle=True),
+    "cycle_tail": Operation(bench_cycle(3), cycle=True),
+}
+
+
+def fit_exponent(seconds: dict[int, float]) -> Optional[float]:
+    """
+    Least-squares slope of log(seconds) against log(n): 0 for O(1), 1 for O(n), a little above 1 for O(n log n).
+    Returns None with fewer than two sizes.
+    """
+
+    points = [(math.log(size), math.log(max(elapsed, 1e-12))) for size, elapsed in seconds.items()]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+def measure_operation(name: str, ll_type: str, storage: str, sizes: list[int], repeats: int) -> dict[int, float]:
+    operation = OPERATIONS[name]
+    seconds = {}
+    for size in sizes:
+        if operation.max_size is not None and size > operation.max_size:
+            continue
+        seconds[size] = operation.measure(ll_type, storage, size, repeats)
+        print(f"{name:<16}{size:>10}{seconds[size] * 1e6:>14.2f} µs", file=sys.stderr)
+    return seconds
+
+
+def run_suite(ll_type: str, storage: str, sizes: list[int], names: list[str], repeats: int = REPEATS) -> dict:
+    """
+    Times each operation in a freshly spawned process.
+    Where earlier work left freed nodes in the allocator changes how well a walk uses the CPU cache,
+    enough to make insertion sort three times faster late in a long run, so every operation starts from the same state.
+    """
+
+    context = multiprocessing.get_context("spawn")
+    operations = {}
+    for name in names:
+        with context.Pool(1) as pool:
+            seconds = pool.apply(measure_operation, (name, ll_type, storage, sizes, repeats))
+        exponent = fit_exponent(seconds)
+        operations[name] = {
+            "seconds": {str(size): elapsed for size, elapsed in seconds.items()},
+            "exponent": None if exponent is None else round(exponent, 3),
+        }
+
+    return {
+        "ll_type": ll_type,
+        "storage": storage,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "sizes": sizes,
+        "operations": operations,
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list[str]:
+    """
+    Returns a line per regression of report against baseline.
+    Exponents are compared only for operations measured at the same sizes in both; the time ratio is the geometric mean over the sizes both reports measured.
+    """
+
+    regressions = []
+    for name, current in report["operations"].items():
+        previous = baseline["operations"].get(name)
+        if previous is None:
+            continue
+        # exponents fitted over different sizes are not comparable
+        same_sizes = current["seconds"].keys() == previous["seconds"].keys()
+        if same_sizes and current["exponent"] is not None and previous["exponent"] is not None:
+            rise = current["exponent"] - previous["exponent"]
+            if rise > EXPONENT_TOLERANCE:
+                regressions.append(f"{name}: exponent {previous['exponent']:.2f} -> {current['exponent']:.2f}")
+        shared = current["seconds"].keys() & previous["seconds"].keys()
+        if shared:
+            ratio = math.exp(sum(math.log(current["seconds"][size] / previous["seconds"][size]) for size in shared)
+                             / len(shared))
+            if ratio > threshold:
+                regressions.append(f"{name}: {ratio:.1f}x slower than baseline")
+    return regressions
+
+
+def print_report(report: dict, baseline: Optional[dict]):
+    sizes = report["sizes"]
+    header = f"{'operation':<16}" + "".join(f"{'n=' + format(size, ','):>14}" for size in sizes) + f"{'k':>7}"
+    if baseline:
+        header += f"{'base k':>8}"
+    print(f"{report['ll_type']}/{report['storage']} (µs per call, k = fitted exponent)")
+    print(header)
+    for name, result in report["operations"].items():
+        cells = "".join(f"{result['seconds'][str(size)] * 1e6:>14.2f}" if str(size) in result["seconds"]
+                        else f"{'-':>14}" for size in sizes)
+        exponent = result["exponent"]
+        line = f"{name:<16}{cells}{'-' if exponent is None else format(exponent, '.2f'):>7}"
+        if baseline:
+            previous = baseline["operations"].get(name, {}).get("exponent")
+            line += f"{'-' if previous is None else format(previous, '.2f'):>8}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scaling benchmark for every linked list operation.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="List sizes to time")
+    parser.add_argument("--ops", nargs="+", choices=list(OPERATIONS), default=list(OPERATIONS),
+                        help="Operations to time (default: all)")
+    parser.add_argument("--type", dest="ll_type", choices=["singly", "doubly"], default="singly")
+    parser.add_argument("--storage", choices=["node", "array"], default="node")
+    parser.add_argument("--repeats", type=int, default=REPEATS)
+    parser.add_argument("--output", help="Write the JSON report to this path")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH), help="Baseline report to compare with")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Slowdown against the baseline reported as a regression (default 2.0)")
+    parser.add_argument("--save-baseline", action="store_true", help="Write the report as the new baseline")
+    args = parser.parse_args()
+
+    report = run_suite(args.ll_type, args.storage, sorted(args.sizes), args.ops, args.repeats)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+    if args.save_baseline:
+        Path(args.baseline).write_text(json.dumps(report, indent=2) + "\n")
+        print_report(report, None)
+        return
+
+    baseline_path = Path(args.baseline)
+    baseline = json.loads(baseline_path.read_text()) if baseline_path.exists() else None
+    if baseline and (baseline["ll_type"], baseline["storage"]) != (report["ll_type"], report["storage"]):
+        print(f"Baseline is for {baseline['ll_type']}/{baseline['storage']}; skipping the comparison.")
+        baseline = None
+    print_report(report, baseline)
+    if baseline:
+        regressions = compare(report, baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+        print("No regressions against the baseline.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+import mmap
+import struct
+from typing import List, Tuple, Iterable, Iterator
+
+# File layout: MAGIC, then one record per operation:
+#   opcode byte | zigzag varint index (insert, remove, replace, cycle) | tagged value (append, prepend, insert, replace)
+# A tagged value is a tag byte followed by a varint length and UTF-8 bytes (str), a zigzag varint (int),
+# 8 little-endian bytes (float), or nothing (bool).
+MAGIC = b"LLOP\x01"
+
+OPCODES = {"append": 1, "prepend": 2, "insert": 3, "remove": 4, "replace": 5, "cycle": 6, "has_cycle": 7}
+COMMANDS = {opcode: command for command, opcode in OPCODES.items()}
+INDEXED_OPCODES = frozenset([3, 4, 5, 6])
+VALUED_OPCODES = frozenset([1, 2, 3, 5])
+
+TAG_STR = 0
+TAG_INT = 1
+TAG_FLOAT = 2
+TAG_TRUE = 3
+TAG_FALSE = 4
+
+FLOAT = struct.Struct("<d")
+
+
+def is_binary_ops(path: str) -> bool:
+    with open(path, "rb") as handle:
+        return handle.read(len(MAGIC)) == MAGIC
+
+
+def write_varint(out: bytearray, number: int):
+    while number >= 0x80:
+        out.append((number & 0x7F) | 0x80)
+        number >>= 7
+    out.append(number)
+
+
+def read_varint(data: bytes | mmap.mmap, pos: int) -> Tuple[int, int]:
+    """Returns (number, position after the varint)."""
+    number = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        number |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return number, pos
+        shift += 7
+
+
+def zigzag(number: int) -> int:
+    return number * 2 if number >= 0 else -number * 2 - 1
+
+
+def unzigzag(number: int) -> int:
+    return number >> 1 if not number & 1 else -(number >> 1) - 1
+
+
+def encode_value(out: bytearray, value: int | float | str | bool):
+    if value is True:
+        out.append(TAG_TRUE)
+    elif value is False:
+        out.append(TAG_FALSE)
+    elif type(value) is int:
+        out.append(TAG_INT)
+        write_varint(out, zigzag(value))
+    elif type(value) is float:
+        out.append(TAG_FLOAT)
+        out += FLOAT.pack(value)
+    else:
+        encoded = str(value).encode("utf-8")
+        out.append(TAG_STR)
+        write_varint(out, len(encoded))
+        out += encoded
+
+
+def encode_operation(out: bytearray, command: str, args: List[int | float | str | bool]):
+    opcode = OPCODES.get(command)
+    if opcode is None:
+        raise ValueError(f"Unknown operation type '{command}'.")
+    out.append(opcode)
+    if opcode in INDEXED_OPCODES:
+        write_varint(out, zigzag(int(args[0])))
+    if opcode in VALUED_OPCODES:
+        encode_value(out, args[-1])
+
+
+def write_binary_ops(operations: Iterable[Tuple[str, List[int | float | str | bool], str]], path: str,
+                     buffer_size: int = 1 << 20) -> int:
+    """
+    Encodes operations into a binary ops log at path, flushing every buffer_size bytes.
+    Returns the number of operations written.
+    """
+    count = 0
+    out = bytearray(MAGIC)
+    with open(path, "wb") as handle:
+        for command, args, _ in operations:
+            encode_operation(out, command, args)
+            count += 1
+            if len(out) >= buffer_size:
+                handle.write(out)
+                out.clear()
+        handle.write(out)
+    return count
+
+
+def iter_binary_ops(path: str, labels: bool = True) -> Iterator[Tuple[str, List[int | float | str | bool], str]]:
+    """
+    Yields (command, args, label) for each record of a binary ops log, reading it straight out of an mmap.
+    Single-byte varints and ASCII-length strings take an inline fast path.
+    Labels are rebuilt in the text format ("insert 3 2") for the visualizer; pass labels=False to skip them.
+    """
+    with open(path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a binary operations file.")
+        pos = len(MAGIC)
+        end = len(data)
+        while pos < end:
+            opcode = data[pos]
+            command = COMMANDS.get(opcode)
+            if command is None:
+                raise ValueError(f"Unknown opcode {opcode} at byte {pos}.")
+            pos += 1
+
+            if opcode in INDEXED_OPCODES:
+                number = data[pos]
+                if number < 0x80:
+                    pos += 1
+                else:
+                    number, pos = read_varint(data, pos)
+                args = [number >> 1 if not number & 1 else -(number >> 1) - 1]
+            else:
+                args = []
+
+            if opcode in VALUED_OPCODES:
+                tag = data[pos]
+                if tag == TAG_STR:
+                    length = data[pos + 1]
+                    if length < 0x80:
+                        pos += 2
+                    else:
+                        length, pos = read_varint(data, pos + 1)
+                    args.append(data[pos:pos + length].decode("utf-8"))
+                    pos += length
+                elif tag == TAG_INT:
+                    number, pos = read_varint(data, pos + 1)
+                    args.append(unzigzag(number))
+                elif tag == TAG_FLOAT:
+                    args.append(FLOAT.unpack_from(data, pos + 1)[0])
+                    pos += 1 + FLOAT.size
+                elif tag == TAG_TRUE or tag == TAG_FALSE:
+                    args.append(tag == TAG_TRUE)
+                    pos += 1
+                else:
+                    raise ValueError(f"Unknown value tag {tag} at byte {pos}.")
+
+            yield command, args, (f"{command} {' '.join(map(str, args))}".rstrip() if labels else "")
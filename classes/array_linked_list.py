@@ -0,0 +1,852 @@
+import sys
+from array import array
+from bisect import bisect_right
+from itertools import islice
+from typing import Optional, Iterable, Iterator, Callable
+from classes.singly_linked_list import SinglyLinkedList
+from classes.doubly_linked_list import DoublyLinkedList
+from classes.linked_list_exceptions import *
+from classes.render_cache import RenderCache
+from classes.sorting import SortKey, comparable, external_sorted
+from constants import SORT_METHODS, VALUE_TYPES
+
+NIL = -1
+
+
+class ArrayNode:
+    """
+    Handle to one slot of an array-backed linked list.
+    Exposes the same value/next/prev attributes as Node so callers can read either storage engine.
+    Links are read-only through a handle; use the list methods to change them.
+    """
+    __slots__ = ("ll", "slot")
+
+    def __init__(self, ll: "ArraySinglyLinkedList", slot: int):
+        self.ll = ll
+        self.slot = slot
+
+    @property
+    def value(self):
+        return self.ll.values[self.slot]
+
+    @value.setter
+    def value(self, value: int | float | str | bool):
+        self.ll.values[self.slot] = value
+
+    @property
+    def next(self):
+        return self.ll._handle(self.ll.next_links[self.slot])
+
+    @property
+    def prev(self):
+        if self.ll.prev_links is None: return None
+        return self.ll._handle(self.ll.prev_links[self.slot])
+
+    def __eq__(self, other):
+        return isinstance(other, ArrayNode) and other.ll is self.ll and other.slot == self.slot
+
+    def __hash__(self):
+        return hash((id(self.ll), self.slot))
+
+    def __repr__(self):
+        return f"Node[{self.value}]"
+
+
+class ArraySinglyLinkedList:
+    """
+    Singly linked list stored in parallel arrays instead of Node objects.
+    values[i] holds the value of slot i and next_links[i] the slot that follows it (NIL for none).
+    Removed slots are threaded onto a free-list through next_links and reused by later inserts.
+    """
+
+    title = SinglyLinkedList.title
+    link_arrow = SinglyLinkedList.link_arrow
+    __str__ = SinglyLinkedList.__str__
+    to_string = SinglyLinkedList.to_string
+    show = SinglyLinkedList.show
+    __getitem__ = SinglyLinkedList.__getitem__
+    __contains__ = SinglyLinkedList.__contains__
+    __reversed__ = SinglyLinkedList.__reversed__
+    _format_string = staticmethod(SinglyLinkedList._format_string)
+    _cycle_note = SinglyLinkedList._cycle_note
+    _render_cache = SinglyLinkedList._render_cache
+    _value_strings = SinglyLinkedList._value_strings
+    count = SinglyLinkedList.count
+    find_all = SinglyLinkedList.find_all
+    index_of = SinglyLinkedList.index_of
+    # array storage keeps none of the node lists' optional helpers; see enable_position_index and friends
+    position_index = None
+    value_index = None
+    stats = None
+
+    def __init__(self, initial_node_value: Any = None):
+        self.values: list[int | float | str | bool | None] = []
+        self.next_links = array("q")
+        self.prev_links: array | None = None
+        self.free_slot: int = NIL
+        self.head_slot: int = NIL
+        self.tail_slot: int = NIL
+        self.cycle_slot: int = NIL
+        self.size: int = 0
+        self.render_cache: RenderCache | None = None
+        if initial_node_value:
+            self.append(initial_node_value)
+
+
+    def __len__(self):
+        return self.size
+
+
+    def __iter__(self) -> Iterator[int | float | str | bool]:
+        """
+        Yields the values from head to tail, following next_links for at most size slots.
+        Time complexity: O(1) per value
+        """
+
+        return self._iter_slots(self.head_slot)
+
+
+    def iter_from(self, node: ArrayNode | None) -> Iterator[int | float | str | bool]:
+        """Yields the values from node, which must belong to this list, through the tail."""
+        return self._iter_slots(NIL if node is None else node.slot)
+
+
+    def _iter_slots(self, slot: int) -> Iterator[int | float | str | bool]:
+        values = self.values
+        next_links = self.next_links
+        tail_slot = self.tail_slot
+        for _ in range(self.size):
+            if slot == NIL:
+                return
+            yield values[slot]
+            if slot == tail_slot:
+                return
+            slot = next_links[slot]
+
+
+    @property
+    def head(self) -> ArrayNode | None:
+        return self._handle(self.head_slot)
+
+
+    @property
+    def tail(self) -> ArrayNode | None:
+        return self._handle(self.tail_slot)
+
+
+    @property
+    def cycle_start(self) -> ArrayNode | None:
+        return self._handle(self.cycle_slot)
+
+
+    def _handle(self, slot: int) -> ArrayNode | None:
+        return None if slot == NIL else ArrayNode(self, slot)
+
+
+    def _allocate(self, value: int | float | str | bool) -> int:
+        """
+        Returns a slot holding value, reusing the first free slot if there is one.
+        Time complexity: O(1) amortized
+        """
+
+        slot = self.free_slot
+        if slot == NIL:
+            slot = len(self.values)
+            self.values.append(value)
+            self.next_links.append(NIL)
+            if self.prev_links is not None:
+                self.prev_links.append(NIL)
+        else:
+            self.free_slot = self.next_links[slot]
+            self.values[slot] = value
+            self.next_links[slot] = NIL
+            if self.prev_links is not None:
+                self.prev_links[slot] = NIL
+        return slot
+
+
+    def _free(self, slot: int):
+        """Drops the value held by slot and pushes the slot onto the free-list."""
+        self.values[slot] = None
+        self.next_links[slot] = self.free_slot
+        self.free_slot = slot
+
+
+    def _set_next(self, slot: int, next_slot: int):
+        self.next_links[slot] = next_slot
+
+
+    def _slot_at(self, index: int) -> int:
+        """
+        Returns the slot at index, or head/tail if out of bounds
+        Time complexity: O(n)
+        """
+
+        if index <= 0: return self.head_slot
+        if index >= self.size - 1: return self.tail_slot
+
+        next_links = self.next_links
+        slot = self.head_slot
+        for _ in range(index):
+            slot = next_links[slot]
+        return slot
+
+
+    def _ordered_slots(self, count: Optional[int] = None) -> list[int]:
+        """Returns the first count slots in list order, walking at most size slots so a cycle cannot loop forever."""
+        if count is None: count = self.size
+        next_links = self.next_links
+        slots = []
+        slot = self.head_slot
+        for _ in range(min(count, self.size)):
+            slots.append(slot)
+            slot = next_links[slot]
+        return slots
+
+
+    def _relink(self, slots: list[int]):
+        """Links slots together in the given order and makes them the whole list."""
+        next_links = self.next_links
+        for slot, next_slot in zip(slots, slots[1:]):
+            next_links[slot] = next_slot
+        next_links[slots[-1]] = NIL
+        self.head_slot = slots[0]
+        self.tail_slot = slots[-1]
+
+
+    def get_node(self, index: int) -> ArrayNode | None:
+        """
+        Returns node at index, or head/tail if out of bounds
+        Time complexity: O(n)
+        """
+
+        return self._handle(self._slot_at(index))
+
+
+    def get_values(self, count: Optional[int] = None) -> list[int | float | str | bool]:
+        """
+        Returns list of node values to count size, or head/tail if out of bounds
+        Time complexity: O(n)
+        """
+
+        if count is None: count = self.size
+        if count <= 0: return []
+        values = self.values
+        return [values[slot] for slot in self._ordered_slots(count)]
+
+
+    def _values_from(self, start: int, count: int) -> list[int | float | str | bool]:
+        """
+        Returns the values of count slots from position start, which must be in range.
+        Time complexity: O(start + count), or O(n - start + count) for the doubly list
+        """
+
+        return list(islice(self._iter_slots(self._slot_at(start)), count))
+
+
+    def _cycle_index(self) -> Optional[int]:
+        """
+        Returns the position of the tracked cycle start, found by walking to it rather than by a cycle-finding pass.
+        Time complexity: O(n)
+        """
+
+        if self.cycle_slot == NIL:
+            return None
+        next_links = self.next_links
+        slot = self.head_slot
+        for index in range(self.size):
+            if slot == self.cycle_slot:
+                return index
+            slot = next_links[slot]
+        return None
+
+
+    def enable_position_index(self):
+        """Array storage finds positions by walking its link array and has no position index."""
+        raise ValueError("The position index is only available for node storage.")
+
+
+    def enable_value_index(self):
+        """The value index maps values to Node objects, which array storage does not have."""
+        raise ValueError("The value index is only available for node storage.")
+
+
+    def enable_stats(self):
+        """Operation stats count node hops and allocations, which array storage does not make."""
+        raise ValueError("Operation stats are only available for node storage.")
+
+
+    def append(self, value: int | float | str | bool):
+        """
+        Adds a new node to the end of the linked list.
+        Time complexity: O(1)
+        """
+
+        try:
+            if not value:
+                raise EmptyValueException(value)
+            if type(value) not in [int, float, str, bool]:
+                raise ValueTypeException(value)
+            if self.has_cycle():
+                raise CycleDetectedException(sys._getframe().f_code.co_name)
+
+            slot = self._allocate(value)
+            if self.head_slot == NIL:
+                self.head_slot = slot
+            else:
+                self._set_next(self.tail_slot, slot)
+            self.tail_slot = slot
+            self.size += 1
+            if self.render_cache is not None:
+                self.render_cache.inserted(self.size - 1, value)
+            return True
+        except EmptyValueException as e:
+            print(e)
+        except ValueTypeException as e:
+            print(e)
+        except CycleDetectedException as e:
+            print(e)
+
+        return False
+
+
+    def append_values(self, values: Iterable[int | float | str | bool]):
+        """
+        Adds multiple new nodes to the end of the linked list.
+        The batch goes into fresh slots at the end of the arrays, linked with one extend per array.
+        Returns the number of nodes added.
+        Time complexity: O(k) for k values
+        """
+
+        try:
+            if self.has_cycle():
+                raise CycleDetectedException(sys._getframe().f_code.co_name)
+
+            first_slot, last_slot = self._allocate_chain(values)
+            if first_slot == NIL:
+                return 0
+
+            if self.head_slot == NIL:
+                self.head_slot = first_slot
+            else:
+                self._set_next(self.tail_slot, first_slot)
+            self.tail_slot = last_slot
+            count = last_slot - first_slot + 1
+            if self.render_cache is not None:
+                self.render_cache.extended(self.size, self.values[first_slot:last_slot + 1])
+            self.size += count
+            return count
+        except CycleDetectedException as e:
+            print(e)
+
+        return 0
+
+
+    def _allocate_chain(self, values: Iterable[int | float | str | bool]) -> tuple[int, int]:
+        """
+        Stores every valid value in new slots linked in order and returns (first, last) slot.
+        Values of other types are skipped; empty values are skipped and reported once.
+        Time complexity: O(k)
+        """
+
+        valid_values = [value for value in values if type(value) in VALUE_TYPES]
+        new_values = [value for value in valid_values if value]
+        if len(new_values) < len(valid_values):
+            print(EmptyValueException(None))
+        if not new_values:
+            return NIL, NIL
+
+        first_slot = len(self.values)
+        last_slot = first_slot + len(new_values) - 1
+        self.values.extend(new_values)
+        self.next_links.extend(range(first_slot + 1, last_slot + 2))
+        self.next_links[last_slot] = NIL
+        if self.prev_links is not None:
+            self.prev_links.extend(range(first_slot - 1, last_slot))
+            self.prev_links[first_slot] = NIL
+        return first_slot, last_slot
+
+
+    def prepend(self, value: int | float | str | bool):
+        """
+        Adds a new node to the front of the linked list.
+        Time complexity: O(1)
+        """
+        try:
+            if not value:
+                raise EmptyValueException(value)
+            if type(value) not in [int, float, str, bool]:
+                raise ValueTypeException(value)
+
+            slot = self._allocate(value)
+            if self.head_slot == NIL:
+                self.tail_slot = slot
+            else:
+                self._set_next(slot, self.head_slot)
+            self.head_slot = slot
+            self.size += 1
+            if self.render_cache is not None:
+                self.render_cache.inserted(0, value)
+            return True
+        except EmptyValueException as e:
+            print(e)
+        except ValueTypeException as e:
+            print(e)
+
+        return False
+
+
+    def prepend_values(self, values: Iterable[int | float | str | bool]):
+        """
+        Adding multiple nodes to the front of the linked list.
+        Preserves order. Returns the number of nodes added.
+        Time complexity: O(k) for k values
+        """
+
+        first_slot, last_slot = self._allocate_chain(values)
+        if first_slot == NIL:
+            return 0
+
+        if self.head_slot == NIL:
+            self.tail_slot = last_slot
+        else:
+            self._set_next(last_slot, self.head_slot)
+        self.head_slot = first_slot
+        count = last_slot - first_slot + 1
+        if self.render_cache is not None:
+            self.render_cache.extended(0, self.values[first_slot:last_slot + 1])
+        self.size += count
+        return count
+
+
+    def insert(self, index: int, value: int | float | str | bool):
+        """
+        Inserts a new node at the specified index.
+        Time complexity: O(n)
+        """
+
+        try:
+            if type(value) not in [int, float, str, bool]:
+                raise ValueTypeException(value)
+            if self.has_cycle():
+                raise CycleDetectedException(sys._getframe().f_code.co_name)
+
+            # a negative index lands after the head, as it does in the node lists
+            if index < 0: index = min(1, self.size)
+            if index == 0:
+                return self.prepend(value)
+            if index >= self.size:
+                return self.append(value)
+
+            prev_slot = self._slot_at(index - 1)
+            slot = self._allocate(value)
+            self._set_next(slot, self.next_links[prev_slot])
+            self._set_next(prev_slot, slot)
+            self.size += 1
+            if self.render_cache is not None:
+                self.render_cache.inserted(index, value)
+            return True
+        except ValueTypeException as e:
+            print(e)
+        except CycleDetectedException as e:
+            print(e)
+
+        return False
+
+
+    def replace(self, index: int, value: int | float | str | bool):
+        """
+        Replaces the value of a node at the specified index.
+        Time complexity: O(n)
+        """
+
+        try:
+            if type(value) not in [int, float, str, bool]:
+                raise ValueTypeException(value)
+            if self.size == 0:
+                return False
+
+            self.values[self._slot_at(index)] = value
+            if self.render_cache is not None:
+                self.render_cache.replaced(max(0, min(index, self.size - 1)), value)
+            return True
+        except ValueTypeException as e:
+            print(e)
+
+        return False
+
+
+    def trim(self):
+        """
+        Removes the last node from the list.
+        Time complexity: O(n)
+        """
+
+        try:
+            if self.has_cycle():
+                raise CycleDetectedException(sys._getframe().f_code.co_name)
+            if self.size == 0:
+                return False
+
+            removed_slot = self.tail_slot
+            if self.size == 1:
+                self.head_slot = self.tail_slot = NIL
+            else:
+                self.tail_slot = self._slot_at(self.size - 2)
+                self.next_links[self.tail_slot] = NIL
+            self._free(removed_slot)
+            self.size -= 1
+            if self.render_cache is not None:
+                self.render_cache.removed(self.size)
+            return True
+        except CycleDetectedException as e:
+            print(e)
+
+        return False
+
+
+    def contains(self, value: int | float | str | bool) -> bool:
+        """
+        Checks if the list contains a node with the specified value.
+        Time complexity: O(n)
+        """
+
+        for node_value in self:
+            if node_value == value: return True
+
+        return False
+
+
+    def remove(self, index: int):
+        """
+        Removes a node at the specified index.
+        Time complexity: O(n)
+        """
+
+        if index < 0 or index >= self.size: return False
+        if index >= self.size - 1 and index != 0:
+            return self.trim()
+
+        if index == 0:
+            removed_slot = self.head_slot
+            self.head_slot = self.next_links[removed_slot]
+        else:
+            prev_slot = self._slot_at(index - 1)
+            removed_slot = self.next_links[prev_slot]
+            self._set_next(prev_slot, self.next_links[removed_slot])
+        self._unlink_prev(self.next_links[removed_slot])
+        self.size -= 1
+        if self.render_cache is not None:
+            self.render_cache.removed(index)
+
+        if removed_slot == self.cycle_slot:
+            # removing the node the tail points back to breaks the cycle
+            self.next_links[self.tail_slot] = NIL
+            self.cycle_slot = NIL
+        if self.size == 0:
+            self.head_slot = self.tail_slot = NIL
+        self._free(removed_slot)
+
+        return True
+
+
+    def _unlink_prev(self, slot: int):
+        """Hook for the doubly list to clear a back link; singly slots have none."""
+        pass
+
+
+    def create_cycle(self, start: int):
+        """
+        Create a cycle in the linked list.
+        Accepts start index.  Start index must be less than tail index.
+        Time complexity: O(n)
+        """
+
+        try:
+            if self.has_cycle():
+                raise CycleDetectedException(sys._getframe().f_code.co_name)
+            if self.size == 0 or start > self.size:
+                raise ValueError("Start index must come before tail index.")
+            start_slot = self._slot_at(start)
+            self.next_links[self.tail_slot] = start_slot
+            self.cycle_slot = start_slot
+            return True
+        except CycleDetectedException as e:
+            print(e)
+        except ValueError as e:
+            print(e)
+
+        return False
+
+
+    def has_cycle(self, method: int = 1, verify: bool = False) -> bool:
+        """
+        Detects if the linked list has a cycle.
+        Returns the tracked cycle state unless verify=True,
+        in which case method=1 walks the slots with Floyd's algorithm and method=2 with Brent's.
+        """
+        if not verify:
+            return self.cycle_slot != NIL
+
+        return self.get_cycle_start_index(method) is not None
+
+
+    def get_cycle_start_index(self, method: int = 1) -> Optional[int]:
+        """
+        Returns the index of the node where the cycle begins, or None if no cycle.
+        method=1: Floyd's Cycle-Finding Algorithm, O(n)
+        method=2: Brent's Cycle-Finding Algorithm, O(n)
+        method=3: Use the slot after the tail, O(n)
+        """
+        next_links = self.next_links
+        head = self.head_slot
+        match method:
+            case 1:
+                fast_runner = slow_runner = head
+                while fast_runner != NIL and next_links[fast_runner] != NIL:
+                    fast_runner = next_links[next_links[fast_runner]]
+                    slow_runner = next_links[slow_runner]
+                    if fast_runner == slow_runner:
+                        break
+                else:
+                    return None
+
+                slow_runner = head
+                index = 0
+                while slow_runner != fast_runner:
+                    slow_runner = next_links[slow_runner]
+                    fast_runner = next_links[fast_runner]
+                    index += 1
+                return index
+
+            case 2:
+                if head == NIL or next_links[head] == NIL:
+                    return None
+
+                power = lam = 1
+                tortoise = head
+                hare = next_links[head]
+                while hare != NIL and tortoise != hare:
+                    if lam == power:
+                        tortoise = hare
+                        power *= 2
+                        lam = 0
+                    hare = next_links[hare]
+                    lam += 1
+
+                if hare == NIL:
+                    return None
+
+                tortoise = hare = head
+                for _ in range(lam):
+                    hare = next_links[hare]
+                index = 0
+                while tortoise != hare:
+                    tortoise = next_links[tortoise]
+                    hare = next_links[hare]
+                    index += 1
+                return index
+
+            case 3:
+                if self.tail_slot != NIL and next_links[self.tail_slot] != NIL:
+                    start_slot = next_links[self.tail_slot]
+                    slot = head
+                    for i in range(self.size - 1):
+                        if slot == start_slot:
+                            return i
+                        slot = next_links[slot]
+
+        return None
+
+
+    def reverse(self):
+        """
+        Reverses the linked list in place.
+        Time complexity: O(n)
+        """
+        try:
+            if self.has_cycle():
+                raise CycleDetectedException(sys._getframe().f_code.co_name)
+            if self.size <= 1: return False
+
+            self._relink(self._ordered_slots()[::-1])
+            if self.render_cache is not None:
+                self.render_cache.reversed()
+            return True
+        except CycleDetectedException as e:
+            print(e)
+
+        return False
+
+
+    def sort(self, method: int = 1, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False) -> bool:
+        """
+        Sorts the linked list in place.
+        method=1: Merge sort
+        method=2: Insertion sort
+        method=3: Natural merge sort
+        method=4: External merge sort, which writes the merged runs back into the existing slots
+        Methods 1 and 3 order the slots by value with list.sort, itself a stable natural merge sort, and relink them once;
+        with values held in a flat list this beats chasing links through a merge, and stable sorts agree on the result.
+        Insertion sort binary-searches a sorted list of slots, placing ties the way the node lists' insertion sort does.
+        key and reverse work as for SinglyLinkedList.sort.
+        Time complexity: O(n log n), O(n²) for insertion sort
+        """
+
+        try:
+            if self.has_cycle():
+                raise CycleDetectedException(sys._getframe().f_code.co_name)
+            if method not in SORT_METHODS:
+                raise ValueError("Method must be 1 (merge), 2 (insertion), 3 (natural merge) or 4 (external merge).")
+            if self.size <= 1:
+                return True
+
+            slots = self._ordered_slots()
+            values = self.values
+            if method == 4:
+                for slot, value in zip(slots, external_sorted(self, key, reverse)):
+                    values[slot] = value
+            elif method == 2:
+                ordered: list[SortKey] = []
+                for slot in slots:
+                    sort_key = SortKey(values[slot] if key is None else key(values[slot]), slot, reverse)
+                    # like the node insertion sort: a key no greater than the first goes in front of it,
+                    # any other after the last key no greater than it
+                    if not ordered or sort_key <= ordered[0]:
+                        ordered.insert(0, sort_key)
+                    else:
+                        ordered.insert(bisect_right(ordered, sort_key), sort_key)
+                self._relink([sort_key.value for sort_key in ordered])
+            elif key is None and comparable(values[slot] for slot in slots):
+                slots.sort(key=values.__getitem__, reverse=reverse)
+                self._relink(slots)
+            else:
+                slots.sort(key=lambda slot: SortKey(values[slot] if key is None else key(values[slot])), reverse=reverse)
+                self._relink(slots)
+            self.render_cache = None
+            return True
+        except CycleDetectedException as e:
+            print(e)
+        except ValueError as e:
+            print(e)
+        except TypeError as e:
+            print(e)
+
+        return False
+
+
+    def clear(self, iterate: bool = False):
+        """
+        Clears the linked list, dropping the storage arrays and resetting size to 0.
+        Time complexity: O(1)
+        """
+        self.values = []
+        self.next_links = array("q")
+        if self.prev_links is not None:
+            self.prev_links = array("q")
+        self.free_slot = self.head_slot = self.tail_slot = self.cycle_slot = NIL
+        self.size = 0
+        self.render_cache = None
+
+        return True
+
+
+class ArrayDoublyLinkedList(ArraySinglyLinkedList):
+    """Doubly linked list stored in parallel arrays; prev_links[i] holds the slot before slot i."""
+
+    title = DoublyLinkedList.title
+    link_arrow = DoublyLinkedList.link_arrow
+    _format_string = staticmethod(DoublyLinkedList._format_string)
+
+    def __init__(self, initial_node_value: int | float | str | bool = None):
+        super().__init__()
+        self.prev_links = array("q")
+        if initial_node_value:
+            self.append(initial_node_value)
+
+
+    def __reversed__(self) -> Iterator[int | float | str | bool]:
+        """
+        Yields the values from tail to head by following prev_links.
+        Time complexity: O(1) per value
+        """
+
+        values = self.values
+        prev_links = self.prev_links
+        slot = self.tail_slot
+        for _ in range(self.size):
+            yield values[slot]
+            slot = prev_links[slot]
+
+
+    def _set_next(self, slot: int, next_slot: int):
+        self.next_links[slot] = next_slot
+        if next_slot != NIL:
+            self.prev_links[next_slot] = slot
+
+
+    def _unlink_prev(self, slot: int):
+        if slot != NIL and slot == self.head_slot:
+            self.prev_links[slot] = NIL
+
+
+    def _slot_at(self, index: int) -> int:
+        """
+        Retrieves the slot at the specified index, walking from the closer end.
+        Time complexity: O(n)
+        """
+
+        if index <= 0: return self.head_slot
+        if index >= self.size - 1: return self.tail_slot
+
+        if index <= self.size // 2:
+            next_links = self.next_links
+            slot = self.head_slot
+            for _ in range(index):
+                slot = next_links[slot]
+        else:
+            prev_links = self.prev_links
+            slot = self.tail_slot
+            for _ in range(self.size - 1 - index):
+                slot = prev_links[slot]
+        return slot
+
+
+    def _relink(self, slots: list[int]):
+        super()._relink(slots)
+        prev_links = self.prev_links
+        for prev_slot, slot in zip(slots, slots[1:]):
+            prev_links[slot] = prev_slot
+        prev_links[slots[0]] = NIL
+
+
+    def trim(self):
+        """
+        Removes the last node from the list.
+        Time complexity: O(1)
+        """
+
+        if self.size == 0:
+            return False
+
+        removed_slot = self.tail_slot
+        if self.size == 1:
+            self.head_slot = self.tail_slot = NIL
+        else:
+            self.tail_slot = self.prev_links[removed_slot]
+            self.next_links[self.tail_slot] = NIL
+        self._free(removed_slot)
+        self.size -= 1
+        if self.render_cache is not None:
+            self.render_cache.removed(self.size)
+        return True
+
+
+    def create_cycle(self, start: int):
+        """Overriding parent method because doubly linked list cannot have a cycle."""
+        return False
+
+
+    def has_cycle(self, method: int = 1, verify: bool = False):
+        """Overriding parent method because doubly linked list cannot have a cycle."""
+        return False
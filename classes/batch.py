@@ -0,0 +1,81 @@
+import contextlib
+import glob
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+from classes.linked_list import LinkedList
+from classes.ops_optimizer import OpsOptimizer
+
+
+def resolve_ops_files(pattern: str) -> List[str]:
+    """
+    Expands an --ops-file argument for batch mode: a directory gives every file directly inside it,
+    anything else is treated as a glob pattern, which a plain path matches itself. Hidden files are skipped.
+    """
+    if os.path.isdir(pattern):
+        paths = [os.path.join(pattern, name) for name in os.listdir(pattern)]
+    else:
+        paths = glob.glob(pattern, recursive=True)
+    paths = sorted(path for path in paths if os.path.isfile(path) and not os.path.basename(path).startswith("."))
+    if not paths:
+        raise ValueError(f"No ops files match '{pattern}'")
+    return paths
+
+
+def replay_file(path: str, ll_type: str, load: Callable[[str], Iterable], options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Replays one ops file into a new list and returns its final state as a JSON-ready dict.
+    Runs in a worker process. What the list prints while replaying, such as has_cycle results, is discarded
+    so that it cannot interleave with the JSON lines; the cycle state is part of the result instead.
+    With options["optimize"] the operations go through an OpsOptimizer first and the result counts those it eliminated.
+    """
+    start = time.perf_counter()
+    optimizer = OpsOptimizer() if options.get("optimize") else None
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            ll = LinkedList.create(ll_type, options.get("storage", "node"), options.get("indexed", False),
+                                   options.get("value_indexed", False))
+            operations = load(path)
+            if optimizer is not None:
+                operations = optimizer.optimize(operations)
+            count = LinkedList.replay_ops(ll, operations)
+        has_cycle = ll.has_cycle()
+        return {
+            "file": path,
+            "ok": True,
+            "ops": optimizer.read if optimizer is not None else count,
+            "eliminated": optimizer.read - optimizer.written if optimizer is not None else 0,
+            "size": ll.size,
+            "values": ll.get_values(),
+            "has_cycle": has_cycle,
+            "cycle_start": ll.get_cycle_start_index(method=3) if has_cycle else None,
+            "seconds": round(time.perf_counter() - start, 6),
+        }
+    except Exception as e:
+        # one broken file is reported in its own line rather than failing every other file in the batch
+        error = str(e) if isinstance(e, (ValueError, OSError)) else f"{type(e).__name__}: {e}"
+        return {"file": path, "ok": False, "error": error, "seconds": round(time.perf_counter() - start, 6)}
+
+
+def run_batch(paths: List[str], ll_type: str, load: Callable[[str], Iterable], options: Dict[str, Any] | None = None,
+              workers: int | None = None) -> Iterator[Dict[str, Any]]:
+    """
+    Replays every file in paths independently and yields each result as soon as it is ready,
+    so results arrive in completion order rather than in the order of paths.
+    Files are spread over a pool of worker processes, one file per task, so a few long files do not hold up
+    the rest. load turns a path into operations and must be picklable, as a module-level function is.
+    workers=1 replays in this process.
+    """
+    options = options or {}
+    workers = max(1, min(workers or os.cpu_count() or 1, len(paths)))
+    if workers == 1:
+        for path in paths:
+            yield replay_file(path, ll_type, load, options)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(replay_file, path, ll_type, load, options) for path in paths]
+        for future in as_completed(futures):
+            yield future.result()
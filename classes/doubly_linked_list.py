@@ -1,25 +1,40 @@
 import sys
+from itertools import islice
 from classes.node import Node
 from classes.singly_linked_list import SinglyLinkedList
+from classes.sorting import merge_sort_hops
 from constants import PRINT_ARROW_DOUBLE as LINK_ARROW, PRINT_COLOR, RESET
 from classes.linked_list_exceptions import *
 
 class DoublyLinkedList(SinglyLinkedList):
+    title = "Doubly Linked List"
+    link_arrow = LINK_ARROW
+
     def __init__(self, initial_node_value: int | float | str | bool = None):
         super().__init__(initial_node_value)
 
 
-    def __str__(self):
+    @staticmethod
+    def _format_string(header_str: str, node_str: str, cycle_str: str) -> str:
+        """A doubly linked list cannot have a cycle, so there is no line for one."""
+        return f"\n{PRINT_COLOR}{header_str}\n{node_str}{RESET}\n"
+
+
+    def __reversed__(self):
         """
-        Iterates through the linked list and appends node values to a list.
-        Uses list size instead of current_node to avoid infinite loop when list has a cycle.
+        Yields the values from tail to head by following prev links.
+        Time complexity: O(1) per value
         """
 
-        values = list(self.get_values(self.size))
-        header_str = f"Doubly Linked List | {self.size} Elements:"
-        node_str = f"[{LINK_ARROW.join(map(str, values))}]"
-
-        return f"\n{PRINT_COLOR}{header_str}\n{node_str}{RESET}\n"
+        current_node = self.tail
+        visited = 0
+        try:
+            for visited in range(1, self.size + 1):
+                yield current_node.value
+                current_node = current_node.prev
+        finally:
+            if self.stats is not None:
+                self.stats.hops += visited
 
 
     def get_node(self, index: int):
@@ -30,19 +45,33 @@ class DoublyLinkedList(SinglyLinkedList):
 
         if index <= 0: return self.head
         if index >= self.size - 1: return self.tail
+        if self.position_index is not None: return self.position_index.node_at(index)
 
         if index <= self.size // 2:
+            steps = index
             current_node = self.head
-            for _ in range(index):
+            for _ in range(steps):
                 current_node = current_node.next
         else:
+            steps = self.size - 1 - index
             current_node = self.tail
-            for _ in range(self.size - index):
+            for _ in range(steps):
                 current_node = current_node.prev
+        if self.stats is not None:
+            self.stats.hops += steps
 
         return current_node
 
 
+    def _values_from(self, start: int, count: int):
+        """
+        Returns the values of count nodes from position start, walking in from the closer end.
+        Time complexity: O(min(start, n - start) + count)
+        """
+
+        return list(islice(self.iter_from(self.get_node(start)), count))
+
+
     def append(self, value: int | float | str | bool):
         """
         Appends a new node with the specified value to the end of the list.
@@ -65,6 +94,12 @@ class DoublyLinkedList(SinglyLinkedList):
                 self.head = new_node
             self.tail = new_node
             self.size += 1
+            if self.position_index is not None:
+                self.position_index.inserted(self.size - 1, new_node)
+            if self.value_index is not None:
+                self.value_index.added(new_node)
+            if self.render_cache is not None:
+                self.render_cache.inserted(self.size - 1, value)
             return True
         except EmptyValueException as e:
             print(e)
@@ -76,6 +111,37 @@ class DoublyLinkedList(SinglyLinkedList):
         return False
 
 
+    def _build_chain(self, values):
+        """Links a node for every valid value in both directions and returns (first, last, count)."""
+        first_node, last_node, count = super()._build_chain(values)
+        previous_node = None
+        current_node = first_node
+        for _ in range(count):
+            current_node.prev = previous_node
+            previous_node = current_node
+            current_node = current_node.next
+        return first_node, last_node, count
+
+
+    def _splice_tail(self, first_node: Node, last_node: Node):
+        first_node.prev = self.tail
+        super()._splice_tail(first_node, last_node)
+
+
+    def _splice_head(self, first_node: Node, last_node: Node):
+        if self.head:
+            self.head.prev = last_node
+        super()._splice_head(first_node, last_node)
+
+
+    def _extend_tail_path(self, old_tail: Node | None, first_node: Node, count: int):
+        """A doubly linked list steps back from the tail through prev links, so it keeps no tail path."""
+
+
+    def _touch_tail_path(self, index: int):
+        """A doubly linked list keeps no tail path to forget."""
+
+
     def prepend(self, value: int | float | str | bool):
         """
         Prepends a new node with the specified value to the beginning of the list.
@@ -92,8 +158,16 @@ class DoublyLinkedList(SinglyLinkedList):
             if self.head:
                 new_node.next = self.head
                 self.head.prev = new_node
+            else:
+                self.tail = new_node
             self.head = new_node
             self.size += 1
+            if self.position_index is not None:
+                self.position_index.inserted(0, new_node)
+            if self.value_index is not None:
+                self.value_index.added(new_node)
+            if self.render_cache is not None:
+                self.render_cache.inserted(0, value)
             return True
         except EmptyValueException as e:
             print(e)
@@ -103,40 +177,109 @@ class DoublyLinkedList(SinglyLinkedList):
         return False
 
 
+    def insert(self, index: int, value: int | float | str | bool):
+        """
+        Inserts a new node at the specified index, linking it in both directions.
+        Time complexity: O(n)
+        """
+
+        try:
+            if type(value) not in [int, float, str, bool]:
+                raise ValueTypeException(value)
+
+            # a negative index lands after the head, which is where get_node(index - 1) has always put it
+            if index < 0: index = min(1, self.size)
+            if index == 0:
+                return self.prepend(value)
+            elif index >= self.size:
+                return self.append(value)
+            else:
+                new_node = Node(value)
+                current_node = self.get_node(index - 1)
+                new_node.prev = current_node
+                new_node.next = current_node.next
+                current_node.next.prev = new_node
+                current_node.next = new_node
+                self.size += 1
+                if self.position_index is not None:
+                    self.position_index.inserted(index, new_node)
+                if self.value_index is not None:
+                    self.value_index.added(new_node)
+                if self.render_cache is not None:
+                    self.render_cache.inserted(index, value)
+                return True
+        except ValueTypeException as e:
+            print(e)
+
+        return False
+
+
     def remove(self, index: int):
         """
         Removes the node at the specified index.
         Time complexity: O(n)
         """
         if index < 0 or index >= self.size: return False
-        if index == 0:
-            self.head = self.head.next
+        if self.size == 1:
+            removed_node = self.head
+            self.head = self.tail = None
+            next_node = None
+        elif index == 0:
+            removed_node = self.head
+            self.head = next_node = self.head.next
             self.head.prev = None
         elif index >= self.size - 1:
+            removed_node = self.tail
             self.tail = self.tail.prev
-            self.tail.next = None
+            self.tail.next = next_node = None
         else:
             current_node = self.get_node(index -1)
-            next_node = current_node.next.next
+            removed_node = current_node.next
+            next_node = removed_node.next
             current_node.next = next_node
             next_node.prev = current_node
         self.size -= 1
+        if self.position_index is not None:
+            self.position_index.removed(index, next_node)
+        if self.value_index is not None:
+            self.value_index.removed(removed_node)
+        if self.render_cache is not None:
+            self.render_cache.removed(index)
         return True
 
 
+    def trim(self):
+        """
+        Removes the last node from the list, stepping back through the tail's prev link.
+        Time complexity: O(1)
+        """
+
+        return self.remove(self.size - 1)
+
+
     def contains(self, value: int):
         """
         Determines if the list contains a node with the specified value.
-        Time complexity: O(n)
+        Time complexity: O(n), or O(1) with the value index
         """
 
+        if self.value_index is not None:
+            return self.value_index.count(value) > 0
+
         forward = self.head
         backward = self.tail
 
-        for _ in range((self.size // 2) + 1):
-            if forward.value == value or backward.value == value: return True
+        # (size + 1) // 2 steps meet in the middle and take none on an empty list
+        half = (self.size + 1) // 2
+        for step in range(half):
+            if forward.value == value or backward.value == value:
+                if self.stats is not None:
+                    self.stats.hops += 2 * step
+                return True
             forward = forward.next
             backward = backward.prev
+        if self.stats is not None:
+            self.stats.hops += 2 * half
 
         return False
 
@@ -146,7 +289,7 @@ class DoublyLinkedList(SinglyLinkedList):
         return False
 
 
-    def has_cycle(self):
+    def has_cycle(self, method: int = 1, verify: bool = False):
         """Overriding parent method because doubly linked list cannot have a cycle."""
         return False
 
@@ -162,135 +305,137 @@ class DoublyLinkedList(SinglyLinkedList):
             current_node.prev, current_node.next = current_node.next, current_node.prev
             current_node = current_node.prev
         self.head, self.tail = self.tail, self.head
+        self._relinked(reversed_order=True)
+        if self.stats is not None:
+            self.stats.hops += self.size
         return True
 
 
-    def sort(self, method: int = 1) -> bool:
-        """
-        Sorts the linked list in place.
-        method=1: Merge sort
-        method=2: Insertion sort
-        """
-
-        try:
-            if self.has_cycle():
-                raise CycleDetectedException(sys._getframe().f_code.co_name)
-            if self.size <= 1:
-                return True
-
-            if method == 1:
-                def split(head: Node | None):
-                    if head is None or head.next is None:
-                        return head, None
-                    slow = head
-                    fast = head
-                    prev = None
-                    while fast and fast.next:
-                        prev = slow
-                        slow = slow.next
-                        fast = fast.next.next
-                    if prev:
-                        prev.next = None
-                    if slow:
-                        slow.prev = None
-                    return head, slow
-
-                def merge(left: Node | None, right: Node | None):
-                    if left is None:
-                        tail = right
-                        while tail and tail.next:
-                            tail = tail.next
-                        return right, tail
-                    if right is None:
-                        tail = left
-                        while tail and tail.next:
-                            tail = tail.next
-                        return left, tail
-
+    def _sort_nodes(self, method: int):
+        """Relinks the nodes in order with the selected method, in both directions, and sets head and tail."""
+        if self.stats is not None and method == 1:
+            # the walks of top-down merge sort depend only on the list size
+            self.stats.hops += merge_sort_hops(self.size)
+        if method == 1:
+            def split(head: Node | None):
+                if head is None or head.next is None:
+                    return head, None
+                slow = head
+                fast = head
+                prev = None
+                while fast and fast.next:
+                    prev = slow
+                    slow = slow.next
+                    fast = fast.next.next
+                if prev:
+                    prev.next = None
+                if slow:
+                    slow.prev = None
+                return head, slow
+
+            def merge(left: Node | None, right: Node | None):
+                if left is None:
+                    tail = right
+                    while tail and tail.next:
+                        tail = tail.next
+                    return right, tail
+                if right is None:
+                    tail = left
+                    while tail and tail.next:
+                        tail = tail.next
+                    return left, tail
+
+                if left.value <= right.value:
+                    head = left
+                    left = left.next
+                else:
+                    head = right
+                    right = right.next
+                head.prev = None
+                tail = head
+                tail.next = None
+
+                while left and right:
                     if left.value <= right.value:
-                        head = left
+                        tail.next = left
+                        left.prev = tail
+                        tail = left
                         left = left.next
                     else:
-                        head = right
+                        tail.next = right
+                        right.prev = tail
+                        tail = right
                         right = right.next
-                    head.prev = None
-                    tail = head
                     tail.next = None
 
-                    while left and right:
-                        if left.value <= right.value:
-                            tail.next = left
-                            left.prev = tail
-                            tail = left
-                            left = left.next
-                        else:
-                            tail.next = right
-                            right.prev = tail
-                            tail = right
-                            right = right.next
-                        tail.next = None
-
-                    remainder = left if left else right
-                    if remainder:
-                        remainder.prev = tail
-                    tail.next = remainder
-                    while tail.next:
-                        tail = tail.next
-                    return head, tail
-
-                def merge_sort(head: Node | None):
-                    if head is None or head.next is None:
-                        return head, head
-                    left, right = split(head)
-                    left_head, left_tail = merge_sort(left)
-                    right_head, right_tail = merge_sort(right)
-                    return merge(left_head, right_head)
-
-                head, tail = merge_sort(self.head)
-                self.head = head
-                self.tail = tail
-                if self.head:
-                    self.head.prev = None
-                if self.tail:
-                    self.tail.next = None
-                return True
-
-            if method == 2:
-                sorted_head = None
-                sorted_tail = None
-                current = self.head
-                while current:
-                    next_node = current.next
-                    current.prev = None
-                    current.next = None
-                    if sorted_head is None:
-                        sorted_head = current
-                        sorted_tail = current
-                    elif current.value <= sorted_head.value:
-                        current.next = sorted_head
-                        sorted_head.prev = current
-                        sorted_head = current
+                remainder = left if left else right
+                if remainder:
+                    remainder.prev = tail
+                tail.next = remainder
+                while tail.next:
+                    tail = tail.next
+                return head, tail
+
+            def merge_sort(head: Node | None):
+                if head is None or head.next is None:
+                    return head, head
+                left, right = split(head)
+                left_head, left_tail = merge_sort(left)
+                right_head, right_tail = merge_sort(right)
+                return merge(left_head, right_head)
+
+            head, tail = merge_sort(self.head)
+            self.head = head
+            self.tail = tail
+            if self.head:
+                self.head.prev = None
+            if self.tail:
+                self.tail.next = None
+            return
+
+        if method == 2:
+            hops = 0
+            sorted_head = None
+            sorted_tail = None
+            current = self.head
+            while current:
+                next_node = current.next
+                current.prev = None
+                current.next = None
+                if sorted_head is None:
+                    sorted_head = current
+                    sorted_tail = current
+                elif current.value <= sorted_head.value:
+                    current.next = sorted_head
+                    sorted_head.prev = current
+                    sorted_head = current
+                else:
+                    search = sorted_head
+                    while search.next and search.next.value <= current.value:
+                        search = search.next
+                        hops += 1
+                    current.next = search.next
+                    current.prev = search
+                    if search.next:
+                        search.next.prev = current
                     else:
-                        search = sorted_head
-                        while search.next and search.next.value <= current.value:
-                            search = search.next
-                        current.next = search.next
-                        current.prev = search
-                        if search.next:
-                            search.next.prev = current
-                        else:
-                            sorted_tail = current
-                        search.next = current
-                    current = next_node
-
-                self.head = sorted_head
-                self.tail = sorted_tail
-                return True
-
-            raise ValueError("Method must be 1 (merge) or 2 (insertion).")
-        except CycleDetectedException as e:
-            print(e)
-        except ValueError as e:
-            print(e)
-
-        return False
+                        sorted_tail = current
+                    search.next = current
+                current = next_node
+                hops += 1
+
+            self.head = sorted_head
+            self.tail = sorted_tail
+            self._count_hops(hops)
+            return
+
+        if method == 3:
+            # the merge only relinks next, so rebuild prev in one pass afterwards
+            self.head, self.tail = self._natural_merge_sort()
+            previous = None
+            current = self.head
+            while current is not None:
+                current.prev = previous
+                previous = current
+                current = current.next
+            self._count_hops(self.size)
@@ -0,0 +1,145 @@
+import math
+import os
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Tuple
+from constants import EXPORT_FPS
+import pygame
+from classes.visualizer import LinkedListVisualizer, Viewport
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+FRAME_NAME = "frame_{:06d}.png"
+VIDEO_SUFFIXES = frozenset([".mp4", ".mov", ".mkv", ".webm", ".avi"])
+
+
+def render_chunk(ll_type: str, operations: List[Tuple[str, List[int | float | str | bool], str]],
+                 settings: Dict[str, Any], fps: int, first: int, stop: int, frame_dir: str) -> int:
+    """
+    Renders animation ticks first..stop-1 at fps to PNG files in frame_dir on an offscreen surface.
+    Runs in a worker process under SDL's dummy video driver, so it rebuilds the frames from the operations itself.
+    Returns the number of images written.
+    """
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.display.init()
+    pygame.font.init()
+    visualizer = LinkedListVisualizer(ll_type, operations)
+    visualizer.configure(settings)
+    frames = visualizer.build_frames(operations, visualizer.node_interval)
+    font, panel_font = visualizer.load_fonts()
+    screen = pygame.Surface((visualizer.width, visualizer.height))
+    background = pygame.Surface((visualizer.width, visualizer.height))
+    viewport = Viewport()
+    scene = None
+
+    for tick in range(first, stop):
+        scene, _ = visualizer.render(screen, background, frames, tick / fps, viewport, scene, font, panel_font)
+        pygame.image.save(screen, os.path.join(frame_dir, FRAME_NAME.format(tick)))
+    pygame.quit()
+    return stop - first
+
+
+def tick_count(visualizer: LinkedListVisualizer, fps: int) -> int:
+    """Number of images needed to show the whole timeline, including its final resting frame."""
+    frames = visualizer.build_frames(visualizer.operations, visualizer.node_interval)
+    if not frames:
+        return 1
+    return math.ceil(visualizer.timeline[-1] * fps) + 1
+
+
+def export_animation(visualizer: LinkedListVisualizer, out: str, fps: int = EXPORT_FPS, workers: int | None = None) -> int:
+    """
+    Renders the animation headlessly as fast as possible instead of in wall-clock time.
+    The timeline is split into contiguous runs of ticks, one per worker process, and each worker writes numbered PNGs.
+    out ending in .gif is stitched with Pillow, a video suffix such as .mp4 is stitched with ffmpeg,
+    and any other path is used as a directory for the PNG sequence.
+    Returns the number of frames rendered.
+    """
+    suffix = os.path.splitext(out)[1].lower()
+    if suffix == ".gif" and Image is None:
+        raise ValueError("Exporting a GIF requires Pillow (pip install pillow).")
+    if suffix in VIDEO_SUFFIXES and shutil.which("ffmpeg") is None:
+        raise ValueError(f"Exporting {suffix} requires ffmpeg on the PATH.")
+
+    total = tick_count(visualizer, fps)
+    workers = max(1, min(workers or os.cpu_count() or 1, total))
+    settings = {
+        "width": visualizer.width,
+        "height": visualizer.height,
+        "node_interval": visualizer.node_interval,
+        "arrow_interval": visualizer.arrow_interval,
+    }
+    stitched = suffix == ".gif" or suffix in VIDEO_SUFFIXES
+    frame_dir = tempfile.mkdtemp(prefix="llv_frames_") if stitched else out
+    os.makedirs(frame_dir, exist_ok=True)
+
+    try:
+        bounds = [total * worker // workers for worker in range(workers + 1)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(render_chunk, visualizer.ll_type, visualizer.operations, settings, fps,
+                            bounds[worker], bounds[worker + 1], frame_dir)
+                for worker in range(workers)
+            ]
+            rendered = sum(future.result() for future in futures)
+
+        if suffix == ".gif":
+            write_gif(frame_dir, out, total, fps)
+        elif suffix in VIDEO_SUFFIXES:
+            write_video(frame_dir, out, fps)
+    finally:
+        if stitched:
+            shutil.rmtree(frame_dir, ignore_errors=True)
+    return rendered
+
+
+def load_frame(frame_dir: str, tick: int):
+    """Reads one frame into memory and closes its file."""
+    with Image.open(os.path.join(frame_dir, FRAME_NAME.format(tick))) as image:
+        return image.copy()
+
+
+def stream_frames(frame_dir: str, first: int, stop: int):
+    """
+    Yields frames first..stop-1 one at a time, closing each once the GIF writer asks for the next,
+    so a long timeline never holds a file handle per frame.
+    """
+    for tick in range(first, stop):
+        frame = load_frame(frame_dir, tick)
+        try:
+            yield frame
+        finally:
+            frame.close()
+
+
+def write_gif(frame_dir: str, out: str, total: int, fps: int):
+    first = load_frame(frame_dir, 0)
+    try:
+        first.save(out, save_all=True, append_images=stream_frames(frame_dir, 1, total),
+                   duration=round(1000 / fps), loop=0)
+    finally:
+        first.close()
+
+
+def write_video(frame_dir: str, out: str, fps: int):
+    try:
+        subprocess.run(
+            [
+                "ffmpeg", "-y", "-loglevel", "error",
+                "-framerate", str(fps),
+                "-i", os.path.join(frame_dir, "frame_%06d.png"),
+                "-pix_fmt", "yuv420p",
+                "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+                out,
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except subprocess.CalledProcessError as e:
+        raise ValueError(f"ffmpeg could not write {out} (exit status {e.returncode}): {e.stderr.strip()}") from e
@@ -1,42 +1,94 @@
 from classes.singly_linked_list import SinglyLinkedList
 from classes.doubly_linked_list import DoublyLinkedList
-from utils import filter_values
-from typing import List, Tuple, Any
+from classes.array_linked_list import ArraySinglyLinkedList, ArrayDoublyLinkedList
+from classes.replay_tracer import ReplayTracer
+from constants import PROGRESS_INTERVAL, VALUE_TYPES
+from typing import List, Tuple, Any, Iterable, Optional, Callable
 
 
 class LinkedList:
     @staticmethod
-    def create(ll_type: str = "singly") -> SinglyLinkedList | DoublyLinkedList:
-        """Returns a new, empty linked list of the specified type."""
+    def create(ll_type: str = "singly", storage: str = "node", indexed: bool = False,
+               value_indexed: bool = False, stats: bool = False) -> SinglyLinkedList | DoublyLinkedList:
+        """
+        Returns a new, empty linked list of the specified type.
+        storage="node" links Node objects; storage="array" keeps values and links in parallel arrays.
+        indexed=True enables the position index of a node-backed list, value_indexed=True its value index,
+        and stats=True its operation stats.
+        """
 
+        if storage not in ["node", "array"]:
+            raise ValueError(f"Unknown storage engine '{storage}'.")
         if ll_type.lower() in ["s", "singly"]:
-            return SinglyLinkedList()
+            ll = SinglyLinkedList() if storage == "node" else ArraySinglyLinkedList()
         elif ll_type.lower() in ["d", "doubly"]:
-            return DoublyLinkedList()
+            ll = DoublyLinkedList() if storage == "node" else ArrayDoublyLinkedList()
         else:
             raise ValueError(f"Unknown linked list type '{ll_type}'.")
+        # array storage raises ValueError for each of these
+        if indexed:
+            ll.enable_position_index()
+        if value_indexed:
+            ll.enable_value_index()
+        if stats:
+            ll.enable_stats()
+
+        return ll
 
 
     @staticmethod
-    def build_from_values(ll_type: str, values: List[Any]) -> SinglyLinkedList | DoublyLinkedList:
+    def build_from_values(ll_type: str, values: List[Any], storage: str = "node",
+                          value_indexed: bool = False, stats: bool = False) -> SinglyLinkedList | DoublyLinkedList:
         """Uses a list of values to build a linked list."""
-        filtered_values = filter_values(values)
-        ll = LinkedList.create(ll_type)
-        ll.append_values(filtered_values)
+        ll = LinkedList.create(ll_type, storage, value_indexed=value_indexed, stats=stats)
+        ll.append_values(values)
 
         return ll
 
 
     @staticmethod
-    def build_from_ops(ll_type: str, operations: List[Tuple[str, List[int | float | str | bool], str]]) -> SinglyLinkedList | DoublyLinkedList:
+    def build_from_ops(ll_type: str, operations: Iterable[Tuple[str, List[int | float | str | bool], str]], storage: str = "node",
+                       indexed: bool = False, progress: Optional[Callable[[int, int], None]] = None,
+                       value_indexed: bool = False, stats: bool = False,
+                       tracer: Optional[ReplayTracer] = None) -> SinglyLinkedList | DoublyLinkedList:
         """Uses a list of operations to build a linked list."""
-        ll = LinkedList.create(ll_type)
+        ll = LinkedList.create(ll_type, storage, indexed, value_indexed, stats)
+        LinkedList.replay_ops(ll, operations, progress, tracer)
+
+        return ll
+
+
+    @staticmethod
+    def replay_ops(ll: SinglyLinkedList | DoublyLinkedList, operations: Iterable[Tuple[str, List[int | float | str | bool], str]],
+                   progress: Optional[Callable[[int, int], None]] = None,
+                   tracer: Optional[ReplayTracer] = None) -> int:
+        """
+        Applies operations to ll one at a time as the iterable yields them, so a generator is never materialized.
+        progress, if given, is called with (operations replayed, list size) every PROGRESS_INTERVAL operations and at the end.
+        tracer, if given, records a span for each operation; the caller closes it.
+        Also applies the append_values, prepend_values and insert_remove operations OpsOptimizer writes.
+        Returns the number of operations replayed.
+        """
+        count = 0
         for op in operations:
+            if tracer is not None:
+                size = ll.size
+                start = tracer.clock()
             match op[0]:
                 case "append":
                     ll.append(op[1][0])
                 case "prepend":
                     ll.prepend(op[1][0])
+                case "append_values":
+                    ll.append_values(op[1])
+                case "prepend_values":
+                    ll.prepend_values(op[1])
+                case "insert_remove":
+                    index, value = op[1]
+                    # strictly inside a list without a cycle the insert lands at index and the remove takes it back out
+                    if not (0 < index < ll.size and type(value) in VALUE_TYPES and not ll.has_cycle()):
+                        ll.insert(index, value)
+                        ll.remove(index)
                 case "insert":
                     ll.insert(op[1][0], op[1][1])
                 case "remove":
@@ -50,5 +102,12 @@ class LinkedList:
                     print(f"Has cycle: {result}")
                 case _:
                     raise ValueError(f"Unknown operation type '{op[0]}' in operations file.")
+            if tracer is not None:
+                tracer.span(op[0], op[1], op[2], size, start, tracer.clock())
+            count += 1
+            if progress and count % PROGRESS_INTERVAL == 0:
+                progress(count, ll.size)
 
-        return ll
\ No newline at end of file
+        if progress:
+            progress(count, ll.size)
+        return count
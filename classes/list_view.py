@@ -0,0 +1,44 @@
+from itertools import islice
+from typing import Any, Iterator
+
+
+class LinkedListView:
+    """
+    Lazy view of a run of positions in a linked list, as returned by slicing one.
+    Making the view copies nothing; iterating it walks to the first position once and then follows next links.
+    The positions are fixed when the list is sliced, so later edits shift the values the view reads.
+    A negative step reads the covered span forwards and yields it backwards, since a singly list cannot walk back.
+    """
+    __slots__ = ("ll", "positions")
+
+    def __init__(self, ll: Any, positions: range):
+        self.ll = ll
+        self.positions = positions
+
+
+    def __len__(self):
+        return len(self.positions)
+
+
+    def __iter__(self) -> Iterator[int | float | str | bool]:
+        positions = self.positions
+        if not positions:
+            return iter(())
+
+        first = min(positions[0], positions[-1])
+        span = abs(positions[-1] - positions[0]) + 1
+        values = islice(self.ll.iter_from(self.ll.get_node(first)), span)
+        if positions.step > 0:
+            return islice(values, 0, None, positions.step)
+        return iter(list(values)[::positions.step])
+
+
+    def __getitem__(self, index: int | slice):
+        if isinstance(index, slice):
+            return LinkedListView(self.ll, self.positions[index])
+        return self.ll[self.positions[index]]
+
+
+    def __repr__(self):
+        positions = self.positions
+        return f"LinkedListView(start={positions.start}, stop={positions.stop}, step={positions.step})"
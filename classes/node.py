@@ -1,11 +1,11 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     """Class for a single node in a linked list."""
     value: int | float | str | bool
-    prev = None
-    next = None
+    prev: "Node | None" = field(default=None, compare=False, repr=False)
+    next: "Node | None" = field(default=None, compare=False, repr=False)
 
     def __repr__(self):
         return f"Node[{self.value}]"
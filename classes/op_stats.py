@@ -0,0 +1,116 @@
+import time
+from typing import Any, Callable
+
+# Public methods timed once stats are enabled on a list
+STATS_METHODS = (
+    "append", "append_values", "prepend", "prepend_values", "insert", "replace", "trim", "remove", "clear",
+    "get_node", "get_values", "contains", "count", "find_all", "index_of",
+    "create_cycle", "has_cycle", "get_cycle_start_index", "reverse", "sort",
+)
+
+
+class MethodStats:
+    """
+    Totals for one method. Time, hops and node counts include those of the methods it calls.
+    allocated and freed are the net growth and shrinkage of the list per call, not node constructions:
+    a call that frees and allocates the same number of nodes, or rewrites values in place, adds to neither.
+    """
+    __slots__ = ("calls", "seconds", "hops", "allocated", "freed")
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.hops = 0
+        self.allocated = 0
+        self.freed = 0
+
+
+class OpStats:
+    """
+    Instrumentation for a node-backed linked list: calls and wall time per public method, pointer hops,
+    and the net change in nodes.
+    attach shadows each method in STATS_METHODS with a timing wrapper on the instance itself, so a list without
+    stats runs the plain class methods and pays nothing for them. Nodes allocated and freed are read from the change
+    in size around a call, so they are net counts. Hops are added by every walk over the nodes: locating a position
+    or value, iteration, the tail path refill, reverse, the sort methods and the cycle finders run with verify.
+    Walks that count hop by hop add their total once they finish; merge sort's hops depend only on the size
+    and are computed from it, and each natural merge counts the nodes of both runs it joins.
+    """
+
+    def __init__(self):
+        self.hops = 0
+        self.allocated = 0
+        self.freed = 0
+        self.seconds = 0.0
+        self.methods: dict[str, MethodStats] = {}
+        self.depth = 0
+
+
+    def attach(self, ll: Any):
+        for name in STATS_METHODS:
+            method = getattr(type(ll), name, None)
+            if method is not None:
+                setattr(ll, name, self.wrap(ll, name, method.__get__(ll)))
+
+
+    def detach(self, ll: Any):
+        for name in STATS_METHODS:
+            ll.__dict__.pop(name, None)
+
+
+    def wrap(self, ll: Any, name: str, method: Callable) -> Callable:
+        record = self.methods.setdefault(name, MethodStats())
+        clock = time.perf_counter
+
+        def timed(*args, **kwargs):
+            hops = self.hops
+            size = ll.size
+            self.depth += 1
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                self.depth -= 1
+                change = ll.size - size
+                record.calls += 1
+                record.seconds += elapsed
+                record.hops += self.hops - hops
+                if change > 0:
+                    record.allocated += change
+                else:
+                    record.freed -= change
+                # only the outermost call adds to the list totals, so nested calls are not counted twice
+                if self.depth == 0:
+                    self.seconds += elapsed
+                    if change > 0:
+                        self.allocated += change
+                    else:
+                        self.freed -= change
+
+        timed.__name__ = name
+        timed.__doc__ = method.__doc__
+        return timed
+
+
+    def reset(self):
+        self.hops = self.allocated = self.freed = 0
+        self.seconds = 0.0
+        for record in self.methods.values():
+            record.__init__()
+
+
+    def report(self) -> str:
+        """Returns a table of the methods called so far, slowest first, under a line of list totals."""
+        lines = [
+            f"Operation stats | {self.seconds * 1e3:,.3f} ms, {self.hops:,} hops, "
+            f"{self.allocated:,} nodes allocated, {self.freed:,} freed",
+            f"{'method':<24}{'calls':>10}{'total ms':>12}{'µs/call':>10}{'hops':>14}{'allocated':>11}{'freed':>9}",
+        ]
+        called = [(name, record) for name, record in self.methods.items() if record.calls]
+        called.sort(key=lambda item: item[1].seconds, reverse=True)
+        for name, record in called:
+            lines.append(f"{name:<24}{record.calls:>10,}{record.seconds * 1e3:>12.3f}"
+                         f"{record.seconds / record.calls * 1e6:>10.2f}{record.hops:>14,}"
+                         f"{record.allocated:>11,}{record.freed:>9,}")
+        return "\n".join(lines)
@@ -0,0 +1,111 @@
+from typing import Any, Iterable, Iterator, List, Tuple
+from constants import OPTIMIZE_MIN_RUN, OPTIMIZE_RUN_LIMIT, VALUE_TYPES
+
+Operation = Tuple[str, List[int | float | str | bool], str]
+
+
+class OpsOptimizer:
+    """
+    Rewrites a stream of parsed operations into a shorter one that leaves LinkedList.replay_ops with the same list.
+    - A run of appends becomes one append_values and a run of prepends one prepend_values, spliced in a single pass.
+    - An insert followed by a remove at the same index becomes insert_remove. Only the list knows whether the insert
+      lands at that index, so replay_ops decides: it skips the pair when the index is strictly inside a list without
+      a cycle and the value has a valid type, and otherwise runs both operations as written.
+    - A replace is dropped when a later replace at the same index, with a value of a valid type, follows with
+      only other replaces in between. Replaces never move nodes, so the same index still names the same node.
+    Runs shorter than OPTIMIZE_MIN_RUN are left alone; a few single appends replay faster than setting up a splice.
+    Any other operation, including cycle and the has_cycle read, ends the pending run or group before it is emitted.
+    Operations are read lazily and a run holds at most OPTIMIZE_RUN_LIMIT values, so memory stays bounded.
+    """
+
+    def __init__(self):
+        self.read = 0
+        self.folded = 0
+        self.bulk = 0
+        self.paired = 0
+        self.superseded = 0
+
+
+    @property
+    def written(self) -> int:
+        return self.read - (self.folded - self.bulk) - self.paired - self.superseded
+
+
+    def optimize(self, operations: Iterable[Operation]) -> Iterator[Operation]:
+        run_command = None
+        # values only: a long run of operation tuples would keep the garbage collector busy
+        run: List[Any] = []
+        held_insert = None
+        # index -> latest replace at it; re-adding a key moves it to the end, so survivors keep their original order
+        replaces: dict[int, Operation] = {}
+        read = 0
+
+        try:
+            for op in operations:
+                read += 1
+                command = op[0]
+                # most of a recorded stream is runs of appends, so extending a run is checked first
+                if command == run_command and len(run) < OPTIMIZE_RUN_LIMIT:
+                    run.append(op[1][0])
+                    continue
+
+                if held_insert is not None:
+                    held, held_insert = held_insert, None
+                    if command == "remove" and op[1][0] == held[1][0]:
+                        self.paired += 1
+                        yield "insert_remove", held[1], f"{held[2]}; {op[2]}"
+                        continue
+                    yield held
+
+                if run:
+                    yield from self.fold(run_command, run)
+                    run_command = None
+                    run = []
+                if command in ("append", "prepend"):
+                    if replaces:
+                        yield from replaces.values()
+                        replaces.clear()
+                    run_command = command
+                    run.append(op[1][0])
+                    continue
+
+                if command == "replace" and type(op[1][1]) in VALUE_TYPES:
+                    if replaces.pop(op[1][0], None) is not None:
+                        self.superseded += 1
+                    replaces[op[1][0]] = op
+                    continue
+                if replaces:
+                    yield from replaces.values()
+                    replaces.clear()
+
+                if command == "insert":
+                    held_insert = op
+                else:
+                    yield op
+
+            if held_insert is not None:
+                yield held_insert
+            yield from self.fold(run_command, run)
+            yield from replaces.values()
+        finally:
+            self.read += read
+
+
+    def fold(self, command: str, run: List[Any]) -> List[Operation]:
+        """Returns the operations a run of appended or prepended values replays as: one bulk splice, or the single ones."""
+        if len(run) < OPTIMIZE_MIN_RUN:
+            return [(command, [value], f"{command} {value}") for value in run]
+        self.folded += len(run)
+        self.bulk += 1
+        if command == "append":
+            return [("append_values", run, f"append x{len(run)}")]
+        # prepending one at a time leaves the last value first
+        return [("prepend_values", run[::-1], f"prepend x{len(run)}")]
+
+
+    def report(self) -> str:
+        eliminated = self.read - self.written
+        share = eliminated / self.read * 100 if self.read else 0.0
+        return (f"Optimized {self.read:,} operations to {self.written:,} ({eliminated:,} eliminated, {share:.1f}%): "
+                f"{self.folded:,} appends/prepends folded into bulk splices, {self.paired:,} insert/remove pairs checked at replay, "
+                f"{self.superseded:,} superseded replaces")
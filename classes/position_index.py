@@ -0,0 +1,210 @@
+from math import isqrt
+from classes.node import Node
+
+MIN_BLOCK_SIZE = 32
+
+
+class PositionIndex:
+    """
+    Chunked positional index over the nodes of a linked list.
+    The list is cut into blocks of consecutive nodes and the index keeps the first node and node count of each block.
+    Finding a position scans the block counts and then walks inside one block,
+    so lookups cost O(n / block_size + block_size), which is O(√n) while block_size tracks √n.
+    """
+
+    def __init__(self):
+        self.block_size: int = MIN_BLOCK_SIZE
+        self.starts: list[Node] = []
+        self.counts: list[int] = []
+        self.size: int = 0
+
+
+    def rebuild(self, head: Node | None, size: int):
+        """
+        Re-cuts the whole list into blocks of about √size nodes.
+        Time complexity: O(n)
+        """
+
+        self.block_size = max(MIN_BLOCK_SIZE, isqrt(size))
+        self.starts = []
+        self.counts = []
+        self.size = size
+
+        current_node = head
+        for index in range(size):
+            if index % self.block_size == 0:
+                self.starts.append(current_node)
+                self.counts.append(0)
+            self.counts[-1] += 1
+            current_node = current_node.next
+
+
+    def locate(self, index: int) -> tuple[int, int]:
+        """
+        Returns (block, offset) of the node at index.
+        Time complexity: O(n / block_size)
+        """
+
+        if index >= self.size - self.counts[-1]:
+            return len(self.counts) - 1, index - (self.size - self.counts[-1])
+        for block, count in enumerate(self.counts):
+            if index < count:
+                return block, index
+            index -= count
+        return len(self.counts) - 1, index
+
+
+    def node_at(self, index: int) -> Node:
+        """
+        Returns the node at index, which must be in range.
+        Time complexity: O(√n)
+        """
+
+        block, offset = self.locate(index)
+        current_node = self.starts[block]
+        for _ in range(offset):
+            current_node = current_node.next
+        return current_node
+
+
+    def inserted(self, index: int, node: Node):
+        """
+        Records that node now sits at index and every node after it moved up one position.
+        Time complexity: O(√n)
+        """
+
+        if self.size == 0:
+            self.starts = [node]
+            self.counts = [1]
+            self.size = 1
+            return
+
+        if index == 0:
+            block = 0
+            self.starts[0] = node
+        elif index >= self.size:
+            block = len(self.counts) - 1
+        else:
+            # the new node joins the block of its predecessor
+            block = self.locate(index - 1)[0]
+        self.counts[block] += 1
+        self.size += 1
+
+        if self.counts[block] > 2 * self.block_size:
+            self.split(block)
+
+
+    def spliced(self, index: int, first_node: Node, count: int):
+        """
+        Records a chain of count nodes starting with first_node spliced in at index 0 or at the end of the list.
+        The chain tops up the neighbouring block before new blocks are cut, so many small splices do not fragment the index.
+        Time complexity: O(k)
+        """
+
+        if index == 0 and self.counts and self.counts[0] + count <= self.block_size:
+            self.starts[0] = first_node
+            self.counts[0] += count
+            self.size += count
+            return
+
+        current_node = first_node
+        topped_up = 0
+        if index != 0 and self.counts:
+            # top up the last block before cutting new ones
+            topped_up = min(count, max(0, self.block_size - self.counts[-1]))
+            self.counts[-1] += topped_up
+            for _ in range(topped_up):
+                current_node = current_node.next
+
+        starts = []
+        counts = []
+        for position in range(count - topped_up):
+            if position % self.block_size == 0:
+                starts.append(current_node)
+                counts.append(0)
+            counts[-1] += 1
+            current_node = current_node.next
+
+        if index == 0:
+            self.starts[0:0] = starts
+            self.counts[0:0] = counts
+        else:
+            self.starts.extend(starts)
+            self.counts.extend(counts)
+        self.size += count
+        while len(self.counts) > 2 * self.block_size:
+            self.grow_blocks()
+
+
+    def removed(self, index: int, next_node: Node | None):
+        """
+        Records that the node at index was unlinked and next_node took its place.
+        Time complexity: O(n / block_size)
+        """
+
+        block, offset = self.locate(index)
+        self.counts[block] -= 1
+        self.size -= 1
+        if self.counts[block] == 0:
+            del self.starts[block]
+            del self.counts[block]
+            return
+        if offset == 0:
+            self.starts[block] = next_node
+        if self.counts[block] < self.block_size // 2:
+            self.merge(block)
+
+
+    def merge(self, block: int):
+        """
+        Folds an undersized block into a neighbour, the counterpart of split, so heavy removal does not leave
+        a long run of tiny blocks for locate to scan. The smaller neighbour is chosen, and the merge is skipped
+        if it would make a block large enough to split again. Needs no node walks.
+        Time complexity: O(n / block_size)
+        """
+
+        neighbours = [other for other in (block - 1, block + 1) if 0 <= other < len(self.counts)]
+        if not neighbours:
+            return
+        other = min(neighbours, key=self.counts.__getitem__)
+        first, second = min(block, other), max(block, other)
+        if self.counts[first] + self.counts[second] > 2 * self.block_size:
+            return
+        self.counts[first] += self.counts[second]
+        del self.starts[second]
+        del self.counts[second]
+
+
+    def split(self, block: int):
+        """
+        Splits an oversized block in two, then doubles the block size once there are too many blocks.
+        Time complexity: O(√n)
+        """
+
+        first_count = self.counts[block] // 2
+        current_node = self.starts[block]
+        for _ in range(first_count):
+            current_node = current_node.next
+        self.starts.insert(block + 1, current_node)
+        self.counts.insert(block + 1, self.counts[block] - first_count)
+        self.counts[block] = first_count
+
+        if len(self.counts) > 2 * self.block_size:
+            self.grow_blocks()
+
+
+    def grow_blocks(self):
+        """
+        Doubles the block size by merging neighbouring blocks, which needs no node walks.
+        Time complexity: O(n / block_size)
+        """
+
+        self.starts = self.starts[::2]
+        self.counts = [sum(self.counts[i:i + 2]) for i in range(0, len(self.counts), 2)]
+        self.block_size *= 2
+
+
+    def clear(self):
+        self.starts = []
+        self.counts = []
+        self.size = 0
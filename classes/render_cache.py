@@ -0,0 +1,61 @@
+from typing import Any, Iterable
+
+
+class RenderCache:
+    """
+    String form of every value of a linked list, in list order.
+    The list builds it the first time it is printed in full and then patches it from every mutator,
+    so printing again only joins the strings instead of walking the nodes and converting each value.
+    Patches are list operations by position, which run in C without a walk.
+    """
+
+    def __init__(self, values: Iterable[Any]):
+        self.parts: list[str] = list(map(str, values))
+        self.joined: dict[str, str] = {}
+
+
+    def __len__(self):
+        return len(self.parts)
+
+
+    def join(self, separator: str) -> str:
+        """
+        Returns every value string joined by separator, reusing the previous result until the next change.
+        Time complexity: O(length of the result), O(1) when unchanged
+        """
+
+        text = self.joined.get(separator)
+        if text is None:
+            text = self.joined[separator] = separator.join(self.parts)
+        return text
+
+
+    def width(self, count: int) -> int:
+        """Total length of the first count value strings."""
+        return sum(map(len, self.parts[:count]))
+
+
+    def inserted(self, index: int, value: Any):
+        self.parts.insert(index, str(value))
+        self.joined.clear()
+
+
+    def extended(self, index: int, values: Iterable[Any]):
+        """Inserts the strings of a batch of values starting at index."""
+        self.parts[index:index] = map(str, values)
+        self.joined.clear()
+
+
+    def replaced(self, index: int, value: Any):
+        self.parts[index] = str(value)
+        self.joined.clear()
+
+
+    def removed(self, index: int):
+        del self.parts[index]
+        self.joined.clear()
+
+
+    def reversed(self):
+        self.parts.reverse()
+        self.joined.clear()
@@ -0,0 +1,77 @@
+import json
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, List, Optional
+
+# Commands whose first argument is a position in the list
+INDEXED_COMMANDS = frozenset(["insert", "remove", "replace", "cycle", "insert_remove"])
+
+
+class ReplayTracer:
+    """
+    Records a span for every operation LinkedList.replay_ops applies, tagged with the command, its index,
+    the list size before it ran and its source line.
+    Spans are streamed to path as Chrome trace-event JSON, which chrome://tracing and ui.perfetto.dev open,
+    so a replay of millions of operations never holds its trace in memory.
+    close() also writes path with a .folded suffix: collapsed stacks of replay;command;position with the
+    microseconds spent in each, for flamegraph.pl or speedscope. Positions are head, tail or the tenth of the
+    list the index fell in, which shows at a glance when a replay keeps inserting deep into a long list.
+    """
+
+    def __init__(self, path: str, name: str = "replay"):
+        self.path = Path(path)
+        self.folded_path = self.path.with_suffix(".folded")
+        self.name = name
+        self.count = 0
+        self.stacks: dict[str, float] = defaultdict(float)
+        self.clock = time.perf_counter
+        self.origin = self.clock()
+        self.handle = open(self.path, "w", encoding="utf-8")
+        self.handle.write('{"displayTimeUnit": "ms", "traceEvents": [\n')
+        self.handle.write(json.dumps({"name": "process_name", "ph": "M", "pid": 1, "tid": 1,
+                                      "args": {"name": name}}))
+
+
+    def span(self, command: str, args: List[Any], line: str, size: int, start: float, end: float):
+        """Records one operation that ran from start to end, as read from the tracer's clock, on a list of size nodes."""
+        index = args[0] if command in INDEXED_COMMANDS else None
+        micros = (end - start) * 1e6
+        self.handle.write(",\n" + json.dumps({
+            "name": command, "cat": "op", "ph": "X", "pid": 1, "tid": 1,
+            "ts": round((start - self.origin) * 1e6, 3), "dur": round(micros, 3),
+            "args": {"op": self.count, "index": index, "size": size,
+                     "line": line or f"{command} {' '.join(map(str, args))}".rstrip()},
+        }))
+        self.stacks[f"{self.name};{command};{self.position(command, index, size)}"] += micros
+        self.count += 1
+
+
+    @staticmethod
+    def position(command: str, index: Optional[int], size: int) -> str:
+        """Where in the list an operation landed: head, tail, a tenth of the list such as 40-50%, or - for none."""
+        if command in ("append", "append_values"):
+            return "tail"
+        if command in ("prepend", "prepend_values"):
+            return "head"
+        if index is None:
+            return "-"
+        if index <= 0:
+            return "head"
+        # insert at size appends; the other indexed commands address the last node at size - 1
+        if index >= size - (command not in ("insert", "insert_remove")):
+            return "tail"
+        tenth = index * 10 // size * 10
+        return f"{tenth}-{tenth + 10}%"
+
+
+    def close(self):
+        """Finishes the trace JSON and writes the collapsed stacks. Returns the number of spans recorded."""
+        if self.handle.closed:
+            return self.count
+        self.handle.write("\n]}\n")
+        self.handle.close()
+        with open(self.folded_path, "w", encoding="utf-8") as folded:
+            for stack, micros in sorted(self.stacks.items()):
+                folded.write(f"{stack} {max(1, round(micros))}\n")
+        return self.count
@@ -1,36 +1,163 @@
 import sys
+from itertools import islice
 from classes.node import Node
-from typing import Optional
-from constants import PRINT_ARROW_SINGLE as LINK_ARROW, PRINT_ARROW_UP, PRINT_ARROW_DOWN, PRINT_ARROW_LEFT, PRINT_COLOR, RESET
+from classes.position_index import PositionIndex
+from typing import Optional, Iterable, Iterator, Callable
+from classes.list_view import LinkedListView
+from classes.op_stats import OpStats
+from classes.render_cache import RenderCache
+from classes.sorting import SortKey, comparable, external_sorted, merge_sort_hops
+from classes.value_index import ValueIndex
+from constants import PRINT_ARROW_SINGLE as LINK_ARROW, PRINT_ARROW_UP, PRINT_ARROW_DOWN, PRINT_ARROW_LEFT, PRINT_ELLIPSIS
+from constants import PRINT_COLOR, RESET, SHOW_MAX_ITEMS, SORT_METHODS
 from classes.linked_list_exceptions import *
-from utils import filter_values
+from constants import VALUE_TYPES
+
+# Most nodes remembered on the path leading up to the tail
+TAIL_PATH_LIMIT = 1024
 
 class SinglyLinkedList:
+    title = "Singly Linked List"
+    link_arrow = LINK_ARROW
+
     def __init__(self, initial_node_value: Any = None):
         self.head: Node | None = Node(initial_node_value) if initial_node_value else None
         self.tail: Node | None = self.head
         self.size: int = 0 if initial_node_value is None else 1
+        self.cycle_start: Node | None = None
+        self.position_index: PositionIndex | None = None
+        self.value_index: ValueIndex | None = None
+        # Nodes leading up to the tail, nearest last, so trim can step back without a walk from the head
+        self.tail_path: list[Node] = []
+        # Value strings for printing, built by the first full rendering and then patched by every mutator
+        self.render_cache: RenderCache | None = None
+        # Per-method calls, time, pointer hops and node counts, kept only while enable_stats is on
+        self.stats: OpStats | None = None
 
         
     def __len__(self):
         return self.size
 
 
+    def __iter__(self) -> Iterator[int | float | str | bool]:
+        """
+        Yields the values from head to tail without building a list.
+        Stops after size nodes, so a list whose tail links back into it still ends.
+        Time complexity: O(1) per value
+        """
+
+        current_node = self.head
+        visited = 0
+        try:
+            for visited in range(1, self.size + 1):
+                yield current_node.value
+                current_node = current_node.next
+        finally:
+            if self.stats is not None:
+                self.stats.hops += visited
+
+
+    def __reversed__(self) -> Iterator[int | float | str | bool]:
+        """
+        Yields the values from tail to head.
+        A singly list has no back links, so this collects the values first.
+        Time complexity: O(n)
+        """
+
+        return reversed(self.get_values())
+
+
+    def __getitem__(self, index: int | slice):
+        """
+        ll[i] returns the value at position i, counting from the end for negative i.
+        ll[start:stop:step] returns a LinkedListView, which reads the values lazily when iterated.
+        Time complexity: O(n) for an index, O(1) for a slice
+        """
+
+        if isinstance(index, slice):
+            return LinkedListView(self, range(*index.indices(self.size)))
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("linked list index out of range")
+        return self.get_node(index).value
+
+
+    def __contains__(self, value: int | float | str | bool) -> bool:
+        return self.contains(value)
+
+
+    def iter_from(self, node: Node | None) -> Iterator[int | float | str | bool]:
+        """
+        Yields the values from node, which must belong to this list, through the tail.
+        Like __iter__ the walk is bounded, ending at the tail even when the tail links back into the list.
+        Time complexity: O(1) per value
+        """
+
+        current_node = node
+        tail = self.tail
+        visited = 0
+        try:
+            for visited in range(1, self.size + 1):
+                if current_node is None:
+                    return
+                yield current_node.value
+                if current_node is tail:
+                    return
+                current_node = current_node.next
+        finally:
+            if self.stats is not None:
+                self.stats.hops += visited
+
+
     def __str__(self):
         """
-        Iterates through the linked list and appends node values to a list.
-        Uses list size instead of current_node to avoid infinite loop when list has a cycle.
+        Renders every value, drawing the cycle under them when the tail links back into the list.
+        Time complexity: O(n) the first time, then O(length of the output); see to_string
+        """
+
+        return self.to_string()
+
+
+    def to_string(self, start: Optional[int] = None, stop: Optional[int] = None, max_items: Optional[int] = None) -> str:
+        """
+        Renders the list for printing.
+        Given start or stop, only positions start..stop-1 are rendered, with an ellipsis for each elided end.
+        Otherwise a list longer than max_items shows its first and last max_items // 2 values around an elided middle,
+        so printing a huge list reads a few nodes at either end instead of all of them.
+        The full rendering comes from the render cache, which every mutator keeps up to date once it exists.
+        Time complexity: O(n) the first time in full, then O(length of the output); O(k) for k values near either end
         """
 
-        values = self.get_values()
-        header_str = f"Singly Linked List | {self.size} Elements:"
-        node_str = f"[{LINK_ARROW.join(map(str, values))}]"
+        header_str = f"{self.title} | {self.size} Elements"
+        if start is not None or stop is not None:
+            start = max(0, min(self.size, 0 if start is None else start))
+            stop = max(start, min(self.size, self.size if stop is None else stop))
+            parts = self._value_strings(start, stop - start)
+            if start > 0: parts.insert(0, PRINT_ELLIPSIS)
+            if stop < self.size: parts.append(PRINT_ELLIPSIS)
+            header_str += f" ({start}..{stop - 1} shown):" if stop > start else " (none shown):"
+            node_str = f"[{self.link_arrow.join(parts)}]"
+            return self._format_string(header_str, node_str, self._cycle_note())
+
+        if max_items is not None and self.size > max(max_items, 2):
+            head_count = max(1, max_items // 2)
+            tail_count = max(1, max_items - head_count)
+            elided = self.size - head_count - tail_count
+            parts = self._value_strings(0, head_count)
+            parts.append(f"{PRINT_ELLIPSIS} {elided} more {PRINT_ELLIPSIS}")
+            parts.extend(self._value_strings(self.size - tail_count, tail_count))
+            header_str += f" (first {head_count} and last {tail_count} shown):"
+            node_str = f"[{self.link_arrow.join(parts)}]"
+            return self._format_string(header_str, node_str, self._cycle_note())
+
+        render_cache = self._render_cache()
+        node_str = f"[{render_cache.join(self.link_arrow)}]"
         cycle_str = ""
-        cycle_index = self.get_cycle_start_index()
-        if cycle_index:
+        cycle_index = self._cycle_index()
+        if cycle_index is not None:
             # get length to cycle index
-            value_lengths = [len(str(value)) for value in values]
-            length_to_cycle_index = sum(value_lengths[:cycle_index]) + (cycle_index * len(LINK_ARROW)) + 1
+            length_to_cycle_index = render_cache.width(cycle_index) + (cycle_index * len(self.link_arrow)) + 1
             spaces = " " * length_to_cycle_index
             cycle_str += f"{spaces}{PRINT_ARROW_UP}"
 
@@ -43,9 +170,76 @@ class SinglyLinkedList:
             back_arrows = f"{PRINT_ARROW_LEFT} " * (length_to_tail // 2 + 1)
             cycle_str += f"\n{spaces}{back_arrows}"
 
+        return self._format_string(f"{header_str}:", node_str, cycle_str)
+
+
+    @staticmethod
+    def _format_string(header_str: str, node_str: str, cycle_str: str) -> str:
         return f"\n{PRINT_COLOR}{header_str}\n{node_str}\n{cycle_str}{RESET}\n"
 
 
+    def _cycle_note(self) -> str:
+        """One line naming where the tail links back to, for renderings too short to draw the cycle."""
+        cycle_index = self._cycle_index()
+        if cycle_index is None:
+            return ""
+        return f"{PRINT_ARROW_LEFT} tail links back to {cycle_index}"
+
+
+    def _render_cache(self) -> RenderCache:
+        """Returns the render cache, building it from one walk of the list if this is the first full rendering."""
+        if self.render_cache is None:
+            self.render_cache = RenderCache(self)
+        return self.render_cache
+
+
+    def _value_strings(self, start: int, count: int) -> list[str]:
+        """Returns the strings of count values from position start, sliced from the render cache when there is one."""
+        if count <= 0:
+            return []
+        if self.render_cache is not None:
+            return self.render_cache.parts[start:start + count]
+        return list(map(str, self._values_from(start, count)))
+
+
+    def _values_from(self, start: int, count: int) -> list[int | float | str | bool]:
+        """
+        Returns the values of count nodes from position start, which must be in range.
+        Positions within TAIL_PATH_LIMIT of the tail are read from the tail path, refilling it first if it is too short,
+        so the end of the list costs one walk the first time and O(count) afterwards.
+        Time complexity: O(start + count), O(count) near the tail once the tail path is filled
+        """
+
+        path_start = self.size - 1 - len(self.tail_path)
+        if start > 0 and start >= self.size - 1 - TAIL_PATH_LIMIT:
+            if start < path_start:
+                self._repair_tail_path()
+                path_start = self.size - 1 - len(self.tail_path)
+            nodes = self.tail_path[start - path_start:]
+            nodes.append(self.tail)
+            return [node.value for node in nodes[:count]]
+
+        return list(islice(self.iter_from(self.get_node(start)), count))
+
+
+    def _cycle_index(self) -> Optional[int]:
+        """
+        Returns the position of the tracked cycle start, found by walking to it rather than by a cycle-finding pass.
+        Time complexity: O(n)
+        """
+
+        if self.cycle_start is None:
+            return None
+        current_node = self.head
+        for index in range(self.size):
+            if current_node is self.cycle_start:
+                self._count_hops(index)
+                return index
+            current_node = current_node.next
+        self._count_hops(self.size)
+        return None
+
+
     def get_node(self, index: int) -> Node:
         """
         Returns node at index, or head/tail if out of bounds
@@ -54,14 +248,123 @@ class SinglyLinkedList:
 
         if index <= 0: return self.head
         if index >= self.size - 1: return self.tail
+        if self.position_index is not None: return self.position_index.node_at(index)
 
         current_node = self.head
         for _ in range(index):
             current_node = current_node.next
+        if self.stats is not None:
+            self.stats.hops += index
 
         return current_node
 
 
+    def _count_hops(self, hops: int):
+        """Adds the pointer hops of a walk that counts them locally, once it has finished, while stats are on."""
+        if self.stats is not None:
+            self.stats.hops += hops
+
+
+    def enable_position_index(self):
+        """
+        Keeps a chunked position index beside the nodes so get_node, insert, replace and remove by position cost O(√n).
+        Every mutator keeps the index in step with the nodes.
+        Time complexity: O(n)
+        """
+
+        self.position_index = PositionIndex()
+        self.position_index.rebuild(self.head, self.size)
+        return True
+
+
+    def disable_position_index(self):
+        """Drops the position index; positional lookups walk from the head again."""
+        self.position_index = None
+        return True
+
+
+    def enable_value_index(self):
+        """
+        Keeps a hash index from each value to the nodes holding it, so contains and count cost O(1)
+        and find_all and index_of stop walking once they have passed every match.
+        Every mutator keeps the index in step with the nodes. ValueIndex.memory_usage reports what it costs.
+        Time complexity: O(n)
+        """
+
+        self.value_index = ValueIndex()
+        self.value_index.rebuild(self.head, self.size)
+        return True
+
+
+    def disable_value_index(self):
+        """Drops the value index; value lookups scan the list again."""
+        self.value_index = None
+        return True
+
+
+    def enable_stats(self):
+        """
+        Starts counting calls, wall time, pointer hops and nodes allocated and freed for each public method.
+        ll.stats.report() formats what has been counted so far.
+        Time complexity: O(1)
+        """
+
+        if self.stats is None:
+            self.stats = OpStats()
+            self.stats.attach(self)
+        return True
+
+
+    def disable_stats(self):
+        """Stops counting and drops the counts; the methods run unwrapped again."""
+        if self.stats is not None:
+            self.stats.detach(self)
+            self.stats = None
+        return True
+
+
+    def _touch_tail_path(self, index: int):
+        """
+        Forgets the cached tail path when a change at index, made while the list still has its old size, reaches into it.
+        Time complexity: O(1)
+        """
+
+        if self.tail_path and index >= self.size - len(self.tail_path) - 1:
+            self.tail_path.clear()
+
+
+    def _repair_tail_path(self):
+        """
+        Refills the tail path with up to TAIL_PATH_LIMIT nodes preceding the tail.
+        Time complexity: O(n), or O(√n) with the position index
+        """
+
+        count = min(TAIL_PATH_LIMIT, self.size - 1)
+        current_node = self.get_node(self.size - 1 - count)
+        path = []
+        for _ in range(count):
+            path.append(current_node)
+            current_node = current_node.next
+        self.tail_path = path
+        if self.stats is not None:
+            self.stats.hops += count
+
+
+    def _relinked(self, reversed_order: bool = False):
+        """
+        Drops or rebuilds state that depends on node order after reverse or sort relinked every node.
+        reverse passes reversed_order so the render cache can be flipped rather than dropped.
+        """
+        self.tail_path.clear()
+        if self.position_index is not None:
+            self.position_index.rebuild(self.head, self.size)
+        if self.render_cache is not None:
+            if reversed_order:
+                self.render_cache.reversed()
+            else:
+                self.render_cache = None
+
+
     def get_values(self, count: Optional[int] = None) -> list[int | float | str | bool]:
         """
         Returns list of node values to count size, or head/tail if out of bounds
@@ -77,6 +380,8 @@ class SinglyLinkedList:
         for _ in range(index):
             values.append(current_node.value)
             current_node = current_node.next
+        if self.stats is not None:
+            self.stats.hops += index
 
         return values
 
@@ -98,10 +403,19 @@ class SinglyLinkedList:
             new_node = Node(value)
             if self.head:
                 self.tail.next = new_node
+                self.tail_path.append(self.tail)
+                if len(self.tail_path) > TAIL_PATH_LIMIT:
+                    del self.tail_path[:TAIL_PATH_LIMIT // 2]
             else:
                 self.head = new_node
             self.tail = new_node
             self.size += 1
+            if self.position_index is not None:
+                self.position_index.inserted(self.size - 1, new_node)
+            if self.value_index is not None:
+                self.value_index.added(new_node)
+            if self.render_cache is not None:
+                self.render_cache.inserted(self.size - 1, value)
             return True
         except EmptyValueException as e:
             print(e)
@@ -113,16 +427,107 @@ class SinglyLinkedList:
         return False
 
 
-    def append_values(self, values: list[int | float | str | bool]):
+    def append_values(self, values: Iterable[int | float | str | bool]):
         """
         Adds multiple new nodes to the end of the linked list.
-        Time complexity: O(n)
+        Accepts any iterable, including generators. The whole batch is checked for a cycle once,
+        its nodes are chained in a single pass and the chain is spliced after the tail with one link.
+        Returns the number of nodes added.
+        Time complexity: O(k) for k values
+        """
+
+        try:
+            if self.has_cycle():
+                raise CycleDetectedException(sys._getframe().f_code.co_name)
+
+            first_node, last_node, count = self._build_chain(values)
+            if count == 0:
+                return 0
+
+            old_tail = self.tail
+            self._splice_tail(first_node, last_node)
+            if self.position_index is not None:
+                self.position_index.spliced(self.size, first_node, count)
+            if self.value_index is not None:
+                self.value_index.added_chain(first_node, count)
+            if self.render_cache is not None:
+                self.render_cache.extended(self.size, self._chain_values(first_node, count))
+            self.size += count
+            self._extend_tail_path(old_tail, first_node, count)
+            return count
+        except CycleDetectedException as e:
+            print(e)
+
+        return 0
+
+
+    def _build_chain(self, values: Iterable[int | float | str | bool]) -> tuple[Node | None, Node | None, int]:
         """
-        filtered_values = filter_values(values)
-        for value in filtered_values:
-            self.append(value)
+        Links a node for every valid value and returns (first, last, count).
+        Values of other types are skipped, like filter_values does; empty values are skipped and reported once.
+        Time complexity: O(k)
+        """
+
+        anchor = last_node = Node(None)
+        count = empty_count = 0
+        for value in values:
+            if type(value) not in VALUE_TYPES:
+                continue
+            if not value:
+                empty_count += 1
+                continue
+            node = Node(value)
+            last_node.next = node
+            last_node = node
+            count += 1
+
+        if empty_count:
+            print(EmptyValueException(None))
+        return anchor.next, (last_node if count else None), count
+
+
+    @staticmethod
+    def _chain_values(first_node: Node, count: int) -> Iterable[int | float | str | bool]:
+        current_node = first_node
+        for _ in range(count):
+            yield current_node.value
+            current_node = current_node.next
 
-        return len(filtered_values)
+
+    def _splice_tail(self, first_node: Node, last_node: Node):
+        if self.head:
+            self.tail.next = first_node
+        else:
+            self.head = first_node
+        self.tail = last_node
+
+
+    def _splice_head(self, first_node: Node, last_node: Node):
+        last_node.next = self.head
+        if self.tail is None:
+            self.tail = last_node
+        self.head = first_node
+
+
+    def _extend_tail_path(self, old_tail: Node | None, first_node: Node, count: int):
+        """
+        Pushes the nodes before the new tail onto the tail path after a chain of count nodes was appended.
+        Long chains just drop the path and leave it to be refilled lazily.
+        Time complexity: O(min(k, TAIL_PATH_LIMIT))
+        """
+
+        if count > TAIL_PATH_LIMIT:
+            self.tail_path.clear()
+            return
+
+        if old_tail is not None:
+            self.tail_path.append(old_tail)
+        current_node = first_node
+        for _ in range(count - 1):
+            self.tail_path.append(current_node)
+            current_node = current_node.next
+        if len(self.tail_path) > TAIL_PATH_LIMIT:
+            del self.tail_path[:len(self.tail_path) - TAIL_PATH_LIMIT // 2]
 
 
     def prepend(self, value: int | float | str | bool):
@@ -136,10 +541,19 @@ class SinglyLinkedList:
             if type(value) not in [int, float, str, bool]:
                 raise ValueTypeException(value)
 
+            self._touch_tail_path(0)
             new_node = Node(value)
             new_node.next = self.head
             self.head = new_node
+            if self.tail is None:
+                self.tail = new_node
             self.size += 1
+            if self.position_index is not None:
+                self.position_index.inserted(0, new_node)
+            if self.value_index is not None:
+                self.value_index.added(new_node)
+            if self.render_cache is not None:
+                self.render_cache.inserted(0, value)
             return True
         except EmptyValueException as e:
             print(e)
@@ -149,18 +563,28 @@ class SinglyLinkedList:
         return False
 
 
-    def prepend_values(self, values: list[int | float | str | bool]):
+    def prepend_values(self, values: Iterable[int | float | str | bool]):
         """
         Adding multiple nodes to the front of the linked list.
-        Preserves order
-        Time complexity: O(n)
+        Preserves order. Like append_values, the nodes are chained in one pass and spliced before the head with one link.
+        Returns the number of nodes added.
+        Time complexity: O(k) for k values
         """
 
-        filtered_values = filter_values(values)
-        for value in filtered_values[::-1]:
-            self.prepend(value)
+        first_node, last_node, count = self._build_chain(values)
+        if count == 0:
+            return 0
 
-        return len(filtered_values)
+        self._touch_tail_path(0)
+        self._splice_head(first_node, last_node)
+        if self.position_index is not None:
+            self.position_index.spliced(0, first_node, count)
+        if self.value_index is not None:
+            self.value_index.added_chain(first_node, count)
+        if self.render_cache is not None:
+            self.render_cache.extended(0, self._chain_values(first_node, count))
+        self.size += count
+        return count
 
 
     def insert(self, index: int, value: int | float | str | bool):
@@ -175,16 +599,25 @@ class SinglyLinkedList:
             if self.has_cycle():
                 raise CycleDetectedException(sys._getframe().f_code.co_name)
 
+            # a negative index lands after the head, which is where get_node(index - 1) has always put it
+            if index < 0: index = min(1, self.size)
             if index == 0:
-                self.prepend(value)
+                return self.prepend(value)
             elif index >= self.size:
-                self.append(value)
+                return self.append(value)
             else:
+                self._touch_tail_path(index)
                 new_node = Node(value)
                 current_node = self.get_node(index -1)
                 new_node.next = current_node.next
                 current_node.next = new_node
                 self.size += 1
+                if self.position_index is not None:
+                    self.position_index.inserted(index, new_node)
+                if self.value_index is not None:
+                    self.value_index.added(new_node)
+                if self.render_cache is not None:
+                    self.render_cache.inserted(index, value)
                 return True
         except ValueTypeException as e:
             print(e)
@@ -203,9 +636,16 @@ class SinglyLinkedList:
         try:
             if type(value) not in [int, float, str, bool]:
                 raise ValueTypeException(value)
+            if self.size == 0:
+                return False
 
             current_node = self.get_node(index)
+            old_value = current_node.value
             current_node.value = value
+            if self.value_index is not None:
+                self.value_index.replaced(current_node, old_value)
+            if self.render_cache is not None:
+                self.render_cache.replaced(max(0, min(index, self.size - 1)), value)
             return True
         except ValueTypeException as e:
             print(e)
@@ -216,18 +656,34 @@ class SinglyLinkedList:
     def trim(self):
         """
         Removes the last node from the list.
-        Time complexity: O(n)
+        The new tail is taken from the cached tail path. When the path runs out it is refilled by one walk,
+        so a trim right after an append costs O(1), while draining the list re-walks from the head once every
+        TAIL_PATH_LIMIT trims.
+        Time complexity: O(n / TAIL_PATH_LIMIT) amortized
         """
 
         try:
             if self.has_cycle():
                 raise CycleDetectedException(sys._getframe().f_code.co_name)
+            if self.size == 0:
+                return False
 
-            self.tail = None
-            current_node = self.get_node(self.size - 2)
-            current_node.next = None
-            self.tail = current_node
+            removed_node = self.tail
+            if self.size == 1:
+                self.head = self.tail = None
+            else:
+                if not self.tail_path:
+                    self._repair_tail_path()
+                current_node = self.tail_path.pop()
+                current_node.next = None
+                self.tail = current_node
             self.size -= 1
+            if self.position_index is not None:
+                self.position_index.removed(self.size, None)
+            if self.value_index is not None:
+                self.value_index.removed(removed_node)
+            if self.render_cache is not None:
+                self.render_cache.removed(self.size)
             return True
         except CycleDetectedException as e:
             print(e)
@@ -238,15 +694,67 @@ class SinglyLinkedList:
     def contains(self, value: int | float | str | bool) -> bool:
         """
         Checks if the list contains a node with the specified value.
+        Time complexity: O(n), or O(1) with the value index
+        """
+
+        if self.value_index is not None:
+            return self.value_index.count(value) > 0
+        for node_value in self:
+            if node_value == value: return True
+
+        return False
+
+
+    def count(self, value: int | float | str | bool) -> int:
+        """
+        Returns the number of nodes holding value.
+        Time complexity: O(n), or O(1) with the value index
+        """
+
+        if self.value_index is not None:
+            return self.value_index.count(value)
+        return sum(1 for node_value in self if node_value == value)
+
+
+    def find_all(self, value: int | float | str | bool) -> list[int]:
+        """
+        Returns the positions of every node holding value, in order.
+        With the value index an absent value costs O(1), and the walk stops at the last matching node.
         Time complexity: O(n)
         """
 
+        if self.value_index is None:
+            return [position for position, node_value in enumerate(self) if node_value == value]
+
+        holders = self.value_index.holders(value)
+        remaining = len(holders)
+        positions = []
         current_node = self.head
-        while current_node:
-            if current_node.value == value: return True
+        for position in range(self.size):
+            if not remaining:
+                break
+            if id(current_node) in holders:
+                positions.append(position)
+                remaining -= 1
             current_node = current_node.next
+        if self.stats is not None:
+            # the walk stops just past the last match
+            self.stats.hops += positions[-1] + 1 if positions else 0
+        return positions
 
-        return False
+
+    def index_of(self, value: int | float | str | bool) -> Optional[int]:
+        """
+        Returns the position of the first node holding value, or None if there is none.
+        Time complexity: O(n), or O(1) for an absent value with the value index
+        """
+
+        if self.value_index is not None and self.value_index.count(value) == 0:
+            return None
+        for position, node_value in enumerate(self):
+            if node_value == value:
+                return position
+        return None
 
 
     def remove(self, index: int):
@@ -256,16 +764,37 @@ class SinglyLinkedList:
         """
 
         if index < 0 or index >= self.size: return False
+        if index < self.size - 1:
+            self._touch_tail_path(index)
         if index == 0:
-            self.head = self.head.next
+            removed_node = self.head
+            if removed_node is self.cycle_start:
+                # break the cycle first, or a lone node looping to itself would stay the head
+                self.tail.next = None
+                self.cycle_start = None
+            self.head = removed_node.next
             self.size -= 1
         elif index >= self.size - 1:
-            self.trim()
+            return self.trim()
         else:
             current_node = self.get_node(index - 1)
-            current_node.next = current_node.next.next
+            removed_node = current_node.next
+            current_node.next = removed_node.next
             self.size -= 1
 
+        if self.position_index is not None:
+            self.position_index.removed(index, removed_node.next)
+        if self.value_index is not None:
+            self.value_index.removed(removed_node)
+        if self.render_cache is not None:
+            self.render_cache.removed(index)
+        if removed_node is self.cycle_start:
+            # removing the node the tail points back to breaks the cycle
+            self.tail.next = None
+            self.cycle_start = None
+        if self.size == 0:
+            self.head = self.tail = None
+
         return True
 
 
@@ -283,21 +812,30 @@ class SinglyLinkedList:
         try:
             if self.has_cycle():
                 raise CycleDetectedException(sys._getframe().f_code.co_name)
-            if start > self.size:
+            if self.size == 0 or start > self.size:
                 raise ValueError("Start index must come before tail index.")
             start_node = self.get_node(start)
             self.tail.next = start_node
+            self.cycle_start = start_node
             return True
+        except CycleDetectedException as e:
+            print(e)
         except ValueError as e:
             print(e)
 
         return False
 
 
-    def has_cycle(self, method:int = 1) -> bool:
+    def has_cycle(self, method:int = 1, verify: bool = False) -> bool:
         """
         Detects if the linked list has a cycle.
+        The list records the node its tail points back to when create_cycle is called,
+        so by default this is an O(1) lookup of that record.
+        Pass verify=True to walk the nodes with the selected algorithm instead.
         """
+        if not verify:
+            return self.cycle_start is not None
+
         match method:
             case 1:
                 """
@@ -305,11 +843,15 @@ class SinglyLinkedList:
                 Time complexity: O(n)
                 """
                 fast_runner = slow_runner = self.head
+                steps = 0
                 while fast_runner and fast_runner.next:
                     fast_runner = fast_runner.next.next
                     slow_runner = slow_runner.next
+                    steps += 3
                     if fast_runner is slow_runner:
+                        self._count_hops(steps)
                         return True
+                self._count_hops(steps)
             case 2:
                 """
                 Brent's Cycle-Finding Algorithm
@@ -323,8 +865,10 @@ class SinglyLinkedList:
                 slow_runner = self.head
                 fast_runner = self.head.next
 
+                steps = 1
                 while fast_runner:
                     if slow_runner is fast_runner:
+                        self._count_hops(steps)
                         return True
                     if lam == power:
                         slow_runner = fast_runner
@@ -332,6 +876,8 @@ class SinglyLinkedList:
                         lam = 0
                     fast_runner = fast_runner.next
                     lam += 1
+                    steps += 1
+                self._count_hops(steps)
 
         return False
 
@@ -347,12 +893,15 @@ class SinglyLinkedList:
                 Time complexity: O(n)
                 """
                 fast_runner = slow_runner = self.head
+                steps = 0
                 while fast_runner and fast_runner.next:
                     fast_runner = fast_runner.next.next
                     slow_runner = slow_runner.next
+                    steps += 3
                     if fast_runner is slow_runner:
                         break
                 else:
+                    self._count_hops(steps)
                     return None
 
                 slow_runner = self.head
@@ -361,6 +910,7 @@ class SinglyLinkedList:
                     slow_runner = slow_runner.next
                     fast_runner = fast_runner.next
                     index += 1
+                self._count_hops(steps + 2 * index)
 
                 return index
 
@@ -376,6 +926,7 @@ class SinglyLinkedList:
                 lam = 1
                 tortoise = self.head
                 hare = self.head.next
+                steps = 1
 
                 while hare and tortoise is not hare:
                     if lam == power:
@@ -384,8 +935,10 @@ class SinglyLinkedList:
                         lam = 0
                     hare = hare.next
                     lam += 1
+                    steps += 1
 
                 if hare is None:
+                    self._count_hops(steps)
                     return None
 
                 tortoise = self.head
@@ -398,6 +951,7 @@ class SinglyLinkedList:
                     tortoise = tortoise.next
                     hare = hare.next
                     index += 1
+                self._count_hops(steps + lam + 2 * index)
 
                 return index
 
@@ -413,8 +967,10 @@ class SinglyLinkedList:
                         current_node = self.head
                         for i in range(self.size - 1):
                             if self.tail.next is current_node:
+                                self._count_hops(i)
                                 return i
                             current_node = current_node.next
+                        self._count_hops(self.size - 1)
 
         return None
 
@@ -424,129 +980,297 @@ class SinglyLinkedList:
         Reverses the linked list in place.
         Time complexity: O(n)
         """
-        if self.size <= 1: return False
+        try:
+            if self.has_cycle():
+                raise CycleDetectedException(sys._getframe().f_code.co_name)
+            if self.size <= 1: return False
+
+            current_node = self.head
+            prev_node = None
+            while current_node:
+                next_node = current_node.next
+                current_node.next = prev_node
+                prev_node = current_node
+                current_node = next_node
+            self.head, self.tail = self.tail, self.head
+            self._relinked(reversed_order=True)
+            if self.stats is not None:
+                self.stats.hops += self.size
 
-        current_node = self.head
-        prev_node = None
-        while current_node:
-            next_node = current_node.next
-            current_node.next = prev_node
-            prev_node = current_node
-            current_node = next_node
-        self.head, self.tail = self.tail, self.head
+            return True
+        except CycleDetectedException as e:
+            print(e)
 
-        return True
+        return False
 
 
-    def sort(self, method: int = 1) -> bool:
+    def sort(self, method: int = 1, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False) -> bool:
         """
         Sorts the linked list in place.
         method=1: Merge sort
         method=2: Insertion sort
+        method=3: Natural merge sort, bottom-up and without recursion; O(n) on sorted or reverse-sorted input
+        method=4: External merge sort; sorted runs of EXTERNAL_RUN_SIZE values are spilled to temporary files
+                  and merged back into the existing nodes, so only one run is held in memory beside the list
+        key is called once per node and the nodes are ordered by its result; reverse=True sorts descending.
+        Every method but insertion sort keeps equal keys in their original order. Lists mixing numbers and strings
+        sort numbers first instead of failing.
         """
 
         try:
             if self.has_cycle():
                 raise CycleDetectedException(sys._getframe().f_code.co_name)
+            if method not in SORT_METHODS:
+                raise ValueError("Method must be 1 (merge), 2 (insertion), 3 (natural merge) or 4 (external merge).")
             if self.size <= 1:
                 return True
 
-            if method == 1:
-                def split(head: Node | None):
-                    if head is None or head.next is None:
-                        return head, None
-                    slow = head
-                    fast = head
-                    prev = None
-                    while fast and fast.next:
-                        prev = slow
-                        slow = slow.next
-                        fast = fast.next.next
-                    if prev:
-                        prev.next = None
-                    return head, slow
-
-                def merge(left: Node | None, right: Node | None):
-                    if left is None:
-                        tail = right
-                        while tail and tail.next:
-                            tail = tail.next
-                        return right, tail
-                    if right is None:
-                        tail = left
-                        while tail and tail.next:
-                            tail = tail.next
-                        return left, tail
+            if method == 4:
+                # iterating self counts the read pass; _write_values counts the write pass
+                self._write_values(external_sorted(self, key, reverse))
+                return True
+
+            # decorate-sort-undecorate: each node holds a SortKey while the chosen method relinks the nodes
+            decorated = key is not None or reverse or not comparable(self)
+            if decorated:
+                sort_keys = [SortKey(value if key is None else key(value), value, reverse) for value in self]
+                current = self.head
+                for sort_key in sort_keys:
+                    current.value = sort_key
+                    current = current.next
+                del sort_keys
+                self._count_hops(self.size)
+            try:
+                self._sort_nodes(method)
+            finally:
+                if decorated:
+                    current = self.head
+                    for _ in range(self.size):
+                        current.value = current.value.value
+                        current = current.next
+                    self._count_hops(self.size)
+            self._relinked()
+            return True
+        except CycleDetectedException as e:
+            print(e)
+        except ValueError as e:
+            print(e)
+        except TypeError as e:
+            print(e)
+
+        return False
 
+
+    def _sort_nodes(self, method: int):
+        """Relinks the nodes in order with the selected method and sets head and tail."""
+        if self.stats is not None and method == 1:
+            # the walks of top-down merge sort depend only on the list size
+            self.stats.hops += merge_sort_hops(self.size)
+        if method == 1:
+            def split(head: Node | None):
+                if head is None or head.next is None:
+                    return head, None
+                slow = head
+                fast = head
+                prev = None
+                while fast and fast.next:
+                    prev = slow
+                    slow = slow.next
+                    fast = fast.next.next
+                if prev:
+                    prev.next = None
+                return head, slow
+
+            def merge(left: Node | None, right: Node | None):
+                if left is None:
+                    tail = right
+                    while tail and tail.next:
+                        tail = tail.next
+                    return right, tail
+                if right is None:
+                    tail = left
+                    while tail and tail.next:
+                        tail = tail.next
+                    return left, tail
+
+                if left.value <= right.value:
+                    head = left
+                    left = left.next
+                else:
+                    head = right
+                    right = right.next
+                tail = head
+                tail.next = None
+
+                while left and right:
                     if left.value <= right.value:
-                        head = left
+                        tail.next = left
+                        tail = left
                         left = left.next
                     else:
-                        head = right
+                        tail.next = right
+                        tail = right
                         right = right.next
-                    tail = head
                     tail.next = None
 
-                    while left and right:
-                        if left.value <= right.value:
-                            tail.next = left
-                            tail = left
-                            left = left.next
-                        else:
-                            tail.next = right
-                            tail = right
-                            right = right.next
-                        tail.next = None
-
-                    remainder = left if left else right
-                    tail.next = remainder
-                    while tail.next:
-                        tail = tail.next
-                    return head, tail
-
-                def merge_sort(head: Node | None):
-                    if head is None or head.next is None:
-                        return head, head
-                    left, right = split(head)
-                    left_head, left_tail = merge_sort(left)
-                    right_head, right_tail = merge_sort(right)
-                    return merge(left_head, right_head)
-
-                head, tail = merge_sort(self.head)
-                self.head = head
-                self.tail = tail
-                return True
+                remainder = left if left else right
+                tail.next = remainder
+                while tail.next:
+                    tail = tail.next
+                return head, tail
+
+            def merge_sort(head: Node | None):
+                if head is None or head.next is None:
+                    return head, head
+                left, right = split(head)
+                left_head, left_tail = merge_sort(left)
+                right_head, right_tail = merge_sort(right)
+                return merge(left_head, right_head)
+
+            head, tail = merge_sort(self.head)
+            self.head = head
+            self.tail = tail
+            return
+
+        if method == 2:
+            hops = 0
+            sorted_head = None
+            current = self.head
+            while current:
+                next_node = current.next
+                if sorted_head is None or current.value <= sorted_head.value:
+                    current.next = sorted_head
+                    sorted_head = current
+                else:
+                    search = sorted_head
+                    while search.next and search.next.value <= current.value:
+                        search = search.next
+                        hops += 1
+                    current.next = search.next
+                    search.next = current
+                current = next_node
+                hops += 1
 
-            if method == 2:
-                sorted_head = None
-                current = self.head
-                while current:
-                    next_node = current.next
-                    if sorted_head is None or current.value <= sorted_head.value:
-                        current.next = sorted_head
-                        sorted_head = current
-                    else:
-                        search = sorted_head
-                        while search.next and search.next.value <= current.value:
-                            search = search.next
-                        current.next = search.next
-                        search.next = current
-                    current = next_node
+            self.head = sorted_head
+            self.tail = sorted_head
+            if self.tail:
+                while self.tail.next:
+                    self.tail = self.tail.next
+                    hops += 1
+            self._count_hops(hops)
+            return
 
-                self.head = sorted_head
-                self.tail = sorted_head
-                if self.tail:
-                    while self.tail.next:
-                        self.tail = self.tail.next
-                return True
+        if method == 3:
+            self.head, self.tail = self._natural_merge_sort()
 
-            raise ValueError("Method must be 1 (merge) or 2 (insertion).")
-        except CycleDetectedException as e:
-            print(e)
-        except ValueError as e:
-            print(e)
 
-        return False
+    def _write_values(self, values: Iterable[int | float | str | bool]):
+        """
+        Stores values into the existing nodes in order, leaving the links alone.
+        State keyed by which node holds which value is rebuilt or dropped; the order-based state stays valid.
+        Time complexity: O(n)
+        """
+
+        current = self.head
+        written = 0
+        for value in values:
+            current.value = value
+            current = current.next
+            written += 1
+        self._count_hops(written)
+        self.render_cache = None
+        if self.value_index is not None:
+            self.value_index.rebuild(self.head, self.size)
+
+
+    def _natural_merge_sort(self) -> tuple[Node, Node]:
+        """
+        Sorts the next links of a non-empty, acyclic list and returns the new (head, tail); prev links are left alone.
+        One pass cuts the list into natural runs, reversing strictly descending ones in place.
+        Each run is merged as soon as it is complete, like incrementing a binary counter: pending[i] holds a run built
+        from 2**i natural runs, so merges happen depth first on recently touched nodes instead of in passes over the whole list.
+        Every run carries its tail, so a merge links the leftover run on in O(1) instead of walking it.
+        Ties keep their order: a node from the later run only goes first when it is strictly smaller.
+        Time complexity: O(n log r) for r natural runs, so O(n) for sorted or reverse-sorted input
+        """
+
+        # cutting the runs reads every link once, and each merge is counted as one hop per node of its two runs
+        hops = self.size
+
+        def merge(left_run: tuple[Node, Node, int], right_run: tuple[Node, Node, int]) -> tuple[Node, Node, int]:
+            nonlocal hops
+            left, left_tail, left_count = left_run
+            right, right_tail, right_count = right_run
+            hops += left_count + right_count
+            left_value = left.value
+            right_value = right.value
+            head = tail = Node(None)
+            while True:
+                if right_value < left_value:
+                    tail.next = right
+                    tail = right
+                    right = right.next
+                    if right is None: break
+                    right_value = right.value
+                else:
+                    tail.next = left
+                    tail = left
+                    left = left.next
+                    if left is None: break
+                    left_value = left.value
+            if left is not None:
+                tail.next = left
+                tail = left_tail
+            else:
+                tail.next = right
+                tail = right_tail
+            return head.next, tail, left_count + right_count
+
+        pending: list[tuple[Node, Node, int] | None] = []
+        current = self.head
+        while current is not None:
+            next_node = current.next
+            if next_node is not None and next_node.value < current.value:
+                run_tail = current
+                previous = None
+                count = 0
+                while True:
+                    next_node = current.next
+                    current.next = previous
+                    previous = current
+                    count += 1
+                    if next_node is None or not next_node.value < current.value:
+                        break
+                    current = next_node
+                run = (previous, run_tail, count)
+            else:
+                run_head = current
+                count = 1
+                while next_node is not None and not next_node.value < current.value:
+                    current = next_node
+                    next_node = current.next
+                    count += 1
+                current.next = None
+                run = (run_head, current, count)
+            current = next_node
+
+            level = 0
+            while level < len(pending) and pending[level] is not None:
+                run = merge(pending[level], run)
+                pending[level] = None
+                level += 1
+            if level == len(pending):
+                pending.append(run)
+            else:
+                pending[level] = run
+
+        # higher levels hold earlier nodes, so they go on the left
+        result = None
+        for run in pending:
+            if run is not None:
+                result = run if result is None else merge(run, result)
+        self._count_hops(hops)
+        return result[:2]
 
 
     def clear(self, iterate: bool = False):
@@ -559,19 +1283,31 @@ class SinglyLinkedList:
         """
         if iterate:
             # Time complexity: O(n)
+            # Walk size nodes rather than following next until None, which never ends on a cycle
             current = self.head
-            while current:
+            for _ in range(self.size):
                 # Store the next node to avoid losing the reference
                 next_node = current.next
+                current.next = None
                 current = next_node
-            self.head = None
-        else:
-            # Time complexity: O(1)
-            self.head = self.tail = None
-            self.size = 0
+
+        # Time complexity: O(1)
+        self.head = self.tail = None
+        self.cycle_start = None
+        self.tail_path.clear()
+        self.render_cache = None
+        self.size = 0
+        if self.position_index is not None:
+            self.position_index.clear()
+        if self.value_index is not None:
+            self.value_index.clear()
 
         return True
 
 
-    def show(self):
-        print(self)
+    def show(self, start: Optional[int] = None, stop: Optional[int] = None, max_items: Optional[int] = SHOW_MAX_ITEMS):
+        """
+        Prints the list, or positions start..stop-1 of it.
+        Lists longer than max_items print only their ends; pass max_items=None to print every value.
+        """
+        print(self.to_string(start, stop, max_items))
@@ -0,0 +1,133 @@
+import heapq
+from functools import lru_cache
+import pickle
+import tempfile
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Callable, IO, Iterable, Iterator, Optional
+from constants import EXTERNAL_RUN_SIZE
+
+# Values written per pickle record in a spilled run
+SPILL_BLOCK = 4096
+NUMBER_TYPES = (int, float)
+
+
+def type_rank(value: Any) -> tuple[bool, str]:
+    """Orders values of types that cannot be compared with each other: numbers first, then by type name."""
+    return not isinstance(value, NUMBER_TYPES), type(value).__name__
+
+
+def is_less(left: Any, right: Any) -> bool:
+    """left < right, falling back to type_rank when the two cannot be compared, as with 3 and "a"."""
+    try:
+        return left < right
+    except TypeError:
+        return type_rank(left) < type_rank(right)
+
+
+def comparable(values: Iterable[Any]) -> bool:
+    """
+    Whether every value can be compared with every other: all numbers, or all strings.
+    Time complexity: O(n)
+    """
+
+    return comparable_types(set(map(type, values)))
+
+
+def comparable_types(types: set[type]) -> bool:
+    return types <= {int, float, bool} or types <= {str}
+
+
+@lru_cache(maxsize=None)
+def merge_sort_hops(size: int) -> int:
+    """
+    Pointer hops top-down merge sort makes on size nodes. Its walks depend only on the size: splitting m nodes
+    takes m // 2 steps of three hops for the slow and fast runners, and merging them back visits each node once.
+    Time complexity: O(log n), as the halves of any size take at most two distinct sizes per level
+    """
+
+    if size <= 1:
+        return 0
+    half = size // 2
+    return 3 * half + size + merge_sort_hops(half) + merge_sort_hops(size - half)
+
+
+class SortKey:
+    """
+    Sort key computed once for a value and carried beside it while a list is sorted.
+    Comparisons never raise TypeError, so mixed int/str lists sort with numbers first.
+    reverse flips the order but keeps it stable: equal keys still compare as equal, so ties keep their original order.
+    """
+    __slots__ = ("key", "value", "reverse")
+
+    def __init__(self, key: Any, value: Any = None, reverse: bool = False):
+        self.key = key
+        self.value = value
+        self.reverse = reverse
+
+    def __lt__(self, other: "SortKey") -> bool:
+        if self.reverse:
+            return is_less(other.key, self.key)
+        return is_less(self.key, other.key)
+
+    def __le__(self, other: "SortKey") -> bool:
+        return not other < self
+
+    # heapq.merge breaks ties by run order only after finding the keys equal, so equality must follow the order too
+    def __eq__(self, other: "SortKey") -> bool:
+        return not self < other and not other < self
+
+    __hash__ = None
+
+
+def spill(pairs: list[tuple[Any, Any]]) -> IO[bytes]:
+    """Writes sorted (key, value) pairs to an anonymous temporary file and returns it rewound."""
+    run_file = tempfile.TemporaryFile(prefix="llv_run_")
+    for start in range(0, len(pairs), SPILL_BLOCK):
+        pickle.dump(pairs[start:start + SPILL_BLOCK], run_file, pickle.HIGHEST_PROTOCOL)
+    run_file.seek(0)
+    return run_file
+
+
+def read_run(run_file: IO[bytes]) -> Iterator[tuple[Any, Any]]:
+    while True:
+        try:
+            block = pickle.load(run_file)
+        except EOFError:
+            return
+        yield from block
+
+
+def external_sorted(values: Iterable[Any], key: Optional[Callable[[Any], Any]] = None, reverse: bool = False,
+                    run_size: int = EXTERNAL_RUN_SIZE) -> Iterator[Any]:
+    """
+    Yields values in sorted order while holding at most run_size of them in memory at once.
+    Keys are computed once per value. Each run of run_size values is sorted and spilled to a temporary file,
+    then heapq.merge streams the runs back in order. Both steps are stable, so equal keys keep their input order.
+    The temporary files are closed, and so deleted, when the generator finishes or is closed.
+    Time complexity: O(n log n), with O(run_size + n / run_size) memory
+    """
+
+    wrapped_key = lambda pair: SortKey(pair[0])
+    run_files = []
+    key_types = set()
+    try:
+        values = iter(values)
+        while True:
+            chunk = list(islice(values, run_size))
+            if not chunk:
+                break
+            pairs = [(value if key is None else key(value), value) for value in chunk]
+            # plain keys compare in C; only runs that mix types pay for SortKey
+            run_types = {type(pair[0]) for pair in pairs}
+            key_types |= run_types
+            pairs.sort(key=itemgetter(0) if comparable_types(run_types) else wrapped_key, reverse=reverse)
+            run_files.append(spill(pairs))
+
+        runs = [read_run(run_file) for run_file in run_files]
+        merge_key = itemgetter(0) if comparable_types(key_types) else wrapped_key
+        for _, value in heapq.merge(*runs, key=merge_key, reverse=reverse):
+            yield value
+    finally:
+        for run_file in run_files:
+            run_file.close()
@@ -0,0 +1,54 @@
+from collections import OrderedDict
+from typing import Any, Tuple
+from constants import TEXT_CACHE_SIZE
+
+
+class TextCache:
+    """
+    LRU cache of rendered text surfaces keyed by (text, font, color).
+    Node labels and panel lines repeat from frame to frame, so most renders become a dictionary lookup.
+    """
+
+    def __init__(self, max_size: int = TEXT_CACHE_SIZE):
+        self.max_size = max_size
+        self.surfaces: OrderedDict[Tuple[str, Any, Tuple[int, int, int]], Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+
+    def __len__(self):
+        return len(self.surfaces)
+
+
+    def render(self, font, text: str, color: Tuple[int, int, int]):
+        """
+        Returns the antialiased surface for text, rendering it on a miss and evicting the least recently used entry when full.
+        Time complexity: O(1)
+        """
+
+        key = (text, font, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+
+    def resize(self, max_size: int):
+        """Changes the size bound, evicting the oldest entries if needed."""
+        self.max_size = max_size
+        while len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+
+
+    def clear(self):
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,98 @@
+import sys
+from typing import Any
+from classes.node import Node
+
+
+class ValueIndex:
+    """
+    Hash index from each value in a linked list to the nodes holding it.
+    nodes[value] is the node itself while only one node holds the value, and a dict of id(node) to node once
+    several do; nodes compare by value and are not hashable themselves.
+    Most values are unique, so most entries cost one dict slot instead of a dict of their own.
+    """
+
+    def __init__(self):
+        self.nodes: dict[Any, Node | dict[int, Node]] = {}
+
+
+    def __len__(self):
+        return len(self.nodes)
+
+
+    def rebuild(self, head: Node | None, size: int):
+        """
+        Indexes the first size nodes from head.
+        Time complexity: O(n)
+        """
+
+        self.nodes = {}
+        self.added_chain(head, size)
+
+
+    def added(self, node: Node):
+        nodes = self.nodes
+        holders = nodes.get(node.value)
+        if holders is None:
+            nodes[node.value] = node
+        elif type(holders) is dict:
+            holders[id(node)] = node
+        else:
+            nodes[node.value] = {id(holders): holders, id(node): node}
+
+
+    def added_chain(self, first_node: Node, count: int):
+        """Indexes a chain of count nodes."""
+        current_node = first_node
+        for _ in range(count):
+            self.added(current_node)
+            current_node = current_node.next
+
+
+    def removed(self, node: Node, value: Any = None):
+        """Forgets node, which was indexed under value, or under the value it holds if value is None."""
+        if value is None:
+            value = node.value
+        holders = self.nodes[value]
+        if type(holders) is not dict:
+            del self.nodes[value]
+            return
+        del holders[id(node)]
+        if len(holders) == 1:
+            self.nodes[value] = next(iter(holders.values()))
+
+
+    def replaced(self, node: Node, old_value: Any):
+        """Moves node from old_value to the value it holds now."""
+        self.removed(node, old_value)
+        self.added(node)
+
+
+    def holders(self, value: Any) -> dict[int, Node]:
+        """Returns the nodes holding value keyed by id(node)."""
+        holders = self.nodes.get(value)
+        if holders is None:
+            return {}
+        if type(holders) is not dict:
+            return {id(holders): holders}
+        return holders
+
+
+    def count(self, value: Any) -> int:
+        holders = self.nodes.get(value)
+        if holders is None:
+            return 0
+        return len(holders) if type(holders) is dict else 1
+
+
+    def memory_usage(self) -> int:
+        """
+        Bytes held by the index's own dicts, not counting the nodes and values the list already holds.
+        Time complexity: O(distinct values)
+        """
+
+        shared = [holders for holders in self.nodes.values() if type(holders) is dict]
+        return sys.getsizeof(self.nodes) + sum(map(sys.getsizeof, shared))
+
+
+    def clear(self):
+        self.nodes = {}
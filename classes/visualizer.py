@@ -1,32 +1,98 @@
 import math
-from dataclasses import dataclass
+from collections import ChainMap, OrderedDict
+from bisect import bisect_left
+from itertools import accumulate
+from dataclasses import dataclass, field
 from classes.linked_list import LinkedList
+from classes.text_cache import TextCache
 from typing import List, Optional, Tuple, Any, Dict
 from constants import *
 import pygame
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-@dataclass
+
+@dataclass(slots=True)
 class NodeState:
     node_id: int
     value: int | float | str | bool
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeVisual:
     node_id: int
     value: int | float | str | bool
     position: Tuple[int, int]
     row: int
     col: int
-
-
-@dataclass
+    index: int = -1
+
+
+@dataclass(slots=True)
+class GridLayout:
+    """
+    Where each list position sits in the default view: a grid filled row by row from (origin_x, origin_y).
+    scale shrinks nodes, links and arrowheads once the list is too long for full-size nodes.
+    """
+    count: int
+    per_row: int
+    rows: int
+    origin_x: float
+    origin_y: float
+    spacing_x: float
+    spacing_y: float
+    scale: float = 1.0
+
+    def position(self, index: int) -> Tuple[float, float]:
+        row, col = divmod(index, self.per_row)
+        return self.origin_x + col * self.spacing_x, self.origin_y + row * self.spacing_y
+
+
+@dataclass(slots=True)
+class Viewport:
+    """Pan and zoom over the default view, which is the identity viewport."""
+    zoom: float = 1.0
+    offset_x: float = 0.0
+    offset_y: float = 0.0
+    max_zoom: float = MAX_NODE_SCALE
+
+    def to_screen(self, point: Tuple[float, float]) -> Tuple[int, int]:
+        return int((point[0] - self.offset_x) * self.zoom), int((point[1] - self.offset_y) * self.zoom)
+
+    def to_world(self, point: Tuple[float, float]) -> Tuple[float, float]:
+        return point[0] / self.zoom + self.offset_x, point[1] / self.zoom + self.offset_y
+
+    def pan(self, dx: float, dy: float):
+        self.offset_x -= dx / self.zoom
+        self.offset_y -= dy / self.zoom
+
+    def zoom_at(self, point: Tuple[float, float], factor: float):
+        """Zooms by factor while keeping the world point under the screen point fixed."""
+        world_x, world_y = self.to_world(point)
+        self.zoom = max(MIN_ZOOM, min(self.max_zoom, self.zoom * factor))
+        self.offset_x = world_x - point[0] / self.zoom
+        self.offset_y = world_y - point[1] / self.zoom
+
+    def reset(self):
+        self.zoom = 1.0
+        self.offset_x = 0.0
+        self.offset_y = 0.0
+
+
+@dataclass(slots=True)
 class OperationFrame:
+    """
+    One animated operation, stored as a delta: the op_type, the position it changed and the node it put there
+    (the added node, or the new state of a replaced node). Node lists are rebuilt from keyframes on demand.
+    """
     op_type: str
     duration: float
-    nodes_before: List[NodeState]
-    nodes_after: List[NodeState]
+    index: Optional[int] = None
+    node: Optional[NodeState] = None
+    keyframe: Optional[List[NodeState]] = None
     added_id: Optional[int] = None
     fade_id: Optional[int] = None
     removed_id: Optional[int] = None
@@ -36,6 +102,23 @@ class OperationFrame:
     label: str = ""
 
 
+@dataclass(slots=True)
+class Scene:
+    """
+    What the retained background holds for one frame and phase.
+    The animated nodes, the links touching them and (when cycle is set) the cycle arc are left out of the background
+    and drawn on top of it every tick.
+    """
+    key: Tuple
+    line_scale: float = 1.0
+    radius_map: Dict[int, int] = field(default_factory=dict)
+    visuals_by_id: Dict[int, NodeVisual] = field(default_factory=dict)
+    animated: List[NodeVisual] = field(default_factory=list)
+    linked: List[NodeVisual] = field(default_factory=list)
+    cycle: bool = False
+    dirty_rects: List[pygame.Rect] = field(default_factory=list)
+
+
 class LinkedListVisualizer:
     def __init__(self, ll_type:str, operations: List[Tuple[str, List[int | float | str | bool], str]], width: int = DEFAULT_WIDTH,
                  height: int = DEFAULT_HEIGHT, node_interval: float = DEFAULT_INTERVAL,
@@ -46,6 +129,16 @@ class LinkedListVisualizer:
         self.height = height
         self.node_interval = node_interval
         self.arrow_interval = arrow_interval
+        # node list rebuilt by frame_nodes: the state before frames[state_index]
+        self.state_index = -1
+        self.state_nodes: List[NodeState] = []
+        # timeline[i] is the time at which frames[i] ends
+        self.timeline: List[float] = []
+        self.text_cache = TextCache()
+        # (grid geometry, xs, ys) of the last grid_positions call
+        self.position_cache: Optional[Tuple[Tuple, Any, Any]] = None
+        # arrowhead sprites by (direction, size, color, sub-pixel offset of the tip), least recently used first
+        self.arrowhead_cache: OrderedDict[Tuple, Tuple[Any, Tuple[int, int]]] = OrderedDict()
 
     def configure(self, params: Dict[str, Any]):
         if params.get("node_interval"):
@@ -56,6 +149,8 @@ class LinkedListVisualizer:
             self.width = params["width"]
         if params.get("height"):
             self.height = params["height"]
+        if params.get("text_cache_size"):
+            self.text_cache.resize(params["text_cache_size"])
 
     def clamp(self, value: float, min_value: float, max_value: float) -> float:
         return max(min_value, min(value, max_value))
@@ -68,27 +163,140 @@ class LinkedListVisualizer:
             int(color_a[2] + (color_b[2] - color_a[2]) * t),
         )
 
-    def layout_nodes(self, nodes: List[NodeState], width: int, height: int) -> List[NodeVisual]:
-        count = max(1, len(nodes))
+    def grid_layout(self, count: int, width: int, height: int) -> GridLayout:
+        """
+        Lays out count positions to fit the window.
+        Short lists keep full-size nodes over a few wide columns; once rows would overlap,
+        the grid turns roughly square and every node shrinks by the same scale.
+        """
+        size = max(1, count)
         margin = 80
         usable_width = max(200, width - margin * 2 - PANEL_WIDTH)
         min_spacing = 180
         max_per_row = max(1, int(usable_width // min_spacing) + 1)
-        per_row = min(count, max_per_row)
-        rows = math.ceil(count / per_row)
+        per_row = min(size, max_per_row)
+        rows = math.ceil(size / per_row)
         spacing_x = usable_width / max(1, per_row - 1)
         usable_height = max(200, height - margin * 2)
         spacing_y = usable_height / max(1, rows - 1)
+        scale = 1.0
+
+        if rows > 1 and spacing_y < 2 * NODE_RADIUS:
+            per_row = max(max_per_row, math.ceil(math.sqrt(size * usable_width / usable_height)))
+            rows = math.ceil(size / per_row)
+            spacing_x = spacing_y = min(usable_width / max(1, per_row - 1), usable_height / max(1, rows - 1))
+            scale = min(1.0, spacing_x / (3 * NODE_RADIUS))
+
+        return GridLayout(count, per_row, rows, PANEL_WIDTH + margin, margin, spacing_x, spacing_y, scale)
+
+    def node_area(self, width: int, height: int) -> pygame.Rect:
+        """Screen area to the right of the operations panel that nodes are drawn into."""
+        return pygame.Rect(PANEL_WIDTH, 0, max(0, width - PANEL_WIDTH), height)
+
+    def visible_indices(self, grid: GridLayout, viewport: Viewport, area: pygame.Rect) -> List[int]:
+        """
+        Returns the list positions whose nodes or links can show inside area, in order.
+        Rows cut off at the sides keep their first and last node so the links that wrap between rows are still drawn.
+        Time complexity: O(visible nodes)
+        """
+        if grid.count == 0:
+            return []
+        # world-space margin for node radius, links between rows and the cycle arc
+        pad = (NODE_RADIUS * grid.scale * viewport.zoom + 80) / viewport.zoom
+        left, top = viewport.to_world((area.left, area.top))
+        right, bottom = viewport.to_world((area.right, area.bottom))
+        first_row = max(0, math.floor((top - pad - grid.origin_y) / grid.spacing_y))
+        last_row = min(grid.rows - 1, math.ceil((bottom + pad - grid.origin_y) / grid.spacing_y))
+        first_col = max(0, math.floor((left - pad - grid.origin_x) / grid.spacing_x))
+        last_col = min(grid.per_row - 1, math.ceil((right + pad - grid.origin_x) / grid.spacing_x))
+        if first_row > last_row or first_col > last_col:
+            return []
+
+        indices = []
+        for row in range(first_row, last_row + 1):
+            row_start = row * grid.per_row
+            if first_col > 0:
+                indices.append(row_start)
+            indices.extend(range(row_start + first_col, row_start + last_col + 1))
+            if last_col < grid.per_row - 1:
+                indices.append(row_start + grid.per_row - 1)
+        return [index for index in indices if index < grid.count]
+
+    def grid_positions(self, grid: GridLayout):
+        """
+        Returns NumPy arrays of the world x and y of positions 0..count-1 of grid.
+        A position depends only on the grid geometry, so the arrays are cached per geometry and a growing list only
+        computes the missing suffix, over-allocating so that appends are amortized O(1).
+        """
+        key = (grid.per_row, grid.origin_x, grid.origin_y, grid.spacing_x, grid.spacing_y)
+        if self.position_cache is None or self.position_cache[0] != key:
+            self.position_cache = (key, np.empty(0), np.empty(0))
+        _, xs, ys = self.position_cache
+        if len(xs) < grid.count:
+            indices = np.arange(len(xs), max(grid.count, 2 * len(xs)))
+            rows, cols = np.divmod(indices, grid.per_row)
+            xs = np.concatenate([xs, grid.origin_x + cols * grid.spacing_x])
+            ys = np.concatenate([ys, grid.origin_y + rows * grid.spacing_y])
+            self.position_cache = (key, xs, ys)
+        return xs[:grid.count], ys[:grid.count]
+
+    def layout_nodes(self, nodes: List[NodeState], width: int, height: int,
+                     viewport: Optional[Viewport] = None) -> List[NodeVisual]:
+        """
+        Lays out nodes in screen space; with a viewport, only the nodes that can show in the node area.
+        With NumPy the positions come from the cached grid_positions arrays and are transformed in one batch.
+        """
+        grid = self.grid_layout(len(nodes), width, height)
+        if viewport is None:
+            viewport = Viewport()
+            indices = range(len(nodes))
+        else:
+            indices = self.visible_indices(grid, viewport, self.node_area(width, height))
+
+        if np is not None and len(indices):
+            indices = np.arange(len(nodes)) if isinstance(indices, range) else np.asarray(indices)
+            xs, ys = self.grid_positions(grid)
+            screen_x = ((xs[indices] - viewport.offset_x) * viewport.zoom).astype(np.int64)
+            screen_y = ((ys[indices] - viewport.offset_y) * viewport.zoom).astype(np.int64)
+            rows, cols = np.divmod(indices, grid.per_row)
+            return [
+                NodeVisual(nodes[index].node_id, nodes[index].value, (x, y), row, col, index)
+                for index, x, y, row, col in zip(indices.tolist(), screen_x.tolist(), screen_y.tolist(),
+                                                 rows.tolist(), cols.tolist())
+            ]
 
         visuals = []
-        for index, node in enumerate(nodes):
-            row = index // per_row
-            col = index % per_row
-            x = int(PANEL_WIDTH + margin + col * spacing_x)
-            y = int(margin + row * spacing_y)
-            visuals.append(NodeVisual(node.node_id, node.value, (x, y), row, col))
+        for index in indices:
+            node = nodes[index]
+            row, col = divmod(index, grid.per_row)
+            visuals.append(NodeVisual(node.node_id, node.value, viewport.to_screen(grid.position(index)), row, col, index))
         return visuals
 
+    def link_geometry(self, visuals: List[NodeVisual], radius_map: Dict[int, int],
+                      skip_ids: frozenset = frozenset()) -> List[Tuple[int, int, List[Tuple[float, float]]]]:
+        """
+        Returns (node id, next node id, path) for each link between neighbouring visuals that does not touch skip_ids.
+        The path holds the two arrow endpoints for nodes on the same row, or four points that wrap down to the next row.
+        """
+        links = []
+        for current, next_visual in zip(visuals, visuals[1:]):
+            if next_visual.index != current.index + 1:
+                continue
+            if current.node_id in skip_ids or next_visual.node_id in skip_ids:
+                continue
+            if current.row != next_visual.row:
+                start = (current.position[0], current.position[1] + radius_map[current.node_id])
+                end = (next_visual.position[0], next_visual.position[1] - radius_map[next_visual.node_id])
+                turn_y = current.position[1] + (next_visual.position[1] - current.position[1]) / 2
+                path = [start, (start[0], turn_y), (end[0], turn_y), end]
+            else:
+                path = [
+                    (current.position[0] + radius_map[current.node_id], current.position[1]),
+                    (next_visual.position[0] - radius_map[next_visual.node_id], next_visual.position[1]),
+                ]
+            links.append((current.node_id, next_visual.node_id, path))
+        return links
+
     def draw_arrow(self, surface, start, end, color, progress=1.0, width=2, arrow_size=12):
         progress = self.clamp(progress, 0.0, 1.0)
         if progress <= 0:
@@ -100,13 +308,23 @@ class LinkedListVisualizer:
         pygame.draw.line(surface, color, start, end_point, width)
         if progress < 0.98:
             return
+        self.draw_arrowhead(surface, start, end, color, arrow_size)
+
+    def draw_arrowhead(self, surface, start, end, color, arrow_size=12):
+        head = self.arrowhead(start, end, color, arrow_size)
+        if head is not None:
+            surface.blit(*head)
+            return
         direction = (start[0] - end[0], start[1] - end[1])
         length = math.hypot(direction[0], direction[1])
         if length == 0:
             return
         unit = (direction[0] / length, direction[1] / length)
-        perpendicular = (-unit[1], unit[0])
+        pygame.draw.polygon(surface, color, self.arrowhead_points(end, unit, arrow_size))
 
+    def arrowhead_points(self, end, unit, arrow_size) -> List[Tuple[float, float]]:
+        """Triangle with its tip at end, pointing away from unit, which is the unit vector back along the arrow."""
+        perpendicular = (-unit[1], unit[0])
         left = (
             end[0] + unit[0] * arrow_size + perpendicular[0] * (arrow_size * 0.6),
             end[1] + unit[1] * arrow_size + perpendicular[1] * (arrow_size * 0.6),
@@ -115,7 +333,47 @@ class LinkedListVisualizer:
             end[0] + unit[0] * arrow_size - perpendicular[0] * (arrow_size * 0.6),
             end[1] + unit[1] * arrow_size - perpendicular[1] * (arrow_size * 0.6),
         )
-        pygame.draw.polygon(surface, color, [end, left, right])
+        return [end, left, right]
+
+    def arrowhead(self, start, end, color, arrow_size):
+        """
+        Returns (sprite, position) to blit for the arrowhead of an axis-aligned arrow, or None for other directions.
+        Links and cycle arcs always finish horizontally or vertically, so four directions per size cover them.
+        The sprite keeps the tip's sub-pixel offset, so blitting it matches drawing the polygon in place.
+        """
+        dx = start[0] - end[0]
+        dy = start[1] - end[1]
+        if (dx == 0) == (dy == 0):
+            return None
+        unit = (math.copysign(1.0, dx) if dx else 0.0, math.copysign(1.0, dy) if dy else 0.0)
+        tip_x = math.floor(end[0])
+        tip_y = math.floor(end[1])
+        sprite, (left, top) = self.arrowhead_sprite(unit, arrow_size, color, (end[0] - tip_x, end[1] - tip_y))
+        return sprite, (tip_x + left, tip_y + top)
+
+    def arrowhead_sprite(self, unit, arrow_size, color, fraction):
+        """
+        Returns the cached (sprite, offset from the tip pixel) for an arrowhead whose tip sits at fraction.
+        The cache evicts the least recently used sprite when full, so a zoom only replaces the sizes it stops using.
+        """
+        key = (unit, arrow_size, color, fraction)
+        cached = self.arrowhead_cache.get(key)
+        if cached is not None:
+            self.arrowhead_cache.move_to_end(key)
+        else:
+            points = self.arrowhead_points(fraction, unit, arrow_size)
+            left = math.floor(min(point[0] for point in points)) - 1
+            top = math.floor(min(point[1] for point in points)) - 1
+            size = (
+                math.ceil(max(point[0] for point in points)) - left + 2,
+                math.ceil(max(point[1] for point in points)) - top + 2,
+            )
+            sprite = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.polygon(sprite, color, [(point[0] - left, point[1] - top) for point in points])
+            cached = self.arrowhead_cache[key] = (sprite, (left, top))
+            if len(self.arrowhead_cache) > ARROWHEAD_CACHE_SIZE:
+                self.arrowhead_cache.popitem(last=False)
+        return cached
 
     def draw_polyline_arrow(self, surface, points, color, progress=1.0, width=2, arrow_size=12):
         if len(points) < 2:
@@ -158,78 +416,58 @@ class LinkedListVisualizer:
             operations: List[Tuple[str, List[int | float | str | bool], str]],
             interval: float,
     ) -> List[OperationFrame]:
-        linked_list = LinkedList.create(self.ll_type)
+        """
+        Replays operations into delta frames.
+        A frame keeps the node list from before it as a keyframe once at least max(KEYFRAME_INTERVAL, list size) frames
+        have passed since the last one, so keyframes cost O(1) amortized per operation and any frame can be rebuilt
+        by replaying at most that many deltas.
+        """
+        linked_list = LinkedList.create(self.ll_type, indexed=True)
         nodes = []
         next_id = len(nodes)
         frames: List[OperationFrame] = []
         current_new_id = None
         current_cycle: Optional[Tuple[int, int]] = None
+        since_keyframe = math.inf
 
         for command, args, label in operations:
             size_before = len(nodes)
-            nodes_before = [NodeState(node.node_id, node.value) for node in nodes]
-
-            if command == "append":
-                value = args[0]
-                linked_list.append(value)
-                insert_index = size_before
-                new_node = NodeState(next_id, value)
-                next_id += 1
-                nodes.insert(insert_index, new_node)
-                frames.append(OperationFrame(
-                    op_type="add",
-                    duration=interval,
-                    nodes_before=nodes_before,
-                    nodes_after=[NodeState(node.node_id, node.value) for node in nodes],
-                    added_id=new_node.node_id,
-                    fade_id=current_new_id,
-                    current_new_id=new_node.node_id,
-                    cycle_link=current_cycle,
-                    label=label,
-                ))
-                current_new_id = new_node.node_id
-            elif command == "prepend":
-                value = args[0]
-                linked_list.prepend(value)
-                insert_index = 0
-                new_node = NodeState(next_id, value)
-                next_id += 1
-                nodes.insert(insert_index, new_node)
-                frames.append(OperationFrame(
-                    op_type="add",
-                    duration=interval,
-                    nodes_before=nodes_before,
-                    nodes_after=[NodeState(node.node_id, node.value) for node in nodes],
-                    added_id=new_node.node_id,
-                    fade_id=current_new_id,
-                    current_new_id=new_node.node_id,
-                    cycle_link=current_cycle,
-                    label=label,
-                ))
-                current_new_id = new_node.node_id
-            elif command == "insert":
-                index, value = args
-                if index <= 0:
-                    insert_index = 0
-                elif index >= size_before:
+            keyframe = None
+            if since_keyframe >= max(KEYFRAME_INTERVAL, size_before):
+                keyframe = list(nodes)
+
+            if command in ["append", "prepend", "insert"]:
+                if command == "append":
+                    value = args[0]
+                    linked_list.append(value)
                     insert_index = size_before
+                elif command == "prepend":
+                    value = args[0]
+                    linked_list.prepend(value)
+                    insert_index = 0
                 else:
-                    insert_index = index
-                linked_list.insert(insert_index, value)
+                    index, value = args
+                    if index <= 0:
+                        insert_index = 0
+                    elif index >= size_before:
+                        insert_index = size_before
+                    else:
+                        insert_index = index
+                    linked_list.insert(insert_index, value)
                 new_node = NodeState(next_id, value)
                 next_id += 1
                 nodes.insert(insert_index, new_node)
-                frames.append(OperationFrame(
+                frame = OperationFrame(
                     op_type="add",
                     duration=interval,
-                    nodes_before=nodes_before,
-                    nodes_after=[NodeState(node.node_id, node.value) for node in nodes],
+                    index=insert_index,
+                    node=new_node,
                     added_id=new_node.node_id,
                     fade_id=current_new_id,
                     current_new_id=new_node.node_id,
                     cycle_link=current_cycle,
                     label=label,
-                ))
+                )
                 current_new_id = new_node.node_id
             elif command == "remove":
                 if size_before == 0:
@@ -246,16 +484,16 @@ class LinkedListVisualizer:
                 nodes.pop(remove_index)
                 if current_new_id == removed_node.node_id:
                     current_new_id = None
-                frames.append(OperationFrame(
+                frame = OperationFrame(
                     op_type="remove",
                     duration=interval,
-                    nodes_before=nodes_before,
-                    nodes_after=[NodeState(node.node_id, node.value) for node in nodes],
+                    index=remove_index,
+                    node=removed_node,
                     removed_id=removed_node.node_id,
                     current_new_id=current_new_id,
                     cycle_link=current_cycle,
                     label=label,
-                ))
+                )
             elif command == "replace":
                 if size_before == 0:
                     continue
@@ -268,16 +506,16 @@ class LinkedListVisualizer:
                     replace_index = index
                 linked_list.replace(replace_index, value)
                 nodes[replace_index] = NodeState(nodes[replace_index].node_id, value)
-                frames.append(OperationFrame(
+                frame = OperationFrame(
                     op_type="replace",
                     duration=interval,
-                    nodes_before=nodes_before,
-                    nodes_after=[NodeState(node.node_id, node.value) for node in nodes],
+                    index=replace_index,
+                    node=nodes[replace_index],
                     replaced_id=nodes[replace_index].node_id,
                     current_new_id=current_new_id,
                     cycle_link=current_cycle,
                     label=label,
-                ))
+                )
             elif command == "cycle":
                 if self.ll_type == "singly":
                     if size_before == 0:
@@ -296,52 +534,419 @@ class LinkedListVisualizer:
                             end_node_id = None
                     if start_node_id is not None and end_node_id is not None:
                         current_cycle = (end_node_id, start_node_id)
-                frames.append(OperationFrame(
+                frame = OperationFrame(
                     op_type="cycle",
                     duration=interval,
-                    nodes_before=nodes_before,
-                    nodes_after=[NodeState(node.node_id, node.value) for node in nodes],
                     current_new_id=current_new_id,
                     cycle_link=current_cycle,
                     label=label,
-                ))
+                )
             elif command == "has_cycle":
                 result = linked_list.has_cycle()
-                frames.append(OperationFrame(
+                frame = OperationFrame(
                     op_type="has_cycle",
                     duration=interval,
-                    nodes_before=nodes_before,
-                    nodes_after=[NodeState(node.node_id, node.value) for node in nodes],
                     current_new_id=current_new_id,
                     cycle_link=current_cycle,
                     label=f"{label} => {result}",
-                ))
+                )
             else:
                 raise ValueError(f"Unsupported operation '{command}'.")
 
+            if keyframe is not None:
+                frame.keyframe = keyframe
+                since_keyframe = 0
+            since_keyframe += 1
+            frames.append(frame)
+
+        self.state_index = -1
+        self.state_nodes = []
+        self.timeline = list(accumulate(frame.duration for frame in frames))
         return frames
 
+    def apply_frame(self, nodes: List[NodeState], frame: OperationFrame):
+        """Applies the delta of frame to nodes in place."""
+        if frame.op_type == "add":
+            nodes.insert(frame.index, frame.node)
+        elif frame.op_type == "remove":
+            nodes.pop(frame.index)
+        elif frame.op_type == "replace":
+            nodes[frame.index] = frame.node
+
+    def frame_nodes(self, frames: List[OperationFrame], frame_index: int, after: bool = True) -> List[NodeState]:
+        """
+        Returns the node list after (or before) frames[frame_index].
+        Playback moves forward one delta at a time from the cached state; seeking backwards restarts from the
+        nearest keyframe. The returned list is the cache itself and changes on the next call.
+        """
+        target = frame_index + 1 if after else frame_index
+        if frame_index < 0 or not frames:
+            return []
+        if not 0 <= self.state_index <= target or target - self.state_index > KEYFRAME_INTERVAL:
+            keyframe_index = min(target, len(frames) - 1)
+            while frames[keyframe_index].keyframe is None:
+                keyframe_index -= 1
+            if not keyframe_index <= self.state_index <= target:
+                self.state_index = keyframe_index
+                self.state_nodes = list(frames[keyframe_index].keyframe)
+        while self.state_index < target:
+            self.apply_frame(self.state_nodes, frames[self.state_index])
+            self.state_index += 1
+        return self.state_nodes
+
     def get_frame_at_time(self, frames: List[OperationFrame], elapsed: float) -> Tuple[OperationFrame, float, int]:
+        """
+        Returns (frame, progress, index) of the frame playing at elapsed seconds.
+        Time complexity: O(log n)
+        """
         if not frames:
-            empty_frame = OperationFrame("idle", 1.0, [], [])
+            empty_frame = OperationFrame("idle", 1.0)
             return empty_frame, 0.0, -1
-        total = 0.0
-        for index, frame in enumerate(frames):
-            total += frame.duration
-            if elapsed <= total:
-                frame_elapsed = elapsed - (total - frame.duration)
-                progress = self.clamp(frame_elapsed / max(frame.duration, 0.01), 0.0, 1.0)
-                return frame, progress, index
-        return frames[-1], 1.0, len(frames) - 1
+        if len(self.timeline) != len(frames):
+            self.timeline = list(accumulate(frame.duration for frame in frames))
+        index = bisect_left(self.timeline, elapsed)
+        if index >= len(frames):
+            return frames[-1], 1.0, len(frames) - 1
+        frame = frames[index]
+        frame_elapsed = elapsed - (self.timeline[index] - frame.duration)
+        progress = self.clamp(frame_elapsed / max(frame.duration, 0.01), 0.0, 1.0)
+        return frame, progress, index
+
+    def frame_start_time(self, frame_index: int) -> float:
+        """Returns the elapsed time at which frames[frame_index] starts, for seeking."""
+        if frame_index <= 0 or not self.timeline:
+            return 0.0
+        return self.timeline[min(frame_index, len(self.timeline)) - 1]
+
+    def draw_panel(self, screen, frames: List[OperationFrame], frame_index: int, font, panel_font):
+        panel_rect = pygame.Rect(20, 20, PANEL_WIDTH - 40, self.height - 40)
+        pygame.draw.rect(screen, PANEL_BG, panel_rect)
+        pygame.draw.rect(screen, PANEL_BORDER, panel_rect, 2)
+
+        panel_title = self.text_cache.render(font, "Operations", PANEL_TEXT)
+        screen.blit(panel_title, (panel_rect.x + 16, panel_rect.y + 14))
+
+        line_height = 22
+        max_lines = max(1, (panel_rect.height - 60) // line_height)
+        end_index = max(0, frame_index + 1)
+        start_index = max(0, end_index - max_lines)
+        visible_ops = frames[start_index:end_index]
+        for idx, op_frame in enumerate(visible_ops):
+            op_index = start_index + idx
+            color = PANEL_TEXT
+            if op_index == frame_index:
+                color = PANEL_HIGHLIGHT
+            text_surface = self.text_cache.render(panel_font, op_frame.label, color)
+            screen.blit(text_surface, (panel_rect.x + 16, panel_rect.y + 48 + idx * line_height))
+
+    def draw_nodes(self, screen, visuals: List[NodeVisual], frame: OperationFrame, progress: float, blink_on: bool,
+                   font, node_radius: float) -> Tuple[Dict[int, int], Dict[int, NodeVisual]]:
+        """Draws node circles and labels, returning the radius and visual of each node by id."""
+        edge_width = max(1, round(3 * node_radius / NODE_RADIUS))
+        radius_map = {}
+        visuals_by_id = {}
+        for visual in visuals:
+            scale = 1.0
+            if frame.op_type == "add" and visual.node_id == frame.added_id:
+                scale = 0.5 + 0.5 * progress
+            radius = max(1, int(node_radius * scale))
+            radius_map[visual.node_id] = radius
+            x, y = visual.position
+
+            color = NODE_COLOR
+            if frame.op_type == "add":
+                if visual.node_id == frame.added_id:
+                    color = NODE_NEW_COLOR
+                elif frame.fade_id is not None and visual.node_id == frame.fade_id:
+                    color = self.lerp_color(NODE_NEW_COLOR, NODE_COLOR, progress)
+            elif frame.current_new_id is not None and visual.node_id == frame.current_new_id:
+                color = NODE_NEW_COLOR
+            if frame.op_type == "remove" and blink_on and visual.node_id == frame.removed_id:
+                color = NODE_REMOVE_COLOR
+            if frame.op_type == "replace" and visual.node_id == frame.replaced_id:
+                if progress < REPLACE_PHASE:
+                    if blink_on:
+                        color = NODE_REPLACE_COLOR
+                else:
+                    fade_progress = (progress - REPLACE_PHASE) / max(1 - REPLACE_PHASE, 0.01)
+                    color = self.lerp_color(NODE_REPLACE_COLOR, NODE_COLOR, fade_progress)
+
+            pygame.draw.circle(screen, color, (x, y), radius)
+            pygame.draw.circle(screen, NODE_EDGE_COLOR, (x, y), radius, edge_width)
+
+            if radius >= LABEL_MIN_RADIUS:
+                label = self.text_cache.render(font, str(visual.value), TEXT_COLOR)
+                label_rect = label.get_rect(center=(x, y))
+                screen.blit(label, label_rect)
+            visuals_by_id[visual.node_id] = visual
+        return radius_map, visuals_by_id
+
+    def draw_links(self, screen, visuals: List[NodeVisual], radius_map: Dict[int, int], frame: OperationFrame,
+                   progress: float, line_scale: float, skip_ids: frozenset = frozenset()):
+        """Draws the arrows between neighbouring visuals, wrapping between rows, except links touching skip_ids."""
+        op_elapsed = progress * frame.duration
+        bidirectional = self.ll_type == "doubly"
+        width = max(1, round(3 * line_scale))
+        arrow_size = 12 * line_scale
+        # finished links are batched: one line or polyline each (a doubly link shares it both ways), then every head
+        heads = []
+        for current_id, next_id, path in self.link_geometry(visuals, radius_map, skip_ids):
+            link_progress = 1.0
+            if frame.op_type == "add" and frame.added_id in {current_id, next_id}:
+                link_progress = self.clamp(op_elapsed / max(self.arrow_interval, 0.01), 0.0, 1.0)
+
+            if link_progress >= 1.0:
+                if len(path) > 2:
+                    pygame.draw.lines(screen, ARROW_COLOR, False, path, width)
+                else:
+                    pygame.draw.line(screen, ARROW_COLOR, path[0], path[1], width)
+                heads.append((path[-2], path[-1]))
+                if bidirectional:
+                    heads.append((path[1], path[0]))
+            elif len(path) > 2:
+                self.draw_polyline_arrow(screen, path, ARROW_COLOR, progress=link_progress, width=width,
+                                         arrow_size=arrow_size)
+                if bidirectional:
+                    reverse_path = list(reversed(path))
+                    self.draw_polyline_arrow(screen, reverse_path, ARROW_COLOR, progress=link_progress, width=width,
+                                             arrow_size=arrow_size)
+            else:
+                start, end = path
+                self.draw_arrow(screen, start, end, ARROW_COLOR, progress=link_progress, width=width,
+                                arrow_size=arrow_size)
+                if bidirectional:
+                    self.draw_arrow(screen, end, start, ARROW_COLOR, progress=link_progress, width=width,
+                                    arrow_size=arrow_size)
+
+        # settled links end on whole pixels and point one of four ways, so their sprites are looked up once per call
+        sprites = []
+        by_direction = {}
+        for start, end in heads:
+            tip_x, tip_y = end
+            if type(tip_x) is int and type(tip_y) is int:
+                unit = (float((start[0] > tip_x) - (start[0] < tip_x)), float((start[1] > tip_y) - (start[1] < tip_y)))
+                if (unit[0] == 0.0) != (unit[1] == 0.0):
+                    head = by_direction.get(unit)
+                    if head is None:
+                        head = by_direction[unit] = self.arrowhead_sprite(unit, arrow_size, ARROW_COLOR, (0, 0))
+                    sprites.append((head[0], (tip_x + head[1][0], tip_y + head[1][1])))
+                    continue
+            self.draw_arrowhead(screen, start, end, ARROW_COLOR, arrow_size)
+        screen.blits(sprites, doreturn=False)
+
+    def draw_cycle(self, screen, visuals_by_id: Dict[int, NodeVisual], radius_map: Dict[int, int],
+                   frame: OperationFrame, progress: float, line_scale: float):
+        """Draws the arc from the tail back to the cycle start when both ends are laid out, returning its bounds."""
+        if not frame.cycle_link:
+            return None
+        cycle_end_id, cycle_start_id = frame.cycle_link
+        cycle_end = visuals_by_id.get(cycle_end_id)
+        cycle_start = visuals_by_id.get(cycle_start_id)
+        if not cycle_end or not cycle_start:
+            return None
+
+        start_point = (
+            cycle_end.position[0] + radius_map[cycle_end.node_id],
+            cycle_end.position[1],
+        )
+        end_point = (
+            cycle_start.position[0] - radius_map[cycle_start.node_id],
+            cycle_start.position[1],
+        )
+        reach = 30 * line_scale
+        min_y = min(cycle_end.position[1], cycle_start.position[1])
+        max_y = max(cycle_end.position[1], cycle_start.position[1])
+        mid_y = min_y - 70 * line_scale
+        if mid_y < 30:
+            mid_y = max_y + 70 * line_scale
+        path = [
+            start_point,
+            (start_point[0] + reach, start_point[1]),
+            (start_point[0] + reach, mid_y),
+            (end_point[0] - reach, mid_y),
+            (end_point[0] - reach, end_point[1]),
+            end_point,
+        ]
+        cycle_progress = 1.0
+        if frame.op_type == "cycle":
+            op_elapsed = progress * frame.duration
+            cycle_progress = self.clamp(op_elapsed / max(self.arrow_interval, 0.01), 0.0, 1.0)
+        self.draw_polyline_arrow(screen, path, CYCLE_COLOR, progress=cycle_progress, width=max(1, round(3 * line_scale)),
+                                 arrow_size=12 * line_scale)
+        return self.bounding_rect([point for point in path], 12 * line_scale + 3)
+
+    def draw_lod(self, screen, grid: GridLayout, viewport: Viewport, frame: OperationFrame, area: pygame.Rect):
+        """
+        Level-of-detail view for nodes smaller than LOD_RADIUS pixels.
+        Each LOD_STRIP pixels of screen height becomes one bar across the rows it covers, shaded by how full they are,
+        and the node the current operation touched is marked on top.
+        Time complexity: O(screen height)
+        """
+        if grid.count == 0:
+            return
+        for y in range(area.top, area.bottom, LOD_STRIP):
+            top = viewport.to_world((0, y))[1]
+            bottom = viewport.to_world((0, y + LOD_STRIP))[1]
+            first_row = max(0, math.ceil((top - grid.origin_y) / grid.spacing_y))
+            last_row = min(grid.rows - 1, math.ceil((bottom - grid.origin_y) / grid.spacing_y) - 1)
+            if first_row > last_row:
+                continue
+            first_index = first_row * grid.per_row
+            last_index = min(grid.count, (last_row + 1) * grid.per_row) - 1
+            filled = last_index + 1 - first_index
+            fraction = filled / ((last_row - first_row + 1) * grid.per_row)
+            end_col = grid.per_row - 1 if filled >= grid.per_row else last_index % grid.per_row
+            x_start = viewport.to_screen(grid.position(first_index))[0]
+            x_end = viewport.to_screen(grid.position(first_index + end_col))[0]
+            color = self.lerp_color(DEFAULT_BG_COLOR, NODE_COLOR, 0.4 + 0.6 * fraction)
+            pygame.draw.rect(screen, color, (x_start, y, max(1, x_end - x_start + 1), LOD_STRIP))
+
+        colors = {"add": NODE_NEW_COLOR, "remove": NODE_REMOVE_COLOR, "replace": NODE_REPLACE_COLOR}
+        if frame.op_type in colors and frame.index is not None:
+            marker = viewport.to_screen(grid.position(min(frame.index, grid.count - 1)))
+            pygame.draw.circle(screen, colors[frame.op_type], marker, 2 * LOD_RADIUS)
+
+    def bounding_rect(self, points: List[Tuple[float, float]], pad: float) -> pygame.Rect:
+        """Returns the rectangle around points, grown by pad on every side."""
+        xs = [point[0] for point in points]
+        ys = [point[1] for point in points]
+        pad = math.ceil(pad)
+        left = math.floor(min(xs)) - pad
+        top = math.floor(min(ys)) - pad
+        return pygame.Rect(left, top, math.ceil(max(xs)) + pad - left + 1, math.ceil(max(ys)) + pad - top + 1)
+
+    def animating_ids(self, frame: OperationFrame, progress: float) -> Optional[frozenset]:
+        """
+        Returns the ids of the nodes that change from tick to tick while frame plays,
+        or None once nothing in the frame moves any more.
+        """
+        if progress >= 1.0:
+            return None
+        if frame.op_type == "add":
+            return frozenset(node_id for node_id in (frame.added_id, frame.fade_id) if node_id is not None)
+        if frame.op_type == "remove" and progress < REMOVE_PHASE:
+            return frozenset([frame.removed_id])
+        if frame.op_type == "replace":
+            return frozenset([frame.replaced_id])
+        if frame.op_type == "cycle":
+            return frozenset()
+        return None
+
+    def draw_background(self, background, key: Tuple, frames: List[OperationFrame], frame_index: int,
+                        frame: OperationFrame, progress: float, nodes: List[NodeState], viewport: Viewport,
+                        animating: Optional[frozenset], font, panel_font) -> Scene:
+        """
+        Draws the panel and every settled node and link onto background.
+        Called only when the frame, its phase or the viewport changes.
+        """
+        background.fill(DEFAULT_BG_COLOR)
+        self.draw_panel(background, frames, frame_index, font, panel_font)
+
+        grid = self.grid_layout(len(nodes), self.width, self.height)
+        viewport.max_zoom = MAX_NODE_SCALE / grid.scale
+        scene = Scene(key, grid.scale * viewport.zoom)
+        area = self.node_area(self.width, self.height)
+        background.set_clip(area)
+        if NODE_RADIUS * scene.line_scale < LOD_RADIUS:
+            self.draw_lod(background, grid, viewport, frame, area)
+            background.set_clip(None)
+            return scene
+
+        skip_ids = animating or frozenset()
+        visuals = self.layout_nodes(nodes, self.width, self.height, viewport)
+        settled = [visual for visual in visuals if visual.node_id not in skip_ids]
+        scene.radius_map, _ = self.draw_nodes(background, settled, frame, progress, False, font,
+                                              NODE_RADIUS * scene.line_scale)
+        self.draw_links(background, visuals, scene.radius_map, frame, progress, scene.line_scale, skip_ids)
+        scene.visuals_by_id = {visual.node_id: visual for visual in visuals}
+
+        if animating is not None:
+            linked = set()
+            for position, visual in enumerate(visuals):
+                if visual.node_id in animating:
+                    scene.animated.append(visual)
+                    linked.update(range(max(0, position - 1), min(len(visuals), position + 2)))
+            scene.linked = [visuals[position] for position in sorted(linked)]
+            scene.cycle = bool(frame.cycle_link) and (frame.op_type == "cycle" or bool(animating & set(frame.cycle_link)))
+        if not scene.cycle:
+            self.draw_cycle(background, scene.visuals_by_id, scene.radius_map, frame, progress, scene.line_scale)
+        background.set_clip(None)
+        return scene
+
+    def draw_animated(self, screen, scene: Scene, frame: OperationFrame, progress: float, blink_on: bool,
+                      font) -> List[pygame.Rect]:
+        """Draws the animated part of scene over the background and returns the rectangles it touched."""
+        node_radius = NODE_RADIUS * scene.line_scale
+        screen.set_clip(self.node_area(self.width, self.height))
+        radius_map, _ = self.draw_nodes(screen, scene.animated, frame, progress, blink_on, font, node_radius)
+        radius_map = ChainMap(radius_map, scene.radius_map)
+        self.draw_links(screen, scene.linked, radius_map, frame, progress, scene.line_scale)
+
+        # links and arrowheads reach at most one radius plus an arrowhead past a node centre
+        pad = node_radius + 12 * scene.line_scale + 3
+        rects = []
+        for visual in scene.animated:
+            rect = self.bounding_rect([visual.position], pad)
+            if radius_map[visual.node_id] >= LABEL_MIN_RADIUS:
+                label_rect = self.text_cache.render(font, str(visual.value), TEXT_COLOR).get_rect(center=visual.position)
+                rect.union_ip(label_rect)
+            rects.append(rect)
+        for current, next_visual in zip(scene.linked, scene.linked[1:]):
+            if next_visual.index == current.index + 1:
+                rects.append(self.bounding_rect([current.position, next_visual.position], pad))
+        if scene.cycle:
+            cycle_rect = self.draw_cycle(screen, scene.visuals_by_id, radius_map, frame, progress, scene.line_scale)
+            if cycle_rect:
+                rects.append(cycle_rect)
+        screen.set_clip(None)
+        return rects
+
+    def load_fonts(self):
+        """Returns (node font, panel font)."""
+        return pygame.font.SysFont("Avenir", 24), pygame.font.SysFont("Avenir", 18)
+
+    def render(self, screen, background, frames: List[OperationFrame], now: float, viewport: Viewport,
+               scene: Optional[Scene], font, panel_font) -> Tuple[Scene, List[pygame.Rect]]:
+        """
+        Brings screen up to date for elapsed time now.
+        The background is redrawn only when the frame, its phase or the viewport changed since scene;
+        otherwise only the animated rectangles are restored and redrawn.
+        Returns the current scene and the screen rectangles that changed, which is empty once the frame has settled.
+        """
+        frame, progress, frame_index = self.get_frame_at_time(frames, now)
+        animating = self.animating_ids(frame, progress)
+        before = frame.op_type == "remove" and progress < REMOVE_PHASE
+        blink_on = frame.op_type in ("remove", "replace") and int((now / 0.2)) % 2 == 0
+        key = (frame_index, animating is None, before, viewport.zoom, viewport.offset_x, viewport.offset_y)
+
+        if scene is None or scene.key != key:
+            nodes_render = self.frame_nodes(frames, frame_index, after=not before)
+            scene = self.draw_background(background, key, frames, frame_index, frame, progress, nodes_render,
+                                         viewport, animating, font, panel_font)
+            screen.blit(background, (0, 0))
+            scene.dirty_rects = self.draw_animated(screen, scene, frame, progress, blink_on, font)
+            return scene, [screen.get_rect()]
+        if animating is None:
+            return scene, []
+
+        for rect in scene.dirty_rects:
+            screen.blit(background, rect, rect)
+        rects = self.draw_animated(screen, scene, frame, progress, blink_on, font)
+        changed = scene.dirty_rects + rects
+        scene.dirty_rects = rects
+        return scene, changed
 
     def display(self):
         frames = self.build_frames(self.operations, self.node_interval)
         pygame.init()
         screen = pygame.display.set_mode((self.width, self.height))
         pygame.display.set_caption("Linked List Visualization")
-        font = pygame.font.SysFont("Avenir", 24)
-        panel_font = pygame.font.SysFont("Avenir", 18)
+        font, panel_font = self.load_fonts()
         clock = pygame.time.Clock()
+        background = pygame.Surface((self.width, self.height)).convert()
+        viewport = Viewport()
+        scene = None
+        dragging = False
 
         start_time = pygame.time.get_ticks() / 1000.0
         running = True
@@ -351,162 +956,30 @@ class LinkedListVisualizer:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
+                elif event.type == pygame.KEYDOWN and event.key in (pygame.K_LEFT, pygame.K_RIGHT) and frames:
+                    # jump to the start of the previous or next operation
+                    current_index = self.get_frame_at_time(frames, now)[2]
+                    step = -1 if event.key == pygame.K_LEFT else 1
+                    target_index = int(self.clamp(current_index + step, 0, len(frames) - 1))
+                    # land just past the boundary, which belongs to the frame before it
+                    target_time = self.frame_start_time(target_index) + 0.001
+                    start_time += now - target_time
+                    now = target_time
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_0:
+                    viewport.reset()
+                elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                    dragging = True
+                elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+                    dragging = False
+                elif event.type == pygame.MOUSEMOTION and dragging:
+                    viewport.pan(*event.rel)
+                elif event.type == pygame.MOUSEWHEEL:
+                    viewport.zoom_at(pygame.mouse.get_pos(), ZOOM_STEP ** event.y)
+
+            scene, changed = self.render(screen, background, frames, now, viewport, scene, font, panel_font)
+            if changed:
+                pygame.display.update(changed)
 
-            frame, progress, frame_index = self.get_frame_at_time(frames, now)
-            remove_phase = 0.7
-            replace_phase = 0.5
-
-            if frame.op_type == "remove" and progress < remove_phase:
-                nodes_render = frame.nodes_before
-                blink_on = int((now / 0.2)) % 2 == 0
-            elif frame.op_type == "remove":
-                nodes_render = frame.nodes_after
-                blink_on = False
-            elif frame.op_type == "replace":
-                nodes_render = frame.nodes_after
-                blink_on = int((now / 0.2)) % 2 == 0
-            else:
-                nodes_render = frame.nodes_after
-                blink_on = False
-
-            visuals = self.layout_nodes(nodes_render, self.width, self.height)
-            screen.fill(DEFAULT_BG_COLOR)
-
-            panel_rect = pygame.Rect(20, 20, PANEL_WIDTH - 40, self.height - 40)
-            pygame.draw.rect(screen, PANEL_BG, panel_rect)
-            pygame.draw.rect(screen, PANEL_BORDER, panel_rect, 2)
-
-            panel_title = font.render("Operations", True, PANEL_TEXT)
-            screen.blit(panel_title, (panel_rect.x + 16, panel_rect.y + 14))
-
-            line_height = 22
-            max_lines = max(1, (panel_rect.height - 60) // line_height)
-            end_index = max(0, frame_index + 1)
-            start_index = max(0, end_index - max_lines)
-            visible_ops = frames[start_index:end_index]
-            for idx, op_frame in enumerate(visible_ops):
-                op_index = start_index + idx
-                color = PANEL_TEXT
-                if op_index == frame_index:
-                    color = PANEL_HIGHLIGHT
-                text_surface = panel_font.render(op_frame.label, True, color)
-                screen.blit(text_surface, (panel_rect.x + 16, panel_rect.y + 48 + idx * line_height))
-
-            radius_map = {}
-            visuals_by_id = {}
-            for visual in visuals:
-                scale = 1.0
-                if frame.op_type == "add" and visual.node_id == frame.added_id:
-                    scale = 0.5 + 0.5 * progress
-                radius = int(32 * scale)
-                radius_map[visual.node_id] = radius
-                x, y = visual.position
-
-                color = NODE_COLOR
-                if frame.op_type == "add":
-                    if visual.node_id == frame.added_id:
-                        color = NODE_NEW_COLOR
-                    elif frame.fade_id is not None and visual.node_id == frame.fade_id:
-                        color = self.lerp_color(NODE_NEW_COLOR, NODE_COLOR, progress)
-                elif frame.current_new_id is not None and visual.node_id == frame.current_new_id:
-                    color = NODE_NEW_COLOR
-                if frame.op_type == "remove" and blink_on and visual.node_id == frame.removed_id:
-                    color = NODE_REMOVE_COLOR
-                if frame.op_type == "replace" and visual.node_id == frame.replaced_id:
-                    if progress < replace_phase:
-                        if blink_on:
-                            color = NODE_REPLACE_COLOR
-                    else:
-                        fade_progress = (progress - replace_phase) / max(1 - replace_phase, 0.01)
-                        color = self.lerp_color(NODE_REPLACE_COLOR, NODE_COLOR, fade_progress)
-
-                pygame.draw.circle(screen, color, (x, y), radius)
-                pygame.draw.circle(screen, NODE_EDGE_COLOR, (x, y), radius, 3)
-
-                label = font.render(str(visual.value), True, TEXT_COLOR)
-                label_rect = label.get_rect(center=(x, y))
-                screen.blit(label, label_rect)
-                visuals_by_id[visual.node_id] = visual
-
-            op_elapsed = progress * frame.duration
-            bidirectional = self.ll_type == "doubly"
-            for index in range(len(visuals) - 1):
-                current = visuals[index]
-                next_visual = visuals[index + 1]
-
-                if current.row != next_visual.row:
-                    start = (
-                        current.position[0],
-                        current.position[1] + radius_map.get(current.node_id, 42),
-                    )
-                    end = (
-                        next_visual.position[0],
-                        next_visual.position[1] - radius_map.get(next_visual.node_id, 42),
-                    )
-                    turn_y = current.position[1] + (next_visual.position[1] - current.position[1]) / 2
-                    path = [
-                        start,
-                        (start[0], turn_y),
-                        (end[0], turn_y),
-                        end,
-                    ]
-                    link_progress = 1.0
-                    if frame.op_type == "add" and frame.added_id in {current.node_id, next_visual.node_id}:
-                        link_progress = self.clamp(op_elapsed / max(self.arrow_interval, 0.01), 0.0, 1.0)
-                    self.draw_polyline_arrow(screen, path, ARROW_COLOR, progress=link_progress, width=3)
-                    if bidirectional:
-                        reverse_path = list(reversed(path))
-                        self.draw_polyline_arrow(screen, reverse_path, ARROW_COLOR, progress=link_progress, width=3)
-                else:
-                    start = (
-                        current.position[0] + radius_map.get(current.node_id, 42),
-                        current.position[1],
-                    )
-                    end = (
-                        next_visual.position[0] - radius_map.get(next_visual.node_id, 42),
-                        next_visual.position[1],
-                    )
-                    link_progress = 1.0
-                    if frame.op_type == "add" and frame.added_id in {current.node_id, next_visual.node_id}:
-                        link_progress = self.clamp(op_elapsed / max(self.arrow_interval, 0.01), 0.0, 1.0)
-                    self.draw_arrow(screen, start, end, ARROW_COLOR, progress=link_progress, width=3)
-                    if bidirectional:
-                        self.draw_arrow(screen, end, start, ARROW_COLOR, progress=link_progress, width=3)
-
-            if frame.cycle_link:
-                cycle_end_id, cycle_start_id = frame.cycle_link
-                cycle_end = visuals_by_id.get(cycle_end_id)
-                cycle_start = visuals_by_id.get(cycle_start_id)
-                if cycle_end and cycle_start:
-                    start_radius = radius_map.get(cycle_end.node_id, 32)
-                    end_radius = radius_map.get(cycle_start.node_id, 32)
-                    start_point = (
-                        cycle_end.position[0] + start_radius,
-                        cycle_end.position[1],
-                    )
-                    end_point = (
-                        cycle_start.position[0] - end_radius,
-                        cycle_start.position[1],
-                    )
-                    min_y = min(cycle_end.position[1], cycle_start.position[1])
-                    max_y = max(cycle_end.position[1], cycle_start.position[1])
-                    mid_y = min_y - 70
-                    if mid_y < 30:
-                        mid_y = max_y + 70
-                    path = [
-                        start_point,
-                        (start_point[0] + 30, start_point[1]),
-                        (start_point[0] + 30, mid_y),
-                        (end_point[0] - 30, mid_y),
-                        (end_point[0] - 30, end_point[1]),
-                        end_point,
-                    ]
-                    cycle_progress = 1.0
-                    if frame.op_type == "cycle":
-                        cycle_progress = self.clamp(op_elapsed / max(self.arrow_interval, 0.01), 0.0, 1.0)
-                    self.draw_polyline_arrow(screen, path, CYCLE_COLOR, progress=cycle_progress, width=3)
-
-            pygame.display.flip()
             clock.tick(60)
 
         pygame.quit()
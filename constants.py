@@ -4,6 +4,8 @@ PRINT_ARROW_UP = "\u2191"
 PRINT_ARROW_DOWN = "\u2193"
 PRINT_ARROW_LEFT = "\u2190"
 PRINT_ARROW_RIGHT = "\u2192"
+PRINT_ELLIPSIS = "\u2026"
+SHOW_MAX_ITEMS = 100  # show prints only the ends of longer lists
 
 RED = '\033[91m'
 GREEN = '\033[92m'
@@ -13,6 +15,15 @@ LIGHT_BLUE = "\033[1;34m"
 PRINT_COLOR = YELLOW
 RESET = '\033[0m'   # reset color to default
 
+VALUE_TYPES = frozenset([int, float, str, bool])
+
+STREAM_PROGRESS_BYTES = 16 * 1024 * 1024   # ops files at least this large report replay progress
+PROGRESS_INTERVAL = 100_000                 # operations between progress reports
+SORT_METHODS = frozenset([1, 2, 3, 4])
+EXTERNAL_RUN_SIZE = 100_000                 # values per sorted run the external sort spills to disk
+OPTIMIZE_MIN_RUN = 8                        # shorter append or prepend runs replay one by one, which is cheaper
+OPTIMIZE_RUN_LIMIT = 65_536                 # appends or prepends the ops optimizer folds into one bulk splice
+
 DEFAULT_INTERVAL = 0.4
 DEFAULT_WIDTH = 1000
 DEFAULT_HEIGHT = 500
@@ -30,5 +41,18 @@ NODE_EDGE_COLOR = (200, 200, 200)
 TEXT_COLOR = (230, 245, 248)
 ARROW_COLOR = (200, 220, 230)
 CYCLE_COLOR = (80, 200, 120)
+KEYFRAME_INTERVAL = 64   # fewest frames between stored node-list keyframes
+TEXT_CACHE_SIZE = 2048   # rendered text surfaces kept by the visualizer
+NODE_RADIUS = 32
+LABEL_MIN_RADIUS = 12    # smaller nodes are drawn without their value
+LOD_RADIUS = 6           # smaller nodes collapse into level-of-detail strips
+LOD_STRIP = 2            # strip height in pixels
+MIN_ZOOM = 0.02
+MAX_NODE_SCALE = 2.0     # zooming in stops once nodes reach twice their full size
+ZOOM_STEP = 1.1          # zoom factor per mouse wheel notch
+REMOVE_PHASE = 0.7       # share of a remove spent blinking before the node disappears
+REPLACE_PHASE = 0.5      # share of a replace spent blinking before fading back
+EXPORT_FPS = 30
+ARROWHEAD_CACHE_SIZE = 256
 
 DEFAULT_VALUES = [1,2,3,4,5,6,7,8,9,10]
\ No newline at end of file
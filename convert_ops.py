@@ -0,0 +1,19 @@
+import argparse
+from binary_ops import write_binary_ops
+from main import iter_operations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert a text operations file to the binary ops log format.")
+    parser.add_argument("source", type=str, help="Path to operations text file.")
+    parser.add_argument("destination", type=str, help="Path of the binary file to write.")
+    args = parser.parse_args()
+
+    try:
+        count = write_binary_ops(iter_operations(args.source), args.destination)
+        print(f"Wrote {count} operations to {args.destination}.")
+    except ValueError as e:
+        print(e)
+
+if __name__ == "__main__":
+    main()
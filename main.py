@@ -1,8 +1,17 @@
 import argparse
+import json
+import os
+import sys
+import time
 from classes.linked_list import LinkedList
-from typing import List, Tuple
+from classes.replay_tracer import ReplayTracer
+from classes.ops_optimizer import OpsOptimizer
+from typing import List, Tuple, Iterator
 from classes.visualizer import LinkedListVisualizer
-from constants import DEFAULT_VALUES
+from classes.exporter import export_animation
+from classes.batch import resolve_ops_files, run_batch
+from binary_ops import is_binary_ops, iter_binary_ops
+from constants import DEFAULT_VALUES, STREAM_PROGRESS_BYTES, EXPORT_FPS
 
 
 def parse_values(raw_values: str) -> List[int | float | str | bool]:
@@ -15,9 +24,16 @@ def parse_values(raw_values: str) -> List[int | float | str | bool]:
 
 
 def parse_operations(path: str) -> List[Tuple[str, List[int | float | str | bool], str]]:
-    operations = []
+    return list(iter_operations(path))
+
+
+def iter_operations(path: str) -> Iterator[Tuple[str, List[int | float | str | bool], str]]:
+    """
+    Yields (command, args, raw_line) for each operation in the file as it is read,
+    so a replay can start before the whole file is parsed and memory stays constant.
+    """
     if not path:
-        return operations
+        return
     with open(path, "r", encoding="utf-8") as handle:
         for line_number, line in enumerate(handle, start=1):
             stripped = line.strip()
@@ -29,52 +45,118 @@ def parse_operations(path: str) -> List[Tuple[str, List[int | float | str | bool
             if command in {"append", "prepend"}:
                 if len(args) != 1:
                     raise ValueError(f"Line {line_number}: {command} requires 1 value.")
-                operations.append((command, [args[0]], stripped))
+                yield command, [args[0]], stripped
             elif command == "insert":
                 if len(args) != 2:
                     raise ValueError(f"Line {line_number}: insert requires a value and index.")
-                operations.append((command, [int(args[0]), args[1]], stripped))
+                yield command, [int(args[0]), args[1]], stripped
             elif command in {"remove", "delete"}:
                 if len(args) != 1:
                     raise ValueError(f"Line {line_number}: {command} requires an index.")
-                operations.append(("remove", [int(args[0])], stripped))
+                yield "remove", [int(args[0])], stripped
             elif command == "replace":
                 if len(args) != 2:
                     raise ValueError(f"Line {line_number}: replace requires a value and index.")
-                operations.append(("replace", [int(args[0]), args[1]], stripped))
+                yield "replace", [int(args[0]), args[1]], stripped
             elif command == "cycle":
                 if len(args) != 1:
                     raise ValueError(f"Line {line_number}: create cycle requires starting index.")
-                operations.append(("cycle", [int(args[0])], stripped))
+                yield "cycle", [int(args[0])], stripped
             elif command == "has_cycle":
-                operations.append(("has_cycle", [], stripped))
+                yield "has_cycle", [], stripped
             else:
                 raise ValueError(f"Line {line_number}: unknown command '{command}'.")
 
-    return operations
+
+def load_operations(path: str, stream: bool = False):
+    """
+    Returns the operations of a text or binary ops file, detected by the binary magic header.
+    stream=True returns a generator that parses as it is consumed instead of a list.
+    """
+    if is_binary_ops(path):
+        operations = iter_binary_ops(path, labels=not stream)
+    else:
+        operations = iter_operations(path)
+    return operations if stream else list(operations)
+
+
+def stream_operations(path: str):
+    """load_operations for batch workers, which only need the final list."""
+    return load_operations(path, stream=True)
+
+
+def replay_batch(args: argparse.Namespace):
+    """
+    Replays every ops file matched by --ops-file across worker processes and writes one JSON line per file,
+    as each finishes, to --out or stdout. A summary goes to stderr.
+    """
+    paths = resolve_ops_files(args.ops_file)
+    options = {"storage": args.storage, "indexed": args.indexed, "value_indexed": args.value_index,
+               "optimize": not args.no_optimize}
+    out = open(args.out, "w", encoding="utf-8") if args.out else sys.stdout
+    failed = 0
+    start = time.perf_counter()
+    try:
+        for result in run_batch(paths, args.ll_type, stream_operations, options, args.workers):
+            failed += not result["ok"]
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(f"Replayed {len(paths):,} ops files in {time.perf_counter() - start:.2f}s, {failed:,} failed",
+          file=sys.stderr)
+
+
+def report_progress(count: int, size: int):
+    print(f"\rReplayed {count:,} operations | {size:,} nodes", end="", file=sys.stderr, flush=True)
 
 
 def main():
     parser = argparse.ArgumentParser(description="Visualize a linked list with pygame.")
     parser.add_argument("ll_type", choices=["singly", "doubly"], default = "singly", help="Linked List type.  Singly or Doubly.")
-    parser.add_argument("display", choices=["print", "animate"], help="Print to command line or visualize with pygame.")
+    parser.add_argument("display", choices=["print", "animate", "export", "batch"], help="Print to command line, visualize with pygame, render the animation to files, or replay many ops files in parallel.")
     parser.add_argument("--values", type=str, default="", help="Comma-separated list of node values.")
-    parser.add_argument("--ops-file", type=str, default="", help="Path to operations text file.")
+    parser.add_argument("--ops-file", type=str, default="", help="Path to operations text or binary file. For batch, a directory or glob pattern.")
+    parser.add_argument("--storage", choices=["node", "array"], default="node", help="Storage engine for printed lists.")
+    parser.add_argument("--indexed", action="store_true", help="Keep a position index so replays with many inserts and removes stay fast.")
+    parser.add_argument("--value-index", action="store_true", help="Keep a value index for O(1) membership and report its memory.")
+    parser.add_argument("--trace", type=str, default="", help="Write a Chrome trace of the ops replay to this .json path, with collapsed stacks beside it.")
+    parser.add_argument("--stats", action="store_true", help="Count time, pointer hops and node allocations per list method and print them.")
+    parser.add_argument("--no-optimize", action="store_true", help="Replay an ops file exactly as written, without folding and cancelling operations first.")
     parser.add_argument("--node-interval", type=float, help="Seconds per operation.")
     parser.add_argument("--arrow-interval", type=float, help="Seconds for arrow animation.")
     parser.add_argument("--width", type=int, help="Window width in pixels.")
     parser.add_argument("--height", type=int, help="Window height in pixels.")
+    parser.add_argument("--text-cache-size", type=int, help="Rendered text surfaces to keep cached.")
+    parser.add_argument("--out", type=str, default="", help="Export target: a .gif, a video such as .mp4, or a directory for PNG frames. For batch, a JSON lines file (default: stdout).")
+    parser.add_argument("--fps", type=int, default=EXPORT_FPS, help="Frames per second for export.")
+    parser.add_argument("--workers", type=int, help="Worker processes for export and batch (default: CPU count).")
     args = parser.parse_args()
 
     try:
         if not args.values and not args.ops_file:
             raise ValueError("Must specify either values or operations file")
+        if args.display == "export" and not args.out:
+            raise ValueError("Export needs an --out path")
+        if args.storage == "array" and (args.indexed or args.value_index or args.stats):
+            raise ValueError("--indexed, --value-index and --stats need node storage, not --storage array")
+        if args.trace and (args.display != "print" or not args.ops_file):
+            raise ValueError("--trace needs the print display and an --ops-file to replay")
+        if args.display == "batch":
+            if not args.ops_file:
+                raise ValueError("Batch needs an --ops-file directory or glob pattern")
+            replay_batch(args)
+            return
         values = operations = []
         if args.values and not args.ops_file:
             values = parse_values(args.values)
             operations = [("append", [value], f"append {value}") for value in values]
+        elif args.ops_file and args.display == "print":
+            # printing only needs the final list, so operations are replayed as they are read
+            operations = load_operations(args.ops_file, stream=True)
         elif args.ops_file:
-            operations = parse_operations(args.ops_file)
+            operations = load_operations(args.ops_file)
         else:
             values = DEFAULT_VALUES
             operations = [("append", [value], f"append {value}") for value in values]
@@ -86,12 +168,45 @@ def main():
             )
             llv.configure(vars(args))
             llv.display()
+        elif args.display == "export":
+            llv = LinkedListVisualizer(
+                ll_type=args.ll_type,
+                operations=operations
+            )
+            llv.configure(vars(args))
+            count = export_animation(llv, args.out, args.fps, args.workers)
+            print(f"Rendered {count} frames to {args.out}")
         else:
             if values:
-                ll = LinkedList.build_from_values(args.ll_type, values)
+                ll = LinkedList.build_from_values(args.ll_type, values, args.storage, args.value_index, args.stats)
             else:
-                ll = LinkedList.build_from_ops(args.ll_type, operations)
+                large_file = args.ops_file and os.path.getsize(args.ops_file) >= STREAM_PROGRESS_BYTES
+                tracer = ReplayTracer(args.trace, os.path.basename(args.ops_file)) if args.trace else None
+                # a trace shows the operations as written, so a traced replay is never optimized
+                optimizer = None if args.no_optimize or tracer is not None else OpsOptimizer()
+                if optimizer is not None:
+                    operations = optimizer.optimize(operations)
+                elif tracer is not None and not args.no_optimize:
+                    print("Tracing replays the ops file as written; optimization is off.", file=sys.stderr)
+                try:
+                    ll = LinkedList.build_from_ops(args.ll_type, operations, args.storage, args.indexed,
+                                                   progress=report_progress if large_file else None,
+                                                   value_indexed=args.value_index, stats=args.stats, tracer=tracer)
+                finally:
+                    if tracer is not None:
+                        tracer.close()
+                if large_file:
+                    print(file=sys.stderr)
+                if optimizer is not None and args.stats:
+                    print(optimizer.report(), file=sys.stderr)
+                if tracer is not None:
+                    print(f"Traced {tracer.count:,} operations to {tracer.path} and {tracer.folded_path}", file=sys.stderr)
             ll.show()
+            if args.value_index:
+                print(f"Value index: {len(ll.value_index):,} distinct values, "
+                      f"{ll.value_index.memory_usage() / 1024:,.1f} KiB")
+            if args.stats:
+                print(ll.stats.report())
     except ValueError as e:
         print(e)
 
@@ -139,13 +139,36 @@ class LinkedListShell(cmd.Cmd):
 
 
     def do_show(self, arg):
+        """Print the list. Usage: show [all|operations|start [stop]]"""
         if arg == "operations":
             for operation, values, description in self.operations:
                 print(f"{operation} {values} - {description}")
+        elif arg == "all":
+            self.ll.show(max_items=None)
+        elif arg:
+            bounds = [int(x) for x in arg.split(' ') if x]
+            self.ll.show(*bounds[:2])
         else:
             self.ll.show()
 
 
+    def do_stats(self, arg):
+        """Report per-method time, pointer hops and node allocations. Usage: stats [on|off|reset]"""
+        if arg == "on":
+            self.ll.enable_stats()
+            print("Counting operation stats.")
+        elif arg == "off":
+            self.ll.disable_stats()
+            print("Stopped counting operation stats.")
+        elif self.ll.stats is None:
+            print("Operation stats are off. Type 'stats on' to start counting.")
+        elif arg == "reset":
+            self.ll.stats.reset()
+            print("Reset the operation stats.")
+        else:
+            print(self.ll.stats.report())
+
+
     def append_operations(self, operation: str, values: list[int | float | str | bool], description: str):
         self.operations.append((operation, values, description))
 
@@ -0,0 +1,171 @@
+import pytest
+from classes.array_linked_list import ArraySinglyLinkedList, ArrayDoublyLinkedList
+from classes.linked_list import LinkedList
+
+@pytest.fixture(autouse=True)
+def asll_123():
+    ll = ArraySinglyLinkedList()
+    ll.append_values([1, 2, 3])
+    return ll
+
+@pytest.fixture(autouse=True)
+def adll_123():
+    ll = ArrayDoublyLinkedList()
+    ll.append_values([1, 2, 3])
+    return ll
+
+
+def test_create_selects_array_storage():
+    assert isinstance(LinkedList.create("singly", storage="array"), ArraySinglyLinkedList)
+    assert isinstance(LinkedList.create("doubly", storage="array"), ArrayDoublyLinkedList)
+    with pytest.raises(ValueError):
+        LinkedList.create("singly", storage="disk")
+
+
+def test_append_prepend_insert(asll_123):
+    asll_123.prepend(0.5)
+    asll_123.insert(2, "x")
+    assert asll_123.get_values() == [0.5, 1, "x", 2, 3]
+    assert asll_123.head.value == 0.5
+    assert asll_123.tail.value == 3
+    assert asll_123.get_node(2).next.value == 2
+
+
+def test_remove_reuses_free_slots(asll_123):
+    asll_123.remove(1)
+    asll_123.remove(1)
+    assert asll_123.get_values() == [1]
+    asll_123.append(4)
+    asll_123.append(5)
+    assert asll_123.get_values() == [1, 4, 5]
+    assert len(asll_123.values) == 3
+
+
+def test_trim_and_replace(adll_123):
+    adll_123.replace(1, 9)
+    assert adll_123.trim() is True
+    assert adll_123.get_values() == [1, 9]
+    assert adll_123.tail.prev.value == 1
+
+
+def test_doubly_get_node_from_tail():
+    ll = ArrayDoublyLinkedList()
+    ll.append_values([1, 2, 3, 4, 5, 6])
+    assert [ll.get_node(i).value for i in range(6)] == [1, 2, 3, 4, 5, 6]
+
+
+def test_reverse_and_sort(adll_123):
+    adll_123.reverse()
+    assert adll_123.get_values() == [3, 2, 1]
+    assert adll_123.head.prev is None
+    assert adll_123.sort(method=1) is True
+    assert adll_123.get_values() == [1, 2, 3]
+    assert adll_123.tail.prev.value == 2
+
+
+def test_cycle_methods(asll_123):
+    asll_123.append_values([4, 5])
+    asll_123.create_cycle(2)
+    assert asll_123.has_cycle() is True
+    for method in [1, 2]:
+        assert asll_123.has_cycle(method=method, verify=True) is True
+    for method in [1, 2, 3]:
+        assert asll_123.get_cycle_start_index(method=method) == 2
+    assert asll_123.append(6) is False
+
+
+def test_str_matches_node_storage(asll_123, adll_123):
+    assert str(asll_123) == str(LinkedList.build_from_values("singly", [1, 2, 3]))
+    assert str(adll_123) == str(LinkedList.build_from_values("doubly", [1, 2, 3]))
+
+
+@pytest.mark.parametrize("ll_type", ["singly", "doubly"])
+def test_str_cache_matches_node_storage_after_edits(ll_type):
+    lists = [LinkedList.build_from_values(ll_type, [1, 2, 3, 4], storage) for storage in ["node", "array"]]
+    for ll in lists:
+        str(ll)
+        ll.insert(2, 9)
+        ll.prepend_values([7, 8])
+        ll.remove(0)
+        ll.replace(-1, 6)
+        ll.append_values([5, 11])
+        ll.trim()
+        ll.reverse()
+    node_ll, array_ll = lists
+    assert str(array_ll) == str(node_ll)
+    assert array_ll.to_string(max_items=4) == node_ll.to_string(max_items=4)
+    assert array_ll.to_string(2, 5) == node_ll.to_string(2, 5)
+
+
+@pytest.mark.parametrize("ll_type", ["singly", "doubly"])
+@pytest.mark.parametrize("index", [-5, -1, 0, 1, 2, 3, 4])
+def test_positional_edits_match_node_storage(ll_type, index):
+    lists = [LinkedList.build_from_values(ll_type, [1, 2, 3], storage) for storage in ["node", "array"]]
+    results = []
+    for ll in lists:
+        results.append((ll.insert(index, 9), ll.get_values(), ll.replace(index, 8), ll.get_values(),
+                        ll.remove(index), ll.get_values()))
+    node_results, array_results = results
+    assert array_results == node_results
+
+
+def test_iteration_and_slices(asll_123, adll_123):
+    for ll in [asll_123, adll_123]:
+        ll.append_values([4, 5])
+        assert list(ll) == [1, 2, 3, 4, 5]
+        assert list(reversed(ll)) == [5, 4, 3, 2, 1]
+        assert list(ll[1:4]) == [2, 3, 4]
+        assert ll[-1] == 5 and 3 in ll and 6 not in ll
+        assert list(ll.iter_from(ll.get_node(2))) == [3, 4, 5]
+
+
+def test_sort_accepts_natural_merge_method(adll_123):
+    adll_123.prepend_values([9, 7])
+    assert adll_123.sort(method=3) is True
+    assert adll_123.get_values() == [1, 2, 3, 7, 9]
+    assert adll_123.sort(method=9) is False
+
+
+@pytest.mark.parametrize("method", [1, 4])
+def test_sort_key_reverse_and_mixed_values(asll_123, adll_123, method):
+    for ll in [asll_123, adll_123]:
+        ll.append_values(["b", 10, "a"])
+        assert ll.sort(method=method) is True
+        assert ll.get_values() == [1, 2, 3, 10, "a", "b"]
+        assert ll.sort(method=method, key=str, reverse=True) is True
+        assert ll.get_values() == ["b", "a", 3, 2, 10, 1]
+        assert list(reversed(ll)) == ll.get_values()[::-1]
+
+
+@pytest.mark.parametrize("ll_type", ["singly", "doubly"])
+def test_ops_file_replays_the_same_on_both_storages(tmp_path, ll_type):
+    from main import parse_operations
+    ops_file = tmp_path / "ops.txt"
+    ops_file.write_text("\n".join([
+        "append 5", "append 3", "prepend 8", "insert 1 3", "insert -1 2", "append 3",
+        "replace 2 7", "remove 0", "remove -1", "insert 9 4", "prepend 1", "remove 5", "append 3",
+    ]) + "\n")
+    operations = parse_operations(str(ops_file))
+    lists = [LinkedList.build_from_ops(ll_type, operations, storage) for storage in ["node", "array"]]
+
+    def state(ll):
+        return (ll.size, ll.get_values(), str(ll), ll.count("3"), ll.find_all("3"), ll.index_of("3"),
+                ll.index_of("9"), "7" in ll)
+
+    node_ll, array_ll = lists
+    assert state(array_ll) == state(node_ll)
+    for method in [1, 2, 3, 4]:
+        for ll in lists:
+            ll.sort(method, key=len, reverse=method % 2 == 0)
+        assert array_ll.get_values() == node_ll.get_values()
+        for ll in lists:
+            ll.sort(method, key=lambda value: int(value) % 3)
+        assert array_ll.get_values() == node_ll.get_values()
+
+
+def test_array_storage_rejects_node_helpers():
+    for option in ["indexed", "value_indexed", "stats"]:
+        with pytest.raises(ValueError, match="node storage"):
+            LinkedList.create("singly", "array", **{option: True})
+    with pytest.raises(ValueError):
+        ArrayDoublyLinkedList().enable_stats()
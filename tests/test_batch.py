@@ -0,0 +1,53 @@
+import pytest
+from classes.batch import resolve_ops_files, run_batch
+from main import stream_operations
+
+
+def crash_on_b(path):
+    """A loader that breaks on one file with something other than a ValueError."""
+    if path.endswith("b.txt"):
+        raise RuntimeError("loader crashed")
+    return stream_operations(path)
+
+
+@pytest.fixture
+def ops_dir(tmp_path):
+    (tmp_path / "a.txt").write_text("append 1\nappend 2\nappend 3\ncycle 1\nhas_cycle\n")
+    (tmp_path / "b.txt").write_text("append 5\nprepend 4\ninsert 1 9\nremove 0\n")
+    (tmp_path / "c.txt").write_text("append 1\nfrobnicate 2\n")
+    (tmp_path / ".hidden").write_text("append 1\n")
+    return tmp_path
+
+
+def test_resolve_ops_files_accepts_directory_or_glob(ops_dir):
+    names = ["a.txt", "b.txt", "c.txt"]
+    assert resolve_ops_files(str(ops_dir)) == [str(ops_dir / name) for name in names]
+    assert resolve_ops_files(str(ops_dir / "[ab].txt")) == [str(ops_dir / "a.txt"), str(ops_dir / "b.txt")]
+    assert resolve_ops_files(str(ops_dir / "b.txt")) == [str(ops_dir / "b.txt")]
+    with pytest.raises(ValueError):
+        resolve_ops_files(str(ops_dir / "*.bin"))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_batch_reports_final_states(ops_dir, workers):
+    paths = resolve_ops_files(str(ops_dir))
+    results = {result["file"]: result for result in run_batch(paths, "singly", stream_operations, workers=workers)}
+
+    first = results[str(ops_dir / "a.txt")]
+    assert (first["ok"], first["ops"], first["values"]) == (True, 5, ["1", "2", "3"])
+    assert (first["has_cycle"], first["cycle_start"]) == (True, 1)
+    second = results[str(ops_dir / "b.txt")]
+    assert (second["values"], second["has_cycle"], second["cycle_start"]) == (["9", "5"], False, None)
+    assert second["seconds"] >= 0
+    failed = results[str(ops_dir / "c.txt")]
+    assert failed["ok"] is False and "unknown command" in failed["error"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_batch_survives_unexpected_errors(ops_dir, workers):
+    paths = resolve_ops_files(str(ops_dir / "[ab].txt"))
+    results = {result["file"]: result for result in run_batch(paths, "singly", crash_on_b, workers=workers)}
+
+    assert results[str(ops_dir / "a.txt")]["ok"] is True
+    crashed = results[str(ops_dir / "b.txt")]
+    assert (crashed["ok"], crashed["error"]) == (False, "RuntimeError: loader crashed")
@@ -0,0 +1,45 @@
+import pytest
+from binary_ops import write_binary_ops, iter_binary_ops, is_binary_ops, MAGIC
+from classes.linked_list import LinkedList
+from main import parse_operations, load_operations
+
+
+def test_round_trip_preserves_operations(tmp_path):
+    operations = [
+        ("append", ["2"], "append 2"),
+        ("append", [-300], "append -300"),
+        ("prepend", [1.5], "prepend 1.5"),
+        ("insert", [200, True], "insert 200 True"),
+        ("replace", [0, "héllo"], "replace 0 héllo"),
+        ("remove", [1], "remove 1"),
+        ("cycle", [0], "cycle 0"),
+        ("has_cycle", [], "has_cycle"),
+    ]
+    path = tmp_path / "ops.llops"
+    assert write_binary_ops(operations, str(path)) == len(operations)
+    assert is_binary_ops(str(path))
+    assert list(iter_binary_ops(str(path))) == operations
+    assert [op[:2] for op in iter_binary_ops(str(path), labels=False)] == [op[:2] for op in operations]
+
+
+def test_binary_replay_matches_text(tmp_path):
+    text_path = "examples/ops2.txt"
+    binary_path = tmp_path / "ops2.llops"
+    write_binary_ops(parse_operations(text_path), str(binary_path))
+    assert not is_binary_ops(text_path)
+    for ll_type in ["singly", "doubly"]:
+        from_text = LinkedList.build_from_ops(ll_type, parse_operations(text_path))
+        from_binary = LinkedList.build_from_ops(ll_type, load_operations(str(binary_path), stream=True))
+        assert from_binary.get_values() == from_text.get_values()
+
+
+def test_rejects_text_file():
+    with pytest.raises(ValueError):
+        list(iter_binary_ops("examples/ops1.txt"))
+
+
+def test_unknown_opcode(tmp_path):
+    path = tmp_path / "bad.llops"
+    path.write_bytes(MAGIC + bytes([99]))
+    with pytest.raises(ValueError, match="Unknown opcode"):
+        list(iter_binary_ops(str(path)))
@@ -0,0 +1,68 @@
+import pytest
+from classes.singly_linked_list import SinglyLinkedList
+from classes.doubly_linked_list import DoublyLinkedList
+from classes.array_linked_list import ArraySinglyLinkedList, ArrayDoublyLinkedList
+
+LIST_CLASSES = [SinglyLinkedList, DoublyLinkedList, ArraySinglyLinkedList, ArrayDoublyLinkedList]
+
+
+@pytest.mark.parametrize("ll_class", LIST_CLASSES)
+def test_append_values_accepts_generators(ll_class):
+    ll = ll_class()
+    ll.append(1)
+    assert ll.append_values(value for value in range(2, 6)) == 4
+    assert ll.get_values() == [1, 2, 3, 4, 5]
+    assert ll.tail.value == 5
+    assert ll.size == 5
+
+
+@pytest.mark.parametrize("ll_class", LIST_CLASSES)
+def test_prepend_values_preserves_order(ll_class):
+    ll = ll_class()
+    assert ll.prepend_values(iter(["a", "b"])) == 2
+    assert ll.prepend_values([1, 2]) == 2
+    assert ll.get_values() == [1, 2, "a", "b"]
+    assert ll.head.value == 1
+    assert ll.tail.value == "b"
+
+
+@pytest.mark.parametrize("ll_class", LIST_CLASSES)
+def test_bulk_skips_invalid_and_empty_values(ll_class, capsys):
+    ll = ll_class()
+    assert ll.append_values([1, None, 0, "", object(), 2]) == 2
+    assert ll.get_values() == [1, 2]
+    assert "empty value" in capsys.readouterr().out
+
+
+def test_doubly_bulk_links_prev():
+    ll = DoublyLinkedList()
+    ll.append_values([2, 3])
+    ll.prepend_values([0.5, 1])
+    ll.append_values([4, 5])
+    values = []
+    node = ll.tail
+    while node:
+        values.append(node.value)
+        node = node.prev
+    assert values == [5, 4, 3, 2, 1, 0.5]
+
+
+def test_bulk_keeps_position_index_and_tail_path():
+    ll = SinglyLinkedList()
+    ll.enable_position_index()
+    for start in range(1, 400, 4):
+        ll.append_values(range(start, start + 4))
+    ll.prepend_values(range(-50, 0))
+    expected = list(range(-50, 0)) + list(range(1, 401))
+    assert [ll.get_node(i).value for i in range(ll.size)] == expected
+    ll.trim()
+    assert ll.tail.value == 399
+    assert sum(ll.position_index.counts) == ll.size
+
+
+def test_append_values_refuses_cycle():
+    ll = SinglyLinkedList()
+    ll.append_values([1, 2, 3])
+    ll.create_cycle(1)
+    assert ll.append_values([4, 5]) == 0
+    assert ll.size == 3
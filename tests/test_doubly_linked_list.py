@@ -135,3 +135,60 @@ def test_sort_insertion():
     assert ll.get_values() == [1, 2, 3, 4, 5]
     assert ll.head.value == 1
     assert ll.tail.value == 5
+
+
+@pytest.mark.parametrize("values", [
+    [4, 2, 5, 1, 3],
+    list(range(1, 200)),
+    list(range(200, 0, -1)),
+    [3, 3, 1, 9, 8, 7, 2, 2, 6, 5, 10, 4, 4, 1],
+])
+def test_sort_natural_merge(values):
+    ll = DoublyLinkedList()
+    ll.append_values(values)
+
+    assert ll.sort(method=3) is True
+    assert ll.get_values() == sorted(values)
+    assert ll.tail.value == max(values)
+    assert list(reversed(ll)) == sorted(values, reverse=True)
+    assert ll.head.prev is None and ll.tail.next is None
+
+
+@pytest.mark.parametrize("method", [1, 2, 3, 4])
+def test_sort_key_and_reverse(method):
+    ll = DoublyLinkedList()
+    ll.append_values([-4, 2, "x", -1, 3])
+
+    assert ll.sort(method=method, key=lambda value: abs(value) if isinstance(value, int) else value, reverse=True) is True
+    assert ll.get_values() == ["x", -4, 3, 2, -1]
+    assert list(reversed(ll)) == [-1, 2, 3, -4, "x"]
+    assert ll.head.prev is None and ll.tail.next is None
+
+
+def test_get_node_from_tail_half():
+    ll = DoublyLinkedList()
+    ll.append_values([1, 2, 3, 4, 5, 6])
+    assert [ll.get_node(i).value for i in range(6)] == [1, 2, 3, 4, 5, 6]
+
+
+def test_contains_on_empty_list(dll):
+    assert dll.contains(1) is False
+    assert 1 not in dll
+
+
+def test_iteration_in_both_directions(dll_123):
+    dll_123.append_values([4, 5])
+    assert list(dll_123) == [1, 2, 3, 4, 5]
+    assert list(reversed(dll_123)) == [5, 4, 3, 2, 1]
+    assert list(dll_123.iter_from(dll_123.get_node(3))) == [4, 5]
+    assert list(dll_123[3:0:-1]) == [4, 3, 2]
+
+
+def test_bulk_edits_keep_no_tail_path(dll_123):
+    dll_123.append_values([4, 5, 6])
+    dll_123.prepend_values([7])
+    dll_123.insert(5, 9)
+    dll_123.remove(2)
+    dll_123.trim()
+    assert dll_123.tail_path == []
+    assert dll_123.get_values() == [7, 1, 3, 4, 9, 5]
@@ -0,0 +1,95 @@
+import os
+import pytest
+from classes.exporter import export_animation, tick_count, write_gif, FRAME_NAME
+from classes.visualizer import LinkedListVisualizer
+
+
+@pytest.fixture
+def operations():
+    operations = [("append", [value], f"append {value}") for value in range(1, 6)]
+    operations += [("insert", [2, 9], "insert 2 9"), ("remove", [0], "remove 0"), ("replace", [1, 7], "replace 1 7")]
+    return operations
+
+
+def read_frames(directory: str):
+    return [open(os.path.join(directory, name), "rb").read() for name in sorted(os.listdir(directory))]
+
+
+def test_export_png_sequence_is_independent_of_worker_count(tmp_path, operations):
+    visualizer = LinkedListVisualizer("doubly", operations, node_interval=0.2, arrow_interval=0.2)
+    single = tmp_path / "single"
+    split = tmp_path / "split"
+
+    count = export_animation(visualizer, str(single), fps=10, workers=1)
+    assert count == tick_count(visualizer, 10) == 17
+    assert export_animation(visualizer, str(split), fps=10, workers=3) == count
+    assert sorted(os.listdir(split)) == [FRAME_NAME.format(tick) for tick in range(count)]
+    assert read_frames(single) == read_frames(split)
+
+
+def test_export_rejects_missing_stitcher(tmp_path, operations, monkeypatch):
+    visualizer = LinkedListVisualizer("singly", operations)
+    monkeypatch.setattr("classes.exporter.Image", None)
+    monkeypatch.setattr("classes.exporter.shutil.which", lambda name: None)
+
+    with pytest.raises(ValueError):
+        export_animation(visualizer, str(tmp_path / "run.gif"))
+    with pytest.raises(ValueError):
+        export_animation(visualizer, str(tmp_path / "run.mp4"))
+
+
+class FakeImage:
+    """Stands in for PIL.Image, counting the frame files held open and the frames not yet closed."""
+    open_files = 0
+    live = 0
+
+    def __init__(self, name):
+        self.name = name
+        self.saved = None
+        FakeImage.live += 1
+
+    @classmethod
+    def open(cls, path):
+        cls.open_files += 1
+        return cls(os.path.basename(path))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        FakeImage.open_files -= 1
+        self.close()
+
+    def copy(self):
+        return FakeImage(self.name)
+
+    def close(self):
+        FakeImage.live -= 1
+
+    def save(self, out, append_images, **options):
+        self.saved = [self.name]
+        for frame in append_images:
+            assert FakeImage.open_files == 0 and FakeImage.live == 2
+            self.saved.append(frame.name)
+        FakeImage.saved = self.saved
+
+
+def test_write_gif_streams_and_closes_frames(tmp_path, monkeypatch):
+    monkeypatch.setattr("classes.exporter.Image", FakeImage)
+
+    write_gif(str(tmp_path), str(tmp_path / "run.gif"), 4, fps=10)
+    assert FakeImage.saved == [FRAME_NAME.format(tick) for tick in range(4)]
+    assert (FakeImage.open_files, FakeImage.live) == (0, 0)
+
+
+def test_write_video_reports_ffmpeg_errors(tmp_path, monkeypatch):
+    import subprocess
+    from classes.exporter import write_video
+
+    def failing_run(command, **options):
+        assert options["capture_output"] is True
+        raise subprocess.CalledProcessError(1, command, stderr="Unknown encoder 'libx264'\n")
+
+    monkeypatch.setattr("classes.exporter.subprocess.run", failing_run)
+    with pytest.raises(ValueError, match="exit status 1.*Unknown encoder 'libx264'"):
+        write_video(str(tmp_path), str(tmp_path / "run.mp4"), fps=10)
@@ -18,3 +18,38 @@ def test_doubly_lltype_creates_doubly_linked_list():
     ll = LinkedList.create("doubly")
     assert isinstance(ll, DoublyLinkedList)
 
+
+def test_iter_operations_streams_lines(tmp_path):
+    from types import GeneratorType
+    from main import iter_operations, parse_operations
+    ops_file = tmp_path / "ops.txt"
+    ops_file.write_text("# comment\nappend 1\n\ninsert 0 2\ndelete 1\n")
+    operations = iter_operations(str(ops_file))
+    assert isinstance(operations, GeneratorType)
+    assert next(operations) == ("append", ["1"], "append 1")
+    assert parse_operations(str(ops_file)) == [
+        ("append", ["1"], "append 1"),
+        ("insert", [0, "2"], "insert 0 2"),
+        ("remove", [1], "delete 1"),
+    ]
+
+
+def test_replay_ops_reports_progress(monkeypatch):
+    monkeypatch.setattr("classes.linked_list.PROGRESS_INTERVAL", 2)
+    reports = []
+    operations = (("append", [value], f"append {value}") for value in range(1, 6))
+    ll = LinkedList.build_from_ops("singly", operations, progress=lambda count, size: reports.append((count, size)))
+    assert ll.get_values() == [1, 2, 3, 4, 5]
+    assert reports == [(2, 2), (4, 4), (5, 5)]
+
+
+def test_print_reports_optimizer_only_with_stats(tmp_path, monkeypatch, capsys):
+    ops_file = tmp_path / "ops.txt"
+    ops_file.write_text("append 1\nappend 2\nreplace 0 3\nreplace 0 4\n")
+    monkeypatch.setattr("sys.argv", ["main.py", "singly", "print", "--ops-file", str(ops_file)])
+    main()
+    assert capsys.readouterr().err == ""
+
+    monkeypatch.setattr("sys.argv", ["main.py", "singly", "print", "--ops-file", str(ops_file), "--stats"])
+    main()
+    assert "Optimized 4 operations to 3 (1 eliminated" in capsys.readouterr().err
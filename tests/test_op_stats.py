@@ -0,0 +1,118 @@
+import pytest
+from classes.singly_linked_list import SinglyLinkedList
+from classes.doubly_linked_list import DoublyLinkedList
+from classes.linked_list import LinkedList
+
+
+@pytest.mark.parametrize("ll_class", [SinglyLinkedList, DoublyLinkedList])
+def test_stats_count_allocations_and_frees(ll_class):
+    ll = ll_class()
+    ll.enable_stats()
+    ll.append_values([1, 2, 3, 4, 5, 6])
+    ll.insert(2, 9)
+    ll.remove(3)
+    ll.trim()
+    ll.clear()
+
+    methods = ll.stats.methods
+    assert methods["append_values"].allocated == 6
+    assert methods["insert"].allocated == 1
+    assert methods["trim"].freed == 1
+    assert methods["clear"].freed == 5
+    assert (ll.stats.allocated, ll.stats.freed) == (7, 7)
+    assert all(record.seconds >= 0 for record in methods.values())
+
+
+def test_stats_count_hops_of_hidden_walks():
+    ll = SinglyLinkedList()
+    ll.append_values(list(range(1, 11)))
+    ll.enable_stats()
+
+    ll.get_node(6)
+    assert ll.stats.hops == 6
+    ll.contains(-1)
+    assert ll.stats.hops == 16
+    ll.insert(4, 0)
+    assert ll.stats.methods["insert"].hops == 3
+    assert ll.stats.methods["get_node"].calls == 2
+
+
+def test_doubly_stats_count_hops_from_the_closer_end():
+    ll = DoublyLinkedList()
+    ll.append_values(list(range(1, 11)))
+    ll.enable_stats()
+
+    ll.get_node(8)
+    assert ll.stats.hops == 1
+    assert ll.contains(2) is True
+    assert ll.stats.methods["contains"].hops == 2
+
+
+def test_nested_calls_count_once_in_totals():
+    ll = SinglyLinkedList()
+    ll.append_values([1, 2, 3])
+    ll.enable_stats()
+
+    ll.remove(2)
+    assert ll.stats.methods["remove"].freed == 1
+    assert ll.stats.methods["trim"].freed == 1
+    assert ll.stats.freed == 1
+
+
+def test_disable_stats_restores_plain_methods():
+    ll = SinglyLinkedList()
+    ll.enable_stats()
+    assert "append" in vars(ll)
+
+    ll.disable_stats()
+    assert ll.stats is None
+    assert "append" not in vars(ll)
+    ll.append(1)
+    assert ll.get_values() == [1]
+
+
+def test_report_and_reset():
+    ll = LinkedList.build_from_values("doubly", [3, 1, 2], stats=True)
+    ll.sort()
+
+    report = ll.stats.report()
+    assert report.startswith("Operation stats |")
+    assert "append_values" in report and "sort" in report
+    ll.stats.reset()
+    assert ll.stats.hops == 0 and ll.stats.methods["sort"].calls == 0
+    assert "sort" not in ll.stats.report()
+
+
+def test_stats_need_node_storage():
+    with pytest.raises(ValueError):
+        LinkedList.create("singly", "array", stats=True)
+
+
+@pytest.mark.parametrize("ll_type", ["singly", "doubly"])
+@pytest.mark.parametrize("method", [1, 2, 3, 4])
+def test_sorts_count_hops_in_proportion_to_size(ll_type, method):
+    hops = []
+    for size in [200, 400]:
+        values = [(index * 7919) % size + 1 for index in range(size)]
+        ll = LinkedList.build_from_values(ll_type, values, stats=True)
+        ll.sort(method)
+        assert ll.get_values() == sorted(values)
+        hops.append(ll.stats.methods["sort"].hops)
+    assert hops[0] >= 200
+    # doubling the size at least doubles the hops, and no more than quadruples them for the quadratic sort
+    assert 1.8 <= hops[1] / hops[0] <= (4.5 if method == 2 else 2.5)
+
+
+def test_cycle_finders_count_hops():
+    ll = SinglyLinkedList()
+    ll.append_values(list(range(1, 101)))
+    ll.create_cycle(50)
+    ll.enable_stats()
+
+    for method in [1, 2]:
+        ll.stats.reset()
+        assert ll.has_cycle(method=method, verify=True) is True
+        assert ll.stats.methods["has_cycle"].hops >= 100
+        ll.stats.reset()
+        assert ll.get_cycle_start_index(method=method) == 50
+        assert ll.stats.methods["get_cycle_start_index"].hops >= 150
@@ -0,0 +1,113 @@
+import contextlib
+import io
+import random
+import pytest
+import classes.ops_optimizer as ops_optimizer
+from classes.linked_list import LinkedList
+from classes.ops_optimizer import OpsOptimizer
+
+
+def final_state(ll_type, operations, storage="node"):
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            ll = LinkedList.build_from_ops(ll_type, operations, storage)
+            has_cycle = ll.has_cycle()
+            return ll.size, ll.get_values(), has_cycle, ll.get_cycle_start_index(method=3) if has_cycle else None
+    except Exception as e:
+        # both replays must fail the same way, including on streams the lists themselves cannot handle
+        return type(e)
+
+
+def random_operations(rng, count):
+    operations = []
+    size = 0
+    for _ in range(count):
+        roll = rng.random()
+        index = rng.randint(-1, size + 1)
+        value = rng.choice([str(rng.randint(1, 20)), rng.randint(0, 20), "", None, 1.5, True])
+        if roll < 0.4:
+            command = rng.choice(["append", "prepend"])
+            operations.extend((command, [value], "") for _ in range(rng.randint(1, 4)))
+            size += 1
+        elif roll < 0.55:
+            operations.append(("insert", [index, value], ""))
+            if rng.random() < 0.6:
+                operations.append(("remove", [index], ""))
+            else:
+                size += 1
+        elif roll < 0.85:
+            operations.extend(("replace", [rng.choice([index, rng.randint(0, size)]), value], "")
+                              for _ in range(rng.randint(1, 3)))
+        elif roll < 0.92:
+            operations.append(("remove", [index], ""))
+            size = max(0, size - 1)
+        elif roll < 0.96:
+            operations.append(("cycle", [rng.randint(0, size)], ""))
+        else:
+            operations.append(("has_cycle", [], ""))
+    return operations
+
+
+@pytest.mark.parametrize("ll_type", ["singly", "doubly"])
+@pytest.mark.parametrize("storage", ["node", "array"])
+def test_optimized_replay_matches_naive_replay(monkeypatch, ll_type, storage):
+    monkeypatch.setattr(ops_optimizer, "OPTIMIZE_MIN_RUN", 2)
+    monkeypatch.setattr(ops_optimizer, "OPTIMIZE_RUN_LIMIT", 5)
+    rng = random.Random(20)
+    for _ in range(300):
+        operations = random_operations(rng, rng.randint(0, 30))
+        expected = final_state(ll_type, operations, storage)
+        assert final_state(ll_type, OpsOptimizer().optimize(iter(operations)), storage) == expected, operations
+
+
+def test_runs_fold_into_bulk_splices(monkeypatch):
+    monkeypatch.setattr(ops_optimizer, "OPTIMIZE_MIN_RUN", 3)
+    operations = [("append", [value], f"append {value}") for value in "abcd"]
+    operations += [("prepend", [value], f"prepend {value}") for value in "xyz"]
+    operations += [("append", ["e"], "append e"), ("append", ["f"], "append f")]
+    optimizer = OpsOptimizer()
+
+    optimized = list(optimizer.optimize(operations))
+    assert optimized == [
+        ("append_values", ["a", "b", "c", "d"], "append x4"),
+        ("prepend_values", ["z", "y", "x"], "prepend x3"),
+        ("append", ["e"], "append e"),
+        ("append", ["f"], "append f"),
+    ]
+    assert final_state("singly", optimized) == final_state("singly", operations)
+    assert (optimizer.read, optimizer.written, optimizer.folded) == (9, 4, 7)
+
+
+def test_insert_remove_pairs_and_superseded_replaces():
+    operations = [
+        ("append", ["a"], ""), ("append", ["b"], ""), ("append", ["c"], ""),
+        ("insert", [1, "x"], "insert 1 x"), ("remove", [1], "remove 1"),
+        ("replace", [0, "p"], ""), ("replace", [2, "q"], ""), ("replace", [0, "r"], ""),
+        ("insert", [0, "y"], ""), ("remove", [1], ""),
+    ]
+    optimizer = OpsOptimizer()
+
+    optimized = list(optimizer.optimize(operations))
+    assert ("insert_remove", [1, "x"], "insert 1 x; remove 1") in optimized
+    assert [op for op in optimized if op[0] == "replace"] == [("replace", [2, "q"], ""), ("replace", [0, "r"], "")]
+    assert (optimizer.paired, optimizer.superseded) == (1, 1)
+    assert final_state("doubly", optimized) == final_state("doubly", operations)
+    assert "2 eliminated" in optimizer.report()
+
+
+@pytest.mark.parametrize("index", [0, 3])
+def test_insert_remove_at_the_ends_still_runs(index):
+    operations = [("append", [1], ""), ("append", [2], ""), ("append", [3], ""), ("cycle", [0], ""),
+                  ("insert", [index, 9], ""), ("remove", [index], "")]
+    assert final_state("singly", OpsOptimizer().optimize(operations)) == final_state("singly", operations)
+
+
+def test_reads_and_cycles_end_pending_groups():
+    operations = [("append", [1], ""), ("append", [2], ""), ("replace", [0, 5], ""), ("has_cycle", [], ""),
+                  ("replace", [0, 6], ""), ("cycle", [1], ""), ("replace", [1, 7], ""), ("replace", [1, 8], "")]
+    optimizer = OpsOptimizer()
+
+    optimized = list(optimizer.optimize(operations))
+    assert [op[0] for op in optimized].count("replace") == 3
+    assert optimizer.superseded == 1
+    assert final_state("singly", optimized) == final_state("singly", operations)
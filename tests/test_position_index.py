@@ -0,0 +1,76 @@
+import random
+import pytest
+from classes.singly_linked_list import SinglyLinkedList
+from classes.doubly_linked_list import DoublyLinkedList
+
+
+@pytest.mark.parametrize("ll_class", [SinglyLinkedList, DoublyLinkedList])
+def test_position_index_matches_walk_under_mixed_ops(ll_class):
+    rng = random.Random(7)
+    ll = ll_class()
+    ll.enable_position_index()
+    expected = []
+
+    for step in range(3000):
+        op = rng.random()
+        value = step + 1
+        if op < 0.3:
+            ll.append(value)
+            expected.append(value)
+        elif op < 0.4:
+            ll.prepend(value)
+            expected.insert(0, value)
+        elif op < 0.65:
+            index = rng.randint(1, len(expected) + 1)
+            ll.insert(index, value)
+            expected.insert(min(index, len(expected)), value)
+        elif op < 0.9 and expected:
+            index = rng.randrange(len(expected))
+            ll.remove(index)
+            expected.pop(index)
+        elif expected:
+            index = rng.randrange(len(expected))
+            ll.replace(index, value)
+            expected[index] = value
+        if step % 500 == 0:
+            ll.reverse()
+            expected.reverse()
+
+    assert ll.size == len(expected)
+    assert ll.get_values() == expected
+    assert [ll.get_node(i).value for i in range(ll.size)] == expected
+    assert sum(ll.position_index.counts) == ll.size
+
+
+def test_position_index_survives_sort_and_clear():
+    ll = SinglyLinkedList()
+    ll.append_values([5, 3, 9, 1, 7])
+    ll.enable_position_index()
+    ll.sort()
+    assert [ll.get_node(i).value for i in range(5)] == [1, 3, 5, 7, 9]
+    ll.clear()
+    ll.append_values([2, 4])
+    assert ll.get_node(1).value == 4
+
+
+@pytest.mark.parametrize("ll_class", [SinglyLinkedList, DoublyLinkedList])
+def test_position_index_merges_blocks_after_heavy_removal(ll_class):
+    rng = random.Random(3)
+    ll = ll_class()
+    ll.append_values(list(range(1, 10_001)))
+    ll.enable_position_index()
+    expected = list(range(1, 10_001))
+
+    while len(expected) > 500:
+        index = rng.randrange(len(expected))
+        ll.remove(index)
+        expected.pop(index)
+
+    index = ll.position_index
+    assert len(index.counts) <= 2 * ll.size // index.block_size + 1
+    position = 0
+    for start, count in zip(index.starts, index.counts):
+        assert start.value == expected[position]
+        position += count
+    assert position == ll.size
+    assert [ll.get_node(i).value for i in range(ll.size)] == expected
@@ -0,0 +1,62 @@
+import json
+from classes.linked_list import LinkedList
+from classes.replay_tracer import ReplayTracer
+
+
+def test_tracer_records_a_span_per_operation(tmp_path):
+    operations = [("append", [value], f"append {value}") for value in range(1, 21)]
+    operations += [
+        ("insert", [15, 99], "insert 15 99"),
+        ("remove", [0], "delete 0"),
+        ("replace", [20, 7], ""),
+        ("has_cycle", [], "has_cycle"),
+    ]
+    tracer = ReplayTracer(str(tmp_path / "replay.json"), "ops.txt")
+    ll = LinkedList.build_from_ops("singly", operations, tracer=tracer)
+    assert tracer.close() == len(operations)
+
+    events = json.loads((tmp_path / "replay.json").read_text())["traceEvents"]
+    spans = [event for event in events if event["ph"] == "X"]
+    assert len(spans) == len(operations)
+    assert [span["name"] for span in spans] == [op[0] for op in operations]
+    assert all(span["dur"] >= 0 for span in spans)
+    assert [span["ts"] for span in spans] == sorted(span["ts"] for span in spans)
+    assert spans[20]["args"] == {"op": 20, "index": 15, "size": 20, "line": "insert 15 99"}
+    assert spans[22]["args"]["line"] == "replace 20 7"
+    assert ll.size == 20
+
+
+def test_tracer_writes_collapsed_stacks(tmp_path):
+    operations = [("append", [value], "") for value in range(1, 11)]
+    operations += [("insert", [4, 0], ""), ("insert", [11, 0], ""), ("prepend", [5], ""), ("remove", [12], "")]
+    tracer = ReplayTracer(str(tmp_path / "replay.json"))
+    LinkedList.build_from_ops("doubly", operations, tracer=tracer)
+    tracer.close()
+
+    lines = (tmp_path / "replay.folded").read_text().splitlines()
+    stacks = [line.rsplit(" ", 1)[0] for line in lines]
+    assert stacks == ["replay;append;tail", "replay;insert;40-50%", "replay;insert;tail",
+                      "replay;prepend;head", "replay;remove;tail"]
+    assert all(int(line.rsplit(" ", 1)[1]) >= 1 for line in lines)
+
+
+def test_position_buckets():
+    assert ReplayTracer.position("insert", 0, 10) == "head"
+    assert ReplayTracer.position("insert", 10, 10) == "tail"
+    assert ReplayTracer.position("insert", 9, 10) == "90-100%"
+    assert ReplayTracer.position("remove", 9, 10) == "tail"
+    assert ReplayTracer.position("has_cycle", None, 10) == "-"
+
+
+def test_main_traces_every_source_operation(tmp_path, monkeypatch, capsys):
+    from main import main
+    ops_file = tmp_path / "ops.txt"
+    lines = [f"append {value}" for value in range(1, 21)] + ["insert 5 9", "remove 5", "replace 0 3", "replace 0 4"]
+    ops_file.write_text("\n".join(lines) + "\n")
+    trace = tmp_path / "replay.json"
+    monkeypatch.setattr("sys.argv", ["main.py", "singly", "print", "--ops-file", str(ops_file), "--trace", str(trace)])
+    main()
+
+    spans = [event for event in json.loads(trace.read_text())["traceEvents"] if event["ph"] == "X"]
+    assert [span["args"]["line"] for span in spans] == lines
+    assert "optimization is off" in capsys.readouterr().err
@@ -1,5 +1,6 @@
 import pytest
 from classes.singly_linked_list import SinglyLinkedList
+from classes.linked_list import LinkedList
 
 @pytest.fixture(autouse=True)
 def sll():
@@ -156,3 +157,207 @@ def test_sort_insertion():
     assert ll.get_values() == [1, 2, 3, 4, 5]
     assert ll.head.value == 1
     assert ll.tail.value == 5
+
+
+@pytest.mark.parametrize("values", [
+    [4, 2, 5, 1, 3],
+    list(range(1, 200)),
+    list(range(200, 0, -1)),
+    [3, 3, 1, 9, 8, 7, 2, 2, 6, 5, 10, 4, 4, 1],
+])
+def test_sort_natural_merge(values):
+    ll = SinglyLinkedList()
+    ll.append_values(values)
+
+    assert ll.sort(method=3) is True
+    assert ll.get_values() == sorted(values)
+    assert ll.tail.value == max(values)
+    assert ll.tail.next is None
+
+
+@pytest.mark.parametrize("method", [1, 3, 4])
+def test_sort_key_and_reverse_are_stable(method):
+    ll = SinglyLinkedList()
+    words = ["pear", "fig", "apple", "kiwi", "plum", "date"]
+    ll.append_values(words)
+
+    assert ll.sort(method=method, key=len) is True
+    assert ll.get_values() == sorted(words, key=len)
+    assert ll.sort(method=method, key=len, reverse=True) is True
+    assert ll.get_values() == sorted(words, key=len, reverse=True)
+    assert ll.tail.value == "fig" and ll.tail.next is None
+
+
+@pytest.mark.parametrize("method", [1, 2, 3, 4])
+def test_sort_mixed_numbers_and_strings(method):
+    ll = SinglyLinkedList()
+    ll.append_values([3, "b", 1.5, "a", 2])
+
+    assert ll.sort(method=method) is True
+    assert ll.get_values() == [1.5, 2, 3, "a", "b"]
+    assert ll.sort(method=method, reverse=True) is True
+    assert ll.get_values() == ["b", "a", 3, 2, 1.5]
+
+
+def test_sort_failing_key_leaves_list_unchanged():
+    ll = SinglyLinkedList()
+    ll.append_values([3, 1, 2])
+
+    assert ll.sort(key=lambda value: value + "!") is False
+    assert ll.get_values() == [3, 1, 2]
+    assert str(ll) == str(LinkedList.build_from_values("singly", [3, 1, 2]))
+
+
+def test_external_sort_keeps_value_index_in_sync():
+    ll = SinglyLinkedList()
+    ll.enable_value_index()
+    ll.append_values([5, 3, 5, 1])
+
+    assert ll.sort(method=4) is True
+    assert ll.get_values() == [1, 3, 5, 5]
+    assert ll.find_all(5) == [2, 3]
+    assert ll.index_of(1) == 0
+
+
+def test_cycle_state_is_tracked():
+    ll = SinglyLinkedList()
+    ll.append_values([1, 2, 3, 4, 5])
+    assert ll.cycle_start is None
+
+    ll.create_cycle(2)
+    assert ll.cycle_start is ll.get_node(2)
+    assert ll.has_cycle() is True
+    assert ll.append(6) is False
+    assert ll.reverse() is False
+
+    ll.remove(2)
+    assert ll.has_cycle() is False
+    assert ll.has_cycle(verify=True) is False
+    assert ll.get_values() == [1, 2, 4, 5]
+
+
+def test_remove_only_node_of_self_cycle():
+    ll = SinglyLinkedList()
+    ll.append(1)
+    ll.create_cycle(0)
+    assert ll.tail.next is ll.head
+
+    assert ll.remove(0) is True
+    assert (ll.size, ll.head, ll.tail, ll.cycle_start) == (0, None, None, None)
+    assert ll.append(2) is True
+    assert ll.get_values() == [2]
+    assert ll.has_cycle(verify=True) is False
+
+
+def test_has_cycle_verify_walks_nodes():
+    ll = SinglyLinkedList()
+    ll.append_values([1, 2, 3])
+    ll.tail.next = ll.head
+    assert ll.has_cycle() is False
+    assert ll.has_cycle(method=1, verify=True) is True
+    assert ll.has_cycle(method=2, verify=True) is True
+
+
+def test_clear_resets_cycle():
+    ll = SinglyLinkedList()
+    ll.append_values([1, 2, 3])
+    ll.create_cycle(0)
+    assert ll.clear(iterate=True) is True
+    assert ll.has_cycle() is False
+    assert ll.size == 0
+    assert ll.append(1) is True
+
+
+def test_trim_uses_tail_path():
+    ll = SinglyLinkedList()
+    ll.append_values(list(range(1, 11)))
+    for expected_tail in range(9, 0, -1):
+        assert ll.trim() is True
+        assert ll.tail.value == expected_tail
+        assert ll.tail.next is None
+    assert ll.trim() is True
+    assert ll.head is None and ll.tail is None
+    assert ll.trim() is False
+
+
+def test_tail_path_survives_changes_near_tail():
+    ll = SinglyLinkedList()
+    ll.append_values([1, 2, 3, 4, 5])
+    ll.insert(4, 9)
+    ll.remove(3)
+    ll.prepend(0.5)
+    assert ll.remove(ll.size - 1) is True
+    assert ll.get_values() == [0.5, 1, 2, 3, 9]
+    assert ll.trim() is True
+    assert ll.tail.value == 3
+    assert ll.get_values() == [0.5, 1, 2, 3]
+
+
+def test_str_cache_follows_edits():
+    ll = SinglyLinkedList()
+    ll.append_values([1, 2, 3, 4, 5])
+    str(ll)
+    ll.append(6)
+    ll.prepend_values([7, 8])
+    ll.insert(3, 9)
+    ll.replace(20, 10)
+    ll.remove(1)
+    ll.trim()
+    ll.reverse()
+    assert ll.render_cache.parts == [str(value) for value in ll.get_values()]
+    assert str(ll) == str(LinkedList.build_from_values("singly", ll.get_values()))
+    ll.sort()
+    assert ll.render_cache is None
+    assert "[1 ⇒ 2 ⇒ 3 ⇒ 4 ⇒ 5 ⇒ 7 ⇒ 9]" in str(ll)
+
+
+def test_str_draws_tracked_cycle():
+    ll = SinglyLinkedList()
+    ll.append_values([1, 22, 333, 4, 5])
+    ll.create_cycle(2)
+    lines = str(ll).split("\n")
+    assert lines[3].index("↑") == lines[2].index("333")
+    assert lines[3].endswith("↓")
+
+
+def test_show_elides_middle_of_long_lists(capsys):
+    ll = SinglyLinkedList()
+    ll.append_values(range(1, 100_001))
+    ll.show(max_items=4)
+    output = capsys.readouterr().out
+    assert "100000 Elements (first 2 and last 2 shown):" in output
+    assert "[1 ⇒ 2 ⇒ … 99996 more … ⇒ 99999 ⇒ 100000]" in output
+    assert ll.render_cache is None
+
+    ll.create_cycle(7)
+    ll.show(5, 8)
+    output = capsys.readouterr().out
+    assert "(5..7 shown):\n[… ⇒ 6 ⇒ 7 ⇒ 8 ⇒ …]" in output
+    assert "tail links back to 7" in output
+
+
+def test_iteration_is_bounded_by_size():
+    ll = SinglyLinkedList()
+    ll.append_values([1, 2, 3, 4, 5])
+    ll.create_cycle(1)
+    assert list(ll) == [1, 2, 3, 4, 5]
+    assert list(reversed(ll)) == [5, 4, 3, 2, 1]
+    assert list(ll.iter_from(ll.get_node(3))) == [4, 5]
+    assert 5 in ll and 6 not in ll
+
+
+def test_getitem_and_lazy_slices():
+    ll = SinglyLinkedList()
+    ll.append_values(range(1, 10_001))
+    assert (ll[0], ll[9_999], ll[-2]) == (1, 10_000, 9_999)
+    with pytest.raises(IndexError):
+        ll[10_000]
+
+    view = ll[1000:2000]
+    assert len(view) == 1000
+    assert list(view) == list(range(1001, 2001))
+    assert list(ll[:5:2]) == [1, 3, 5]
+    assert list(ll[-3:]) == [9_998, 9_999, 10_000]
+    assert list(ll[5:0:-2]) == [6, 4, 2]
+    assert view[10] == 1011 and list(view[-2:]) == [1999, 2000]
+    assert list(ll[20:10]) == []
@@ -0,0 +1,41 @@
+import pytest
+from classes.sorting import SortKey, external_sorted
+
+
+def test_sort_key_orders_numbers_before_strings():
+    keys = [SortKey(value) for value in ["b", 2, "a", 1.5, True]]
+    assert [key.key for key in sorted(keys)] == [True, 1.5, 2, "a", "b"]
+    assert SortKey(1) <= SortKey(1) and not SortKey(1) < SortKey(1)
+
+
+@pytest.mark.parametrize("run_size", [1, 3, 1000])
+def test_external_sorted_matches_sorted(run_size):
+    values = [(index * 7919) % 101 for index in range(250)]
+    assert list(external_sorted(values, run_size=run_size)) == sorted(values)
+    assert list(external_sorted(values, key=lambda value: value % 10, reverse=True, run_size=run_size)) == \
+        sorted(values, key=lambda value: value % 10, reverse=True)
+
+
+def test_external_sorted_merges_mixed_runs():
+    values = [3, "c", 1, "a", 2, "b"]
+    assert list(external_sorted(values, run_size=2)) == [1, 2, 3, "a", "b", "c"]
+    assert list(external_sorted([], run_size=2)) == []
+
+
+def test_external_sorted_closes_run_files():
+    runs = external_sorted(range(10, 0, -1), run_size=2)
+    assert next(runs) == 1
+    frame = runs.gi_frame
+    run_files = frame.f_locals["run_files"]
+    assert len(run_files) == 5 and not any(run_file.closed for run_file in run_files)
+    runs.close()
+    assert all(run_file.closed for run_file in run_files)
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_external_sorted_keeps_ties_across_mixed_runs(reverse):
+    values = [value if value % 4 else f"a{value}" for value in range(1, 200)]
+    key = lambda value: value % 3 if isinstance(value, int) else value[0]
+    expected = sorted(values, key=lambda value: SortKey(key(value)), reverse=reverse)
+    assert list(external_sorted(values, key, reverse, run_size=7)) == expected
+    assert SortKey(1) == SortKey(1.0) and SortKey(1) != SortKey("a")
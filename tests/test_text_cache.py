@@ -0,0 +1,63 @@
+import pytest
+from classes.text_cache import TextCache
+
+
+class FakeFont:
+    def __init__(self):
+        self.renders = 0
+
+    def render(self, text, antialias, color):
+        self.renders += 1
+        return (text, antialias, color)
+
+
+@pytest.fixture
+def font():
+    return FakeFont()
+
+
+def test_render_reuses_cached_surface(font):
+    cache = TextCache(max_size=4)
+    first = cache.render(font, "42", (1, 2, 3))
+    second = cache.render(font, "42", (1, 2, 3))
+
+    assert first is second
+    assert font.renders == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_render_keys_on_font_and_color(font):
+    cache = TextCache(max_size=4)
+    other_font = FakeFont()
+    cache.render(font, "42", (1, 2, 3))
+    cache.render(font, "42", (3, 2, 1))
+    cache.render(other_font, "42", (1, 2, 3))
+
+    assert cache.misses == 3
+    assert len(cache) == 3
+
+
+def test_render_evicts_least_recently_used(font):
+    cache = TextCache(max_size=2)
+    cache.render(font, "a", (0, 0, 0))
+    cache.render(font, "b", (0, 0, 0))
+    cache.render(font, "a", (0, 0, 0))
+    cache.render(font, "c", (0, 0, 0))
+
+    assert len(cache) == 2
+    cache.render(font, "a", (0, 0, 0))
+    assert cache.hits == 2
+    cache.render(font, "b", (0, 0, 0))
+    assert cache.misses == 4
+
+
+def test_resize_and_clear(font):
+    cache = TextCache(max_size=8)
+    for text in "abcdef":
+        cache.render(font, text, (0, 0, 0))
+    cache.resize(3)
+    assert len(cache) == 3
+
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
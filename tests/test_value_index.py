@@ -0,0 +1,66 @@
+import random
+import pytest
+from classes.singly_linked_list import SinglyLinkedList
+from classes.doubly_linked_list import DoublyLinkedList
+from classes.linked_list import LinkedList
+
+
+@pytest.mark.parametrize("ll_class", [SinglyLinkedList, DoublyLinkedList])
+def test_value_index_matches_scan_under_mixed_ops(ll_class):
+    rng = random.Random(5)
+    ll = ll_class()
+    ll.append_values([3, 1, 4, 1, 5])
+    ll.enable_value_index()
+
+    for step in range(3000):
+        op = rng.random()
+        value = rng.randint(1, 40)
+        if op < 0.25:
+            ll.append(value)
+        elif op < 0.3:
+            ll.append_values([value, value + 1])
+        elif op < 0.4:
+            ll.prepend(value)
+        elif op < 0.45:
+            ll.prepend_values([value, 2])
+        elif op < 0.6:
+            ll.insert(rng.randint(0, ll.size + 1), value)
+        elif op < 0.75:
+            ll.replace(rng.randint(0, ll.size + 1), value)
+        elif op < 0.9:
+            ll.remove(rng.randint(0, ll.size))
+        else:
+            ll.trim()
+        if step % 700 == 0:
+            ll.sort()
+            ll.reverse()
+
+    values = ll.get_values()
+    for value in range(0, 45):
+        assert ll.contains(value) == (value in values)
+        assert ll.count(value) == values.count(value)
+        assert ll.find_all(value) == [position for position, held in enumerate(values) if held == value]
+        assert ll.index_of(value) == (values.index(value) if value in values else None)
+    assert sum(ll.value_index.count(value) for value in ll.value_index.nodes) == ll.size
+
+
+def test_lookups_without_index_scan_the_list():
+    ll = SinglyLinkedList()
+    ll.append_values(["a", "b", "a", "c"])
+    assert ll.value_index is None
+    assert (ll.count("a"), ll.find_all("a"), ll.index_of("c"), ll.index_of("z")) == (2, [0, 2], 3, None)
+
+
+def test_value_index_switch_and_memory_report():
+    ll = LinkedList.create("singly", value_indexed=True)
+    ll.append_values(range(1, 1001))
+    assert len(ll.value_index) == 1000
+    assert ll.value_index.memory_usage() > 1000 * 8
+    ll.clear()
+    assert len(ll.value_index) == 0 and not ll.contains(1)
+
+    assert ll.disable_value_index() is True
+    ll.append(1)
+    assert ll.contains(1)
+    with pytest.raises(ValueError):
+        LinkedList.create("singly", storage="array", value_indexed=True)
@@ -0,0 +1,289 @@
+import math
+import random
+import pygame
+import pytest
+import classes.visualizer as visualizer_module
+from classes.visualizer import LinkedListVisualizer, NodeState, Viewport
+from constants import MAX_NODE_SCALE, NODE_RADIUS, DEFAULT_BG_COLOR
+
+
+def random_operations(count: int, seed: int = 3):
+    rng = random.Random(seed)
+    operations = []
+    size = 0
+    for step in range(count):
+        op = rng.random()
+        value = step + 1
+        if op < 0.4:
+            operations.append(("append", [value], f"append {value}"))
+            size += 1
+        elif op < 0.5:
+            operations.append(("prepend", [value], f"prepend {value}"))
+            size += 1
+        elif op < 0.7:
+            index = rng.randint(0, size + 1)
+            operations.append(("insert", [index, value], f"insert {index} {value}"))
+            size += 1
+        elif op < 0.85:
+            index = rng.randint(0, size + 1)
+            operations.append(("remove", [index], f"remove {index}"))
+            size = max(0, size - 1)
+        else:
+            index = rng.randint(0, size + 1)
+            operations.append(("replace", [index, -value], f"replace {index} {-value}"))
+    return operations
+
+
+def expected_states(operations):
+    """Replays operations on a plain list and returns the values after each animated operation."""
+    values = []
+    states = []
+    for command, args, _ in operations:
+        if command == "append":
+            values.append(args[0])
+        elif command == "prepend":
+            values.insert(0, args[0])
+        elif command == "insert":
+            values.insert(max(0, min(args[0], len(values))), args[1])
+        elif not values:
+            continue
+        elif command == "remove":
+            values.pop(max(0, min(args[0], len(values) - 1)))
+        elif command == "replace":
+            values[max(0, min(args[0], len(values) - 1))] = args[1]
+        states.append(list(values))
+    return states
+
+
+@pytest.fixture
+def visualizer():
+    return LinkedListVisualizer("singly", [])
+
+
+def test_frames_store_deltas_and_sparse_keyframes(visualizer):
+    operations = random_operations(2000)
+    frames = visualizer.build_frames(operations, 0.1)
+
+    assert len(frames) == len(expected_states(operations))
+    assert frames[0].keyframe == []
+    keyframes = [index for index, frame in enumerate(frames) if frame.keyframe is not None]
+    assert 1 < len(keyframes) < len(frames) // 16
+
+
+def test_frame_nodes_sequential_playback(visualizer):
+    operations = random_operations(2000)
+    frames = visualizer.build_frames(operations, 0.1)
+    states = expected_states(operations)
+
+    for index, state in enumerate(states):
+        if index > 0:
+            before = [node.value for node in visualizer.frame_nodes(frames, index, after=False)]
+            assert before == states[index - 1]
+        assert [node.value for node in visualizer.frame_nodes(frames, index)] == state
+
+
+def test_frame_nodes_random_seeks(visualizer):
+    operations = random_operations(2000)
+    frames = visualizer.build_frames(operations, 0.1)
+    states = expected_states(operations)
+    rng = random.Random(11)
+
+    for _ in range(200):
+        index = rng.randrange(len(frames))
+        assert [node.value for node in visualizer.frame_nodes(frames, index)] == states[index]
+
+
+def test_frame_nodes_without_frames(visualizer):
+    assert visualizer.frame_nodes([], 0) == []
+    assert visualizer.frame_nodes(visualizer.build_frames([], 0.1), -1) == []
+
+
+def test_get_frame_at_time_uses_timeline(visualizer):
+    operations = [("append", [value], f"append {value}") for value in range(1, 6)]
+    frames = visualizer.build_frames(operations, 0.5)
+
+    assert visualizer.timeline == [0.5, 1.0, 1.5, 2.0, 2.5]
+    frame, progress, index = visualizer.get_frame_at_time(frames, 1.25)
+    assert (frame.label, progress, index) == ("append 3", 0.5, 2)
+    assert visualizer.get_frame_at_time(frames, 1.0)[2] == 1
+    assert visualizer.get_frame_at_time(frames, 10.0)[1:] == (1.0, 4)
+    assert visualizer.get_frame_at_time([], 1.0)[2] == -1
+
+
+def test_frame_start_time_seeks_to_operation(visualizer):
+    frames = visualizer.build_frames([("append", [value], "") for value in range(1, 4)], 0.5)
+
+    assert [visualizer.frame_start_time(index) for index in range(3)] == [0.0, 0.5, 1.0]
+    assert visualizer.get_frame_at_time(frames, visualizer.frame_start_time(2) + 0.001)[2] == 2
+
+
+def test_grid_layout_keeps_full_size_nodes_for_short_lists(visualizer):
+    grid = visualizer.grid_layout(8, 1000, 500)
+
+    assert grid.scale == 1.0
+    assert grid.per_row == 4
+    assert grid.position(0) == (360, 80)
+    assert grid.position(5)[1] == 80 + grid.spacing_y
+
+
+def test_grid_layout_shrinks_long_lists_to_fit(visualizer):
+    grid = visualizer.grid_layout(1_000_000, 1000, 500)
+
+    assert grid.scale < 0.01
+    assert grid.per_row * grid.rows >= 1_000_000
+    x, y = grid.position(999_999)
+    assert x <= 1000 - 80 and y <= 500 - 80 + 1e-6
+
+
+def test_viewport_zoom_keeps_point_under_cursor():
+    viewport = Viewport(max_zoom=100.0)
+    viewport.pan(40, -25)
+    world = viewport.to_world((600, 250))
+    viewport.zoom_at((600, 250), 3.0)
+
+    assert viewport.zoom == 3.0
+    assert viewport.to_world((600, 250)) == pytest.approx(world)
+    viewport.zoom_at((600, 250), 1000.0)
+    assert viewport.zoom == 100.0
+    viewport.reset()
+    assert viewport.to_screen((123.4, 56.7)) == (123, 56)
+
+
+def test_layout_nodes_culls_to_viewport(visualizer):
+    nodes = [NodeState(index, index) for index in range(100_000)]
+    grid = visualizer.grid_layout(len(nodes), 1000, 500)
+    viewport = Viewport(max_zoom=MAX_NODE_SCALE / grid.scale)
+    viewport.zoom_at((600, 250), 1 / grid.scale)
+    visuals = visualizer.layout_nodes(nodes, 1000, 500, viewport)
+    area = visualizer.node_area(1000, 500)
+
+    assert 0 < len(visuals) < 2000
+    assert [visual.index for visual in visuals] == sorted(visual.index for visual in visuals)
+    assert any(area.collidepoint(visual.position) for visual in visuals)
+    for visual in visuals:
+        assert visual.value == visual.index
+        if visual.col not in (0, grid.per_row - 1):
+            x, y = visual.position
+            assert -200 < x < 1200 and -200 < y < 700
+
+
+def test_layout_nodes_without_viewport_lays_out_everything(visualizer):
+    nodes = [NodeState(index, index) for index in range(50)]
+    assert [visual.index for visual in visualizer.layout_nodes(nodes, 1000, 500)] == list(range(50))
+    far_away = Viewport(offset_x=1e6)
+    assert visualizer.layout_nodes(nodes, 1000, 500, far_away) == []
+
+
+def test_animating_ids_by_phase(visualizer):
+    frames = visualizer.build_frames(random_operations(200), 0.1)
+    add = next(frame for frame in frames if frame.op_type == "add" and frame.fade_id is not None)
+    remove = next(frame for frame in frames if frame.op_type == "remove")
+
+    assert visualizer.animating_ids(add, 0.5) == {add.added_id, add.fade_id}
+    assert visualizer.animating_ids(add, 1.0) is None
+    assert visualizer.animating_ids(remove, 0.2) == {remove.removed_id}
+    assert visualizer.animating_ids(remove, 0.9) is None
+
+
+def one_pass_draw(visualizer, surface, frames, frame_index, progress, nodes, font):
+    """Draws a frame the way display() did before the background layer existed."""
+    frame = frames[frame_index]
+    surface.fill(DEFAULT_BG_COLOR)
+    visualizer.draw_panel(surface, frames, frame_index, font, font)
+    visuals = visualizer.layout_nodes(nodes, visualizer.width, visualizer.height, Viewport())
+    surface.set_clip(visualizer.node_area(visualizer.width, visualizer.height))
+    radius_map, visuals_by_id = visualizer.draw_nodes(surface, visuals, frame, progress, True, font, NODE_RADIUS)
+    visualizer.draw_links(surface, visuals, radius_map, frame, progress, 1.0)
+    visualizer.draw_cycle(surface, visuals_by_id, radius_map, frame, progress, 1.0)
+    surface.set_clip(None)
+
+
+@pytest.mark.parametrize("ll_type", ["singly", "doubly"])
+def test_background_plus_animated_matches_one_pass_draw(ll_type):
+    pygame.font.init()
+    font = pygame.font.Font(None, 24)
+    visualizer = LinkedListVisualizer(ll_type, [])
+    frames = visualizer.build_frames(random_operations(12), 0.1)
+    size = (visualizer.width, visualizer.height)
+    checked = 0
+
+    for frame_index, frame in enumerate(frames):
+        animating = visualizer.animating_ids(frame, 0.25)
+        if not animating:
+            continue
+        nodes = visualizer.frame_nodes(frames, frame_index, after=frame.op_type != "remove")
+        background = pygame.Surface(size)
+        scene = visualizer.draw_background(background, (), frames, frame_index, frame, 0.25, nodes, Viewport(),
+                                           animating, font, font)
+        layered = background.copy()
+        rects = visualizer.draw_animated(layered, scene, frame, 0.25, True, font)
+        # the next tick restores only the dirty rects from the background
+        for rect in rects:
+            layered.blit(background, rect, rect)
+        visualizer.draw_animated(layered, scene, frame, 0.5, True, font)
+
+        expected = pygame.Surface(size)
+        one_pass_draw(visualizer, expected, frames, frame_index, 0.5, list(nodes), font)
+        assert pygame.image.tobytes(layered, "RGB") == pygame.image.tobytes(expected, "RGB")
+        checked += 1
+
+    assert checked > 5
+
+
+@pytest.mark.skipif(visualizer_module.np is None, reason="numpy is not installed")
+def test_grid_positions_extend_cached_suffix(visualizer):
+    grid = visualizer.grid_layout(4, 1000, 500)
+    xs, ys = visualizer.grid_positions(grid)
+    assert len(xs) == 4
+    cached = visualizer.position_cache[1]
+
+    grid.count = 7
+    xs, ys = visualizer.grid_positions(grid)
+    assert visualizer.position_cache[1] is not cached
+    assert [(x, y) for x, y in zip(xs.tolist(), ys.tolist())] == [grid.position(index) for index in range(7)]
+    grid.count = 5
+    assert len(visualizer.grid_positions(grid)[0]) == 5
+    assert visualizer.position_cache[1] is not cached and len(visualizer.position_cache[1]) >= 8
+
+
+@pytest.mark.skipif(visualizer_module.np is None, reason="numpy is not installed")
+@pytest.mark.parametrize("count", [7, 40, 20_000])
+def test_layout_nodes_matches_python_fallback(visualizer, monkeypatch, count):
+    nodes = [NodeState(index, index) for index in range(count)]
+    grid = visualizer.grid_layout(count, 1000, 500)
+    viewport = Viewport(max_zoom=MAX_NODE_SCALE / grid.scale)
+    viewport.zoom_at((640, 260), 0.5 / grid.scale)
+    batched = visualizer.layout_nodes(nodes, 1000, 500, viewport)
+
+    monkeypatch.setattr(visualizer_module, "np", None)
+    assert visualizer.layout_nodes(nodes, 1000, 500, viewport) == batched
+
+
+@pytest.mark.parametrize("start, end, arrow_size", [
+    ((10, 40), (90, 40), 12),
+    ((90, 40), (10, 40), 12),
+    ((50, 5), (50, 70.5), 7.3),
+    ((50, 70), (50.25, 5.75), 4.6),
+    ((10, 10), (60, 45), 12),
+])
+def test_arrowhead_sprite_matches_polygon(visualizer, start, end, arrow_size):
+    sprited = pygame.Surface((100, 80))
+    drawn = pygame.Surface((100, 80))
+    visualizer.draw_arrowhead(sprited, start, end, (200, 220, 230), arrow_size)
+
+    length = math.hypot(start[0] - end[0], start[1] - end[1])
+    unit = ((start[0] - end[0]) / length, (start[1] - end[1]) / length)
+    pygame.draw.polygon(drawn, (200, 220, 230), visualizer.arrowhead_points(end, unit, arrow_size))
+    assert pygame.image.tobytes(sprited, "RGB") == pygame.image.tobytes(drawn, "RGB")
+
+
+def test_arrowhead_cache_evicts_least_recently_used(visualizer, monkeypatch):
+    monkeypatch.setattr(visualizer_module, "ARROWHEAD_CACHE_SIZE", 2)
+    color = (200, 220, 230)
+    first = visualizer.arrowhead_sprite((1, 0), 12, color, (0, 0))
+    visualizer.arrowhead_sprite((1, 0), 10, color, (0, 0))
+    assert visualizer.arrowhead_sprite((1, 0), 12, color, (0, 0)) is first
+
+    visualizer.arrowhead_sprite((1, 0), 8, color, (0, 0))
+    assert list(visualizer.arrowhead_cache) == [((1, 0), 12, color, (0, 0)), ((1, 0), 8, color, (0, 0))]
+    assert visualizer.arrowhead_sprite((1, 0), 12, color, (0, 0)) is first